@@ -15,7 +15,8 @@ object HardwareCameraEventStateProjection {
       case AuthSucceeded(user) => previousState.copy(auth = Some(user))
       case AuthFailed(_)       => previousState.copy(auth = None)
 
-      case Subscription(_) => previousState.copy(broadcasting = true)
+      case Subscription(_) if !previousState.broadcasting => previousState.copy(broadcasting = true, initialChunks = List.empty)
+      case Subscription(_) => previousState
       case BroadcastStopped() => previousState.copy(broadcasting = false, initialChunks = List.empty)
 
       case CameraListenerHeartbeatStarted() => previousState.copy(listenerHeartbeatsReceived = 0)
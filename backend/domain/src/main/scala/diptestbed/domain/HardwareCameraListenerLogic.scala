@@ -20,6 +20,7 @@ case class HardwareCameraListenerState[F[_], T](
   maxLifetime: Option[FiniteDuration],
   initCheckTimeout: FiniteDuration,
   initialized: Boolean = false,
+  joined: Boolean = false,
   ending: Boolean = false,
 )
 
@@ -30,6 +31,7 @@ object HardwareCameraListenerMessage {
   case class CheckInitialization() extends HardwareCameraListenerMessage
   case class ListenerCameraDropped(reason: String) extends HardwareCameraListenerMessage
   case class ListenerCameraChunk(bytes: Array[Byte]) extends HardwareCameraListenerMessage
+  case class ListenerCameraJoined(header: Array[Byte]) extends HardwareCameraListenerMessage
   case class ListenerCameraHeartbeat() extends HardwareCameraListenerMessage
 }
 
@@ -40,6 +42,7 @@ object HardwareCameraListenerEvent {
   case class CheckingInitialization() extends HardwareCameraListenerEvent
   case class CameraDropped(reason: String) extends HardwareCameraListenerEvent
   case class ReceivedCameraChunk(bytes: Array[Byte]) extends HardwareCameraListenerEvent
+  case class JoinedCamera(header: Array[Byte]) extends HardwareCameraListenerEvent
   case class ReceivedCameraHeartbeat() extends HardwareCameraListenerEvent
 }
 
@@ -54,10 +57,10 @@ object HardwareCameraListenerLogic {
       StartedLifecycle(),
       lastState,
       Some((List(
-        // Announce subscriber to camera
-        publish(lastState.hardwareId.cameraMetaTopic(), CameraSubscription()),
         // Subscribe to video stream
         send(lastState.pubSubMediator, subscriptionMessage(lastState.hardwareId.cameraBroacastTopic(), lastState.self)),
+        // Announce subscriber to camera
+        publish(lastState.hardwareId.cameraMetaTopic(), CameraSubscription()),
         // Check if any chunk received
         implicitly[Temporal[F]].sleep(lastState.initCheckTimeout) >>
           send(lastState.self, CheckInitialization())
@@ -83,6 +86,18 @@ object HardwareCameraListenerLogic {
       lastState.copy(ending = true),
       Some(lastState.fail(new Exception(s"Camera stream dropped, reason: ${reason}")))
     )))
+    case ListenerCameraJoined(header) => Right(NonEmptyList.of((
+      JoinedCamera(header),
+      lastState.copy(joined = true, initialized = lastState.initialized || header.nonEmpty),
+      // Start watching from the stream header, which a late subscriber has missed in the broadcast
+      Option.when(!lastState.ending && header.nonEmpty)(lastState.enqueue(header))
+    )))
+    // Chunks broadcast before joining are either part of the header or undecodable without it
+    case ListenerCameraChunk(bytes) if !lastState.joined => Right(NonEmptyList.of((
+      ReceivedCameraChunk(bytes),
+      lastState,
+      None
+    )))
     case ListenerCameraChunk(bytes) => Right(NonEmptyList.of((
       ReceivedCameraChunk(bytes),
       lastState.copy(initialized = true),
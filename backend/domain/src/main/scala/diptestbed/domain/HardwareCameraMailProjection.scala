@@ -3,7 +3,7 @@ package diptestbed.domain
 import cats.effect.Temporal
 import cats.implicits._
 import diptestbed.domain.HardwareCameraEvent._
-import diptestbed.domain.HardwareCameraListenerMessage.{ListenerCameraChunk, ListenerCameraDropped}
+import diptestbed.domain.HardwareCameraListenerMessage.{ListenerCameraChunk, ListenerCameraDropped, ListenerCameraJoined}
 import diptestbed.domain.HardwareCameraMessage._
 
 object HardwareCameraMailProjection {
@@ -31,11 +31,11 @@ object HardwareCameraMailProjection {
         publish(id.cameraBroacastTopic(), ListenerCameraDropped(reason))).sequence.void >> die)
       case Ended() => Some(state.hardwareIds.map(id =>
         publish(id.cameraBroacastTopic(), ListenerCameraDropped("Unknown end of camera stream"))).sequence.void)
-      case Subscription(_) =>
-//        val initialChunks = state.initialChunkArray()
-        Some(send(state.camera, CameraSubscription()))
-//        Some(send(state.camera, CameraSubscription()) >>
-//          send(inquirer, ListenerCameraChunk(initialChunks)))
+      case Subscription(inquirer) =>
+        // Camera keeps one stream for all subscribers, so a late one gets the cached stream header only to itself
+        val header = if (state.broadcasting) state.initialChunkArray() else Array.empty[Byte]
+        Some(send(state.camera, CameraSubscription()) >>
+          send(inquirer, ListenerCameraJoined(header)))
     }
   }
 }
@@ -19,4 +19,22 @@ class HardwareCameraStateSpec extends AnyFreeSpec with Matchers {
       assert(a == b)
     }
   }
+
+  "hardware camera state should keep stream header for late subscribers" in {
+    val state = HardwareCameraState.initial[String](
+      "self", "camera", "pubSubMediator", List.empty, HardwareListenerHeartbeatConfig.default())
+    val stale = Array(65.toByte)
+    val header = Array(66.toByte)
+    val project = HardwareCameraEventStateProjection.project[String] _
+
+    // First subscriber starts a new stream, leftovers of previous one are dropped
+    val started = project(state.copy(initialChunks = List(stale)), HardwareCameraEvent.Subscription("first"))
+    assert(started.broadcasting)
+    assert(started.initialChunks.isEmpty)
+
+    // Late subscriber joins the running stream, its header stays cached
+    val streaming = project(started, HardwareCameraEvent.ChunkReceived(header))
+    val joined = project(streaming, HardwareCameraEvent.Subscription("second"))
+    assert(joined.initialChunkArray().toList == header.toList)
+  }
 }
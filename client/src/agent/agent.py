@@ -17,6 +17,8 @@ from src.protocol.codec import CodecParseException
 
 LOGGER = log.timed_named_logger("agent")
 OUTGOING_LOGGER = log.timed_named_logger("outgoing_engine")
+# How often serial frame coalescing counters are reported
+COALESCER_REPORT_SECONDS = 10
 PI = TypeVar('PI')
 PO = TypeVar('PO')
 
@@ -43,12 +45,15 @@ class Agent(Generic[PI, PO], DIPRunnable):
         asyncio.create_task(self.socket_receive())
         asyncio.create_task(self.socket_transmit())
         asyncio.create_task(self.socket_end_on_death())
+        if config.coalescer is not None:
+            asyncio.create_task(self.report_coalescer())
 
         # Handle kill signals
-        def on_signal(signal: str, *args):
-            asyncio.create_task(self.config.engine.kill(GenericClientError(f"Signal '{signal}' received")))
-        signal.signal(signal.SIGINT, partial(on_signal, "SIGINT"))
-        signal.signal(signal.SIGTERM, partial(on_signal, "SIGTERM"))
+        if config.handle_signals:
+            def on_signal(signal: str, *args):
+                asyncio.create_task(self.config.engine.kill(GenericClientError(f"Signal '{signal}' received")))
+            signal.signal(signal.SIGINT, partial(on_signal, "SIGINT"))
+            signal.signal(signal.SIGTERM, partial(on_signal, "SIGTERM"))
 
         # Run engine until it dies
         return await self.config.engine.run()
@@ -58,17 +63,35 @@ class Agent(Generic[PI, PO], DIPRunnable):
         LOGGER.debug("Closing control server connection")
         await self.config.socket.disconnect()
 
+    async def report_coalescer(self):
+        """Periodically log coalescing counters, so that its budget can be tuned per board"""
+        coalescer = self.config.coalescer
+        outgoing_queue = self.config.engine.state.base.outgoing_message_queue
+        death = self.config.engine.state.base.death
+        reported = None
+        while not death.gracing:
+            metrics = coalescer.metrics()
+            if metrics != reported:
+                LOGGER.info(f"Agent outgoing usage: {metrics}, {outgoing_queue.metrics()}")
+                reported = metrics
+            await death.or_awaitable(asyncio.sleep(COALESCER_REPORT_SECONDS))
+
     async def socket_transmit(self):
         """Redirects agent queue messages into the socket"""
+        outgoing_queue = self.config.engine.state.base.outgoing_message_queue
+        coalescer = self.config.coalescer
         while self.config.socket.connected() and not self.config.engine.state.base.death.gracing:
             # Wait for new message
             death_or_outgoing_message = await self.config.engine.state.base.death.or_awaitable(
-                self.config.engine.state.base.outgoing_message_queue.get())
+                coalescer.get(outgoing_queue) if coalescer is not None else outgoing_queue.get())
 
             # Handle potential death (and stop transmitting)
             if isinstance(death_or_outgoing_message, Err):
                 LOGGER.debug(
                     f"Agent stopping transmit loop as death has occurred, reason: {death_or_outgoing_message.value}")
+                if coalescer is not None:
+                    LOGGER.debug(f"Agent coalescer usage: {coalescer.metrics()}")
+                LOGGER.debug(f"Agent outgoing queue usage: {outgoing_queue.metrics()}")
                 return
 
             # Send message
@@ -0,0 +1,93 @@
+"""Merging of consecutive serial monitor frames sent from agent"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+from src.domain.monitor_message import SerialMonitorMessageToClient
+from src.engine.engine_state import ManagedQueue
+
+
+@dataclass(frozen=True)
+class AgentCoalescerMetrics:
+    """Snapshot of serial frames taken from outgoing queue vs sent"""
+    frames_in: int
+    frames_out: int
+
+
+@dataclass
+class AgentCoalescer:
+    """Adaptive coalescer of SerialMonitorMessageToClient frames in outgoing queue
+
+    Frames already waiting in the queue are always merged (up to max_bytes).
+    When frames arrive in bursts (closer than max_delay to each other), the
+    coalescer additionally waits up to max_delay for more frames, sparse
+    frames are sent without any added latency. Frames taken from the queue
+    are kept for the next call if getting is cancelled.
+    """
+    max_bytes: int
+    max_delay: float
+    frames_in: int = 0
+    frames_out: int = 0
+    pending: Optional[Any] = None
+    last_frame_time: float = 0.0
+
+    def metrics(self) -> AgentCoalescerMetrics:
+        return AgentCoalescerMetrics(self.frames_in, self.frames_out)
+
+    async def next_message(self, queue: ManagedQueue) -> Any:
+        if self.pending is not None:
+            message, self.pending = self.pending, None
+            return message
+        return await queue.get()
+
+    async def get(self, queue: ManagedQueue) -> Any:
+        """Get next outgoing message, merging subsequent serial frames"""
+        message = await self.next_message(queue)
+        if not isinstance(message, SerialMonitorMessageToClient):
+            return message
+
+        # Detect bursts to decide whether waiting for more frames is worth it
+        now = time.monotonic()
+        is_burst = now - self.last_frame_time < self.max_delay
+        self.last_frame_time = now
+        deadline = now + self.max_delay if is_burst else now
+
+        # Merge subsequent frames while within budget
+        self.frames_in += 1
+        merged: Optional[bytearray] = None
+        size = len(message.content_bytes)
+        while size < self.max_bytes:
+            # Take waiting frame or wait for one until deadline
+            if self.pending is None and queue.queue.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self.pending = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                except asyncio.CancelledError:
+                    # Keep taken frames, they are counted again once taken from pending
+                    self.pending = message if merged is None else SerialMonitorMessageToClient(bytes(merged))
+                    self.frames_in -= 1
+                    raise
+            next_message = await self.next_message(queue)
+
+            # Keep non-mergeable or too large frames for later
+            if not isinstance(next_message, SerialMonitorMessageToClient) or \
+                    size + len(next_message.content_bytes) > self.max_bytes:
+                self.pending = next_message
+                break
+
+            # Merge frame
+            if merged is None:
+                merged = bytearray(message.content_bytes)
+            merged += next_message.content_bytes
+            size = len(merged)
+            self.frames_in += 1
+            self.last_frame_time = time.monotonic()
+
+        self.frames_out += 1
+        if merged is None:
+            return message
+        return SerialMonitorMessageToClient(bytes(merged))
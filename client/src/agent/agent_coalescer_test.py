@@ -0,0 +1,56 @@
+import asyncio
+import time
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from src.agent.agent_coalescer import AgentCoalescer, AgentCoalescerMetrics
+from src.domain.monitor_message import SerialMonitorMessageToClient, MonitorUnavailable
+from src.engine.engine_state import ManagedQueue
+
+
+class TestAgentCoalescer(IsolatedAsyncioTestCase):
+    """Test suite for outgoing serial frame coalescing"""
+
+    async def test_coalesce_waiting_frames(self):
+        """Check that queued serial frames are merged in order and within budget"""
+        queue = ManagedQueue.build()
+        for message in [
+            SerialMonitorMessageToClient(b"ab"),
+            SerialMonitorMessageToClient(b"cd"),
+            SerialMonitorMessageToClient(b"efg"),
+            MonitorUnavailable("Gone"),
+            SerialMonitorMessageToClient(b"h"),
+        ]:
+            await queue.put(message)
+        coalescer = AgentCoalescer(max_bytes=5, max_delay=0)
+
+        self.assertEqual(await coalescer.get(queue), SerialMonitorMessageToClient(b"abcd"))
+        self.assertEqual(await coalescer.get(queue), SerialMonitorMessageToClient(b"efg"))
+        self.assertEqual(await coalescer.get(queue), MonitorUnavailable("Gone"))
+        self.assertEqual(await coalescer.get(queue), SerialMonitorMessageToClient(b"h"))
+        self.assertEqual(coalescer.metrics(), AgentCoalescerMetrics(4, 3))
+
+    async def test_cancel_while_waiting(self):
+        """Check that frames taken before cancellation are returned by next get"""
+        queue = ManagedQueue.build()
+        coalescer = AgentCoalescer(max_bytes=16, max_delay=10)
+        # Previous frame was just sent, so the coalescer waits for a burst
+        coalescer.last_frame_time = time.monotonic()
+        await queue.put(SerialMonitorMessageToClient(b"ab"))
+        await queue.put(SerialMonitorMessageToClient(b"cd"))
+
+        # Wait for more burst frames after merging queued ones, then cancel
+        getter = asyncio.create_task(coalescer.get(queue))
+        await asyncio.sleep(0.01)
+        self.assertTrue(queue.queue.empty())
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+
+        await queue.put(SerialMonitorMessageToClient(b"ef"))
+        coalescer.max_delay = 0
+        self.assertEqual(await coalescer.get(queue), SerialMonitorMessageToClient(b"abcdef"))
+        self.assertEqual(coalescer.metrics(), AgentCoalescerMetrics(3, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
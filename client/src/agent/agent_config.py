@@ -1,7 +1,8 @@
 """Module for common functionality between agents"""
 
 from dataclasses import dataclass
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Optional
+from src.agent.agent_coalescer import AgentCoalescer
 from src.engine.engine import Engine
 from src.service.ws import SocketInterface
 
@@ -18,3 +19,6 @@ class AgentConfig(Generic[PI, PO]):
     """Common i.e. microcontroller-non-specific agent configuration options"""
     engine: Engine[PI, PO, S, E, X]
     socket: SocketInterface[PI, PO]
+    coalescer: Optional[AgentCoalescer] = None
+    # Embedded agents leave process signals to whoever runs them
+    handle_signals: bool = True
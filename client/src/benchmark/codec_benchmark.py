@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+"""Benchmark of encode/decode throughput & allocations of exported codecs
+
+Runs offline for every installed JSON backend and writes a JSON report with sorted keys,
+so reports of different releases can be diffed, e.g. `python -m src.benchmark.codec_benchmark report.json`.
+"""
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import List, Any, Callable, Tuple
+from uuid import UUID
+from result import Ok
+from src.domain import hardware_control_message, hardware_shared_message, monitor_message, hardware_video_message
+from src.domain.fancy_byte import FancyByte
+from src.domain.managed_uuid import ManagedUUID
+from src.domain.minos_chunks import TextChunk, SwitchChunk, IndexedButtonChunk
+from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
+from src.protocol import s11n_hybrid, s11n_json, s11n_binary, json_backend
+from src.protocol.codec import Codec
+from src.protocol.json_backend import JSONBackend, available_json_backends
+
+# Operations per peak memory measurement, which is slower due to tracing
+ALLOCATION_ITERATIONS = 100
+
+
+@dataclass
+class CodecCase:
+    """Codec with a sample message"""
+    name: str
+    codec: Codec
+    message: Any
+
+
+@dataclass
+class CodecResult:
+    name: str
+    json_backend: str
+    encoded_bytes: int
+    decode_ok: bool
+    encode_ops_per_second: float
+    decode_ops_per_second: float
+    encode_mib_per_second: float
+    decode_mib_per_second: float
+    encode_peak_bytes: int
+    decode_peak_bytes: int
+
+
+def minos_suite(packet_count: int) -> MinOSSuite:
+    """MinOS suite with a mix of text, switch and button packets, i.e. packet types the decoder supports"""
+    packets = []
+    for index in range(packet_count):
+        kind = index % 3
+        if kind == 0:
+            chunk = TextChunk(f"line {index}")
+        elif kind == 1:
+            chunk = SwitchChunk(FancyByte(index % 256))
+        else:
+            chunk = IndexedButtonChunk(index % 24)
+        packets.append(MinOSSuitePacket(chunk, index * 10, f"2022-01-01T00:00:{index % 60:02d}", kind != 0))
+    return MinOSSuite(packets, 1000, packet_count, 0, "2022-01-01T00:00:00")
+
+
+def codec_cases() -> List[CodecCase]:
+    software_id = ManagedUUID(UUID("96b838b2-282d-11ec-ba20-478e3959b3ad"))
+    cases = [
+        CodecCase("COMMON_INCOMING_MESSAGE_CODEC/UploadMessage",
+                  s11n_hybrid.COMMON_INCOMING_MESSAGE_CODEC, hardware_control_message.UploadMessage(software_id)),
+        CodecCase("COMMON_INCOMING_MESSAGE_CODEC/SerialMonitorRequestStop",
+                  s11n_hybrid.COMMON_INCOMING_MESSAGE_CODEC, hardware_control_message.SerialMonitorRequestStop()),
+        CodecCase("COMMON_OUTGOING_MESSAGE_CODEC/PingMessage",
+                  s11n_hybrid.COMMON_OUTGOING_MESSAGE_CODEC, hardware_shared_message.PingMessage()),
+        CodecCase("MONITOR_LISTENER_INCOMING_MESSAGE_CODEC/MonitorUnavailable",
+                  s11n_hybrid.MONITOR_LISTENER_INCOMING_MESSAGE_CODEC, monitor_message.MonitorUnavailable("busy")),
+        CodecCase("MONITOR_LISTENER_OUTGOING_MESSAGE_CODEC/AuthRequest",
+                  s11n_hybrid.MONITOR_LISTENER_OUTGOING_MESSAGE_CODEC,
+                  hardware_shared_message.AuthRequest("username", "password")),
+    ]
+    for size in [1, 64, 4096]:
+        cases.append(CodecCase(
+            f"COMMON_INCOMING_MESSAGE_CODEC/SerialMonitorMessageToAgent/{size}",
+            s11n_hybrid.COMMON_INCOMING_MESSAGE_CODEC,
+            hardware_control_message.SerialMonitorMessageToAgent(bytes(size))))
+        cases.append(CodecCase(
+            f"MONITOR_LISTENER_INCOMING_MESSAGE_CODEC/SerialMonitorMessageToClient/{size}",
+            s11n_hybrid.MONITOR_LISTENER_INCOMING_MESSAGE_CODEC,
+            monitor_message.SerialMonitorMessageToClient(bytes(size))))
+    for size in [4096, 65536]:
+        cases.append(CodecCase(
+            f"CAMERA_CHUNK_CODEC_BINARY/{size}",
+            s11n_binary.CAMERA_CHUNK_CODEC_BINARY,
+            hardware_video_message.CameraChunk(bytes(size))))
+    for packet_count in [10, 100, 1000]:
+        cases.append(CodecCase(
+            f"COMMON_MINOS_SUITE_CODEC_JSON/{packet_count}",
+            s11n_json.COMMON_MINOS_SUITE_CODEC_JSON,
+            minos_suite(packet_count)))
+    return cases
+
+
+def ops_per_second(operation: Callable[[], Any], min_seconds: float) -> float:
+    """Repeat operation in growing batches until enough time has passed"""
+    count = 0
+    batch = 1
+    start = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            operation()
+        count += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return count / elapsed
+        batch *= 2
+
+
+def peak_bytes(operation: Callable[[], Any]) -> int:
+    """Highest memory in use during a single operation, above what was in use before it"""
+    tracemalloc.start()
+    try:
+        highest = 0
+        for _ in range(ALLOCATION_ITERATIONS):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            highest = max(highest, peak - before)
+    finally:
+        tracemalloc.stop()
+    return highest
+
+
+def encoded_size(encoded: Any) -> int:
+    return len(encoded) if isinstance(encoded, bytes) else len(encoded.encode())
+
+
+def measure(case: CodecCase, min_seconds: float, backend: JSONBackend) -> CodecResult:
+    json_backend.JSON_BACKEND = backend
+    encode = case.codec.encoder.encode
+    decode = case.codec.decoder.decode
+    encoded = encode(case.message)
+    size = encoded_size(encoded)
+    encode_rate = ops_per_second(lambda: encode(case.message), min_seconds)
+    decode_rate = ops_per_second(lambda: decode(encoded), min_seconds)
+    return CodecResult(
+        name=case.name,
+        json_backend=backend.name,
+        encoded_bytes=size,
+        decode_ok=isinstance(decode(encoded), Ok),
+        encode_ops_per_second=round(encode_rate, 1),
+        decode_ops_per_second=round(decode_rate, 1),
+        encode_mib_per_second=round(encode_rate * size / 1024 / 1024, 3),
+        decode_mib_per_second=round(decode_rate * size / 1024 / 1024, 3),
+        encode_peak_bytes=peak_bytes(lambda: encode(case.message)),
+        decode_peak_bytes=peak_bytes(lambda: decode(encoded)))
+
+
+def report(results: List[CodecResult], min_seconds: float) -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "min_seconds": min_seconds,
+        "allocation_iterations": ALLOCATION_ITERATIONS,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def parse_args(argv: List[str]) -> Tuple[str, float]:
+    output_path = argv[1] if len(argv) > 1 else "codec_benchmark.json"
+    min_seconds = float(argv[2]) if len(argv) > 2 else 0.2
+    return output_path, min_seconds
+
+
+def main(argv: List[str]):
+    output_path, min_seconds = parse_args(argv)
+    results = []
+    for backend in available_json_backends().values():
+        for case in codec_cases():
+            result = measure(case, min_seconds, backend)
+            results.append(result)
+            print(
+                f"[{result.json_backend}] {result.name}: {result.encoded_bytes} bytes, "
+                f"encode {result.encode_ops_per_second:.0f} ops/second, "
+                f"decode {result.decode_ops_per_second:.0f} ops/second")
+    with open(output_path, "w") as f:
+        json.dump(report(results, min_seconds), f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Report written to {output_path}")
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Loopback benchmark of managed serial throughput and latency over a pty pair
+
+Run e.g. `python -m src.benchmark.managed_serial_benchmark`.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from typing import List, Tuple
+from result import Err
+from src.domain.existing_file_path import ExistingFilePath
+from src.service.managed_serial import ManagedSerial
+from src.service.managed_serial_config import ManagedSerialConfig
+
+
+def open_loopback(baudrate: int) -> Tuple[int, ManagedSerial]:
+    """Open pty pair, return master file descriptor and managed serial on slave"""
+    master, slave = os.openpty()
+    serial_result = ManagedSerial.build(
+        ExistingFilePath(os.ttyname(slave)),
+        ManagedSerialConfig(receive_size=4096, baudrate=baudrate, timeout=0.01))
+    os.close(slave)
+    if isinstance(serial_result, Err):
+        raise RuntimeError(serial_result.value.text())
+    return master, serial_result.value
+
+
+def write_fully(fd: int, content: bytes):
+    view = memoryview(content)
+    while len(view) > 0:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+async def measure_throughput(master: int, serial: ManagedSerial, total_size: int) -> float:
+    """Stream bytes from master into managed serial, return bytes per second"""
+    payload = bytes(range(256)) * 16
+    chunk_count = total_size // len(payload)
+
+    def produce():
+        for _ in range(chunk_count):
+            write_fully(master, payload)
+
+    start = time.perf_counter()
+    threading.Thread(target=produce, daemon=True).start()
+    received = 0
+    while received < chunk_count * len(payload):
+        read_result = await serial.read()
+        if isinstance(read_result, Err):
+            raise RuntimeError(read_result.value.text())
+        received += len(read_result.value)
+    return received / (time.perf_counter() - start)
+
+
+async def measure_latency(master: int, serial: ManagedSerial, rounds: int) -> List[float]:
+    """Write to serial, echo back from master, return round trip latencies"""
+    latencies = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await serial.write(b"x")
+        echoed = await asyncio.get_running_loop().run_in_executor(None, os.read, master, 1)
+        write_fully(master, echoed)
+        received = b""
+        while len(received) == 0:
+            received = (await serial.read()).value
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run(total_size: int, rounds: int):
+    master, serial = open_loopback(921600)
+    try:
+        throughput = await measure_throughput(master, serial, total_size)
+        print(f"ManagedSerial throughput: {total_size} bytes, {throughput / 1024:.0f} KiB/second")
+        latencies = sorted(await measure_latency(master, serial, rounds))
+        print(
+            f"ManagedSerial round trip: {rounds} rounds, "
+            f"median {latencies[len(latencies) // 2] * 1000:.3f} ms, "
+            f"max {latencies[-1] * 1000:.3f} ms")
+    finally:
+        await serial.close()
+        os.close(master)
+
+
+def main(argv: List[str]):
+    total_size = int(argv[1]) if len(argv) > 1 else 16 * 1024 * 1024
+    rounds = int(argv[2]) if len(argv) > 2 else 200
+    asyncio.run(run(total_size, rounds))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -1,8 +1,7 @@
 """Synchronization primitive for coroutine-safe process finishing"""
 import asyncio
-from asyncio import Task, Future
-from dataclasses import dataclass
-from random import randint
+from asyncio import Task, Future, AbstractEventLoop
+from dataclasses import dataclass, field
 from typing import TypeVar, Coroutine, Optional, Generic, Union
 from result import Result, Ok, Err
 
@@ -14,36 +13,73 @@ class Death(Generic[T]):
     """Coroutine-safe application death boolean"""
     gracing: bool = False
     reason: Optional[T] = None
+    # Shared future resolved once on grace, broadcasts death to all waiters
+    _future: Optional[Future] = field(default=None, repr=False, compare=False)
 
     def grace(self, reason: Optional[T] = None):
         self.gracing = True
         self.reason = reason
 
+        # Wake up all waiters, possibly from outside of the waiters' loop
+        future = self._future
+        if future is None or future.done():
+            return
+        loop: AbstractEventLoop = future.get_loop()
+        if loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            Death._resolve(future, self)
+        else:
+            loop.call_soon_threadsafe(Death._resolve, future, self)
+
+    @staticmethod
+    def _resolve(future: Future, death: 'Death'):
+        if not future.done():
+            future.set_result(death)
+
+    def _death_future(self) -> Future:
+        """Lazily create a shared death future in the running loop"""
+        loop = asyncio.get_running_loop()
+        future = self._future
+        if future is None or future.get_loop() is not loop:
+            future = loop.create_future()
+            if self.gracing:
+                future.set_result(self)
+            self._future = future
+        return future
+
     async def wait(self) -> 'Death':
-        while not self.gracing:
-            await asyncio.sleep(0.3)
-        return self
+        if self.gracing:
+            return self
+        return await asyncio.shield(self._death_future())
 
     async def or_task(self, content_task: Task) -> Result[T, 'Death']:
-        # Wait for any task to finish
-        self_task = asyncio.create_task(self.wait())
-        done_set, pending_set = await asyncio.wait(
-            [self_task, content_task],
-            loop=None,
+        # Handle already happened death
+        if self.gracing:
+            content_task.cancel()
+            return Err(self)
+
+        # Wait for either death or task to finish
+        death_future = self._death_future()
+        await asyncio.wait(
+            [death_future, content_task],
             return_when=asyncio.FIRST_COMPLETED
         )
 
-        # Cancel pending tasks
-        if len(pending_set) != 0:
-            pending_set.pop().cancel()
-
         # Return either this death or result
-        done_task = done_set.pop()
-        done = done_task.result()
-        if len(pending_set) != 0 or isinstance(done, Death):
+        if not content_task.done():
+            content_task.cancel()
             return Err(self)
-        else:
-            return Ok(done)
+        return Ok(content_task.result())
 
     async def or_awaitable(self, awaitable: Union[Coroutine, Future]) -> Result[T, 'Death']:
-        return await self.or_task(asyncio.create_task(awaitable))
+        # Handle already happened death without scheduling content
+        if self.gracing:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            return Err(self)
+        return await self.or_task(asyncio.ensure_future(awaitable))
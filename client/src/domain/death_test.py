@@ -28,6 +28,19 @@ class TestDeath(IsolatedAsyncioTestCase):
         death_result = await death_task
         self.assertEqual(death_result, Err(death))
 
+    async def test_death_wait(self):
+        """Test waiters are woken up by grace without polling delay"""
+        death = Death()
+        waiters = [asyncio.create_task(death.wait()) for _ in range(3)]
+        await asyncio.sleep(0)
+        death.grace()
+        done, pending = await asyncio.wait(waiters, timeout=0.05)
+        self.assertEqual(len(pending), 0)
+        self.assertEqual([task.result() for task in done], [death] * 3)
+
+        # Dead death does not run content
+        self.assertEqual(await death.or_awaitable(TestDeath.slow_integer_computation()), Err(death))
+
 
 if __name__ == '__main__':
     unittest.main()
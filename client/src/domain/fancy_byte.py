@@ -1,12 +1,49 @@
-import math
-from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 from result import Result, Err, Ok
 
+# Lookup tables for every possible byte value
+BITS_TABLE: Tuple[Tuple[bool, ...], ...] = tuple(
+    tuple(bool(n & (0x80 >> i)) for i in range(8)) for n in range(256))
+HEX_TABLE: Tuple[str, ...] = tuple(hex(n) for n in range(256))
+# MinOS display color i.e. 0bxxRRGGBB
+RGB_TABLE: Tuple[Tuple[int, int, int], ...] = tuple(((n >> 4) & 0b11, (n >> 2) & 0b11, n & 0b11) for n in range(256))
+
 
-@dataclass
 class FancyByte:
-    value: int
+    """Single byte with bit, hex and color views backed by lookup tables
+
+    Instances for valid byte values are interned i.e. FancyByte(n) is FancyByte(n),
+    so value is read-only.
+    """
+    __slots__ = ("_value",)
+    _value: int
+
+    def __new__(cls, value: int):
+        if cls is FancyByte and type(value) is int and 0 <= value < 256:
+            return INTERNED_BYTES[value]
+        return cls._build(value)
+
+    @classmethod
+    def _build(cls, value: int) -> 'FancyByte':
+        instance = object.__new__(cls)
+        instance._value = value
+        return instance
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FancyByte) and self._value == other._value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def __repr__(self) -> str:
+        return f"FancyByte(value={self._value!r})"
+
+    def __reduce__(self):
+        return FancyByte, (self._value,)
 
     @staticmethod
     def fromBytes(b: bytes) -> Result['FancyByte', str]:
@@ -21,7 +58,7 @@ class FancyByte:
     def fromInt(n: int) -> Result['FancyByte', str]:
         if n < 0:
             return Err("Byte too small")
-        elif n >= math.pow(2, 8):
+        elif n >= 256:
             return Err("Byte too large")
         return Ok(FancyByte(n))
 
@@ -30,29 +67,34 @@ class FancyByte:
         if len(xs) != 8:
             return Err("Byte must contain 8 bits")
         n = 0
-        for (i, bit) in enumerate(xs):
-            n = n + bit * pow(2, 7 - i)
+        for bit in xs:
+            n = n * 2 + bit
         return Ok(FancyByte(n))
 
     def toggle_bit(self, index: int) -> Result['FancyByte', str]:
         if index < 0 or index > 7:
             return Err("Bad bit index")
-        bits = self.to_binary_bits()
-        diff = pow(2, 7 - index)
-        if bits[index]:
-            return Ok(FancyByte(self.value - diff))
-        else:
-            return Ok(FancyByte(self.value + diff))
+        return Ok(FancyByte(self._value ^ (0x80 >> index)))
+
+    def bits(self) -> Tuple[bool, ...]:
+        """Bits from the most significant one, shared i.e. not to be modified"""
+        return BITS_TABLE[self._value]
+
+    def rgb(self) -> Tuple[int, int, int]:
+        """Two-bit red, green and blue components of a MinOS display color"""
+        return RGB_TABLE[self._value]
 
     def to_binary_bits(self) -> List[bool]:
-        str_bits_8 = bin(self.value)[2:].zfill(8)
-        return list(map(lambda x: x == "1", str_bits_8))
+        return list(BITS_TABLE[self._value])
 
     def to_hex_str(self) -> str:
-        return str(hex(self.value))
+        return HEX_TABLE[self._value]
 
     def to_char(self) -> str:
-        return chr(self.value)
+        return chr(self._value)
 
     def to_bytes(self) -> bytes:
-        return self.value.to_bytes(1, byteorder='big')
+        return self._value.to_bytes(1, byteorder='big')
+
+
+INTERNED_BYTES: Tuple[FancyByte, ...] = tuple(FancyByte._build(n) for n in range(256))
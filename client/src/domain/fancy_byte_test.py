@@ -46,5 +46,24 @@ class TestFancyByte(unittest.TestCase):
             FancyByte.fromInt(255)
         )
 
+    def test_interned_tables(self):
+        byte = FancyByte.fromInt(0b10100110).value
+        self.assertIs(byte, FancyByte(0b10100110))
+        self.assertEqual(byte.bits(), (True, False, True, False, False, True, True, False))
+        self.assertEqual(byte.rgb(), (2, 1, 2))
+        self.assertEqual(byte.to_hex_str(), "0xa6")
+        self.assertEqual(byte.toggle_bit(0), Ok(FancyByte(0b00100110)))
+        self.assertEqual(byte.toggle_bit(7), Ok(FancyByte(0b10100111)))
+        self.assertEqual(repr(FancyByte(300)), "FancyByte(value=300)")
+
+    def test_read_only(self):
+        """Check that shared interned bytes can't be changed"""
+        byte = FancyByte(7)
+        with self.assertRaises(AttributeError):
+            byte.value = 8
+        with self.assertRaises(AttributeError):
+            byte.other = 8
+        self.assertEqual(FancyByte(7).value, 7)
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,11 @@ class StartingVideoStream:
     config: VideoStreamConfig
 
 
+@dataclass(frozen=True)
+class JoiningVideoStream:
+    config: VideoStreamConfig
+
+
 @dataclass
 class StartedStream:
     stream: ManagedVideoStream
@@ -45,6 +50,7 @@ COMMON_ENGINE_EVENT = Union[
     LifecycleStarted,
     LifecycleEnded,
     StartingVideoStream,
+    JoiningVideoStream,
     StartedStream,
 ]
 
@@ -1,7 +1,8 @@
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import List, Tuple, Callable
 from result import Result, Err, Ok
 from src.domain.dip_client_error import DIPClientError, GenericClientError
-from src.domain.minos_chunks import ParsedChunk, LEDChunk, Chunk, TextChunk, DisplayChunk
+from src.domain.minos_chunks import ParsedChunk, LEDChunk, Chunk, TextChunk, DisplayChunk, MinOSChunkColumns
 
 
 class MinOSChunker:
@@ -47,23 +48,91 @@ class MinOSChunker:
     @staticmethod
     def decode_stream(stream: bytes) -> Tuple[List[Chunk], List[bytes], bytes]:
         """Parses as many chunks as possible in the stream and also returns the unfinished chunk"""
-        null_byte: bytes = (0).to_bytes(1, byteorder='big')
-        one_byte: bytes = (1).to_bytes(1, byteorder='big')
+        decoder = MinOSStreamDecoder()
+        chunks, garbage = decoder.feed(stream)
+        return chunks, garbage, decoder.leftover()
+
+
+@dataclass
+class MinOSStreamDecoder:
+    """Incremental MinOS stream decoder, which keeps the unfinished chunk between reads
+
+    Received bytes are appended to one buffer, which is scanned only once,
+    escaped null bytes are recognized during the scan. A chunk start found
+    inside an unfinished chunk discards the preceding bytes as garbage, as does
+    an unfinished chunk longer than max_frame_size.
+    """
+    max_frame_size: int = 4096
+    buffer: bytearray = field(default_factory=bytearray)
+    # Start of unfinished chunk and position from which scanning continues
+    cursor: int = 0
+    scan: int = 0
+    escaped: bool = False
 
-        end_index = None
+    def leftover(self) -> bytes:
+        return bytes(self.buffer[self.cursor:])
+
+    def feed(self, incoming: bytes) -> Tuple[List[Chunk], List[bytes]]:
+        """Decode chunks finished by incoming bytes, return them along with garbage"""
         chunks = []
+        garbage = self.decode_into(incoming, lambda chunk_type, content: chunks.append(Chunk(chunk_type, content)))
+        return chunks, garbage
+
+    def feed_columns(self, incoming: bytes) -> MinOSChunkColumns:
+        """Decode and parse chunks finished by incoming bytes into columns, without per-chunk objects"""
+        columns = MinOSChunkColumns()
+        columns.garbage = self.decode_into(incoming, columns.append)
+        return columns
+
+    def decode_into(self, incoming: bytes, on_chunk: Callable[[int, bytes], None]) -> List[bytes]:
+        """Pass type and content of chunks finished by incoming bytes to on_chunk, return garbage"""
+        buffer = self.buffer
+        buffer += incoming
+        size = len(buffer)
+        view = memoryview(buffer)
         garbage = []
-        leftover = stream
-        while ((end_index is None) or (end_index != -1)):
-            is_init = end_index is None
-            end_index = leftover.find(null_byte + one_byte)
-            if is_init or end_index == -1:
-                continue
-            chunk_bytes = leftover[0:(end_index + 2)]
-            leftover = leftover[(end_index + 2):]
-            chunk_result = MinOSChunker.decode(chunk_bytes)
-            if isinstance(chunk_result, Ok):
-                chunks.append(chunk_result.value)
+        cursor, scan, escaped = self.cursor, self.scan, self.escaped
+        while True:
+            index = buffer.find(b"\x00", scan)
+            if index == -1 or index + 1 == size:
+                # Wait for more bytes
+                scan = size if index == -1 else index
+                break
+            marker = buffer[index + 1]
+            if marker == 0:
+                # Escaped null byte
+                escaped = True
+                scan = index + 2
+            elif marker == 1:
+                # Chunk end
+                end = index + 2
+                if index - cursor >= 2 and buffer[cursor] == 0 and buffer[cursor + 1] > 1:
+                    content = bytes(view[cursor + 2:index])
+                    if escaped:
+                        content = content.replace(b"\x00\x00", b"\x00")
+                    on_chunk(buffer[cursor + 1], content)
+                else:
+                    garbage.append(bytes(view[cursor:end]))
+                cursor = scan = end
+                escaped = False
+            elif index == cursor:
+                # Chunk start
+                scan = index + 2
             else:
-                garbage.append(chunk_bytes)
-        return chunks, garbage, leftover
\ No newline at end of file
+                # Chunk start before previous chunk has ended
+                garbage.append(bytes(view[cursor:index]))
+                cursor = index
+                scan = index + 2
+                escaped = False
+
+        # Give up on unfinished chunk, if it's too large
+        if scan - cursor > self.max_frame_size:
+            garbage.append(bytes(view[cursor:scan]))
+            cursor = scan
+            escaped = False
+
+        # Forget consumed bytes
+        view.release()
+        del buffer[:cursor]
+        self.cursor, self.scan, self.escaped = 0, scan - cursor, escaped
+        return garbage
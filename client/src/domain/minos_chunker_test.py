@@ -1,7 +1,7 @@
 import unittest
 
 from result import Ok
-from src.domain.minos_chunker import Chunk, MinOSChunker
+from src.domain.minos_chunker import Chunk, MinOSChunker, MinOSStreamDecoder
 
 
 class TestMinOSChunker(unittest.TestCase):
@@ -28,6 +28,28 @@ class TestMinOSChunker(unittest.TestCase):
         self.assertEqual(chunks, [chunk1, chunk2, chunk3, chunk4])
         self.assertEqual(leftover, encoded3[0:-5])
 
+    def test_incremental_stream_parser(self):
+        """Check that byte-by-byte reads decode the same chunks, including escaped chunk ends"""
+        chunks = [Chunk(3, b'potat1'), Chunk(4, b'\x00\x01\x00'), Chunk(6, b''), Chunk(5, b'\x00')]
+        stream = b'junk' + b''.join(MinOSChunker.encode(chunk) for chunk in chunks) + b'\x00\x05pot'
+        decoder = MinOSStreamDecoder()
+        decoded = []
+        garbage = []
+        for index in range(len(stream)):
+            new_chunks, new_garbage = decoder.feed(stream[index:index + 1])
+            decoded.extend(new_chunks)
+            garbage.extend(new_garbage)
+        self.assertEqual(decoded, chunks)
+        self.assertEqual(garbage, [b'junk'])
+        self.assertEqual(decoder.leftover(), b'\x00\x05pot')
+
+    def test_oversized_stream_garbage(self):
+        """Check that unfinished chunks can't grow beyond the frame limit"""
+        decoder = MinOSStreamDecoder(max_frame_size=8)
+        self.assertEqual(decoder.feed(b'\x00\x05' + b'x' * 10), ([], [b'\x00\x05' + b'x' * 10]))
+        self.assertEqual(decoder.feed(MinOSChunker.encode(Chunk(5, b'ok'))), ([Chunk(5, b'ok')], []))
+        self.assertEqual(decoder.leftover(), b'')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterator, List, Union
 from result import Result, Err, Ok
 from src.domain.dip_client_error import DIPClientError, GenericClientError
-from src.domain.fancy_byte import FancyByte
+from src.domain.fancy_byte import FancyByte, RGB_TABLE
 
 
 @dataclass
@@ -37,6 +39,9 @@ class LEDChunk(ParsedChunk):
     def type_text() -> str:
         return "led"
 
+    def to_chunk(self) -> Chunk:
+        return Chunk(self.type(), self.fancy_byte.to_bytes())
+
     @staticmethod
     def from_chunk(chunk: Chunk) -> Result['LEDChunk', DIPClientError]:
         if chunk.type != LEDChunk.type():
@@ -127,6 +132,9 @@ class DisplayChunk(ParsedChunk):
     def type_text() -> str:
         return "display"
 
+    def to_chunk(self) -> Chunk:
+        return Chunk(self.type(), bytes((self.pixel_index,)) + self.fancy_byte.to_bytes())
+
     @staticmethod
     def from_chunk(chunk: Chunk) -> Result['DisplayChunk', DIPClientError]:
         if chunk.type != DisplayChunk.type():
@@ -142,13 +150,74 @@ class DisplayChunk(ParsedChunk):
         return Ok(DisplayChunk(pixel_index_byte_result.value.value, fancy_byte_result.value))
 
     def r(self):
-        bits = self.fancy_byte.to_binary_bits()
-        return bits[2] * pow(2, 1) + bits[3] * pow(2, 0)
+        return self.fancy_byte.rgb()[0]
 
     def g(self):
-        bits = self.fancy_byte.to_binary_bits()
-        return bits[4] * pow(2, 1) + bits[5] * pow(2, 0)
+        return self.fancy_byte.rgb()[1]
 
     def b(self):
-        bits = self.fancy_byte.to_binary_bits()
-        return bits[6] * pow(2, 1) + bits[7] * pow(2, 0)
+        return self.fancy_byte.rgb()[2]
+
+
+# Chunk types start from 2, so 0 marks a bad chunk in MinOSChunkColumns.order
+BAD_CHUNK_ORDER = 0
+
+
+@dataclass
+class MinOSChunkColumns:
+    """Received chunks parsed column-wise, i.e. one compact array per chunk field
+
+    Order within each column is kept, order across columns is kept by the
+    order column, which holds the type of every received chunk.
+    """
+    order: array = field(default_factory=lambda: array("B"))
+    pixel_index: array = field(default_factory=lambda: array("B"))
+    pixel_r: array = field(default_factory=lambda: array("B"))
+    pixel_g: array = field(default_factory=lambda: array("B"))
+    pixel_b: array = field(default_factory=lambda: array("B"))
+    leds: array = field(default_factory=lambda: array("B"))
+    texts: List[str] = field(default_factory=list)
+    bad_chunks: List[Chunk] = field(default_factory=list)
+    garbage: List[bytes] = field(default_factory=list)
+
+    def append(self, chunk_type: int, content: bytes):
+        """Parse chunk content into columns, same as ParsedChunk.from_chunk would"""
+        if chunk_type == DisplayChunk.type() and len(content) == 2:
+            r, g, b = RGB_TABLE[content[1]]
+            self.pixel_index.append(content[0])
+            self.pixel_r.append(r)
+            self.pixel_g.append(g)
+            self.pixel_b.append(b)
+        elif chunk_type == LEDChunk.type() and len(content) <= 1:
+            self.leds.append(content[0] if len(content) == 1 else 0)
+        elif chunk_type == TextChunk.type() and len(content) >= 1:
+            try:
+                self.texts.append(content[1:content[0] + 1].decode("utf-8"))
+            except UnicodeDecodeError:
+                self.bad_chunks.append(Chunk(chunk_type, content))
+                self.order.append(BAD_CHUNK_ORDER)
+                return
+        else:
+            self.bad_chunks.append(Chunk(chunk_type, content))
+            self.order.append(BAD_CHUNK_ORDER)
+            return
+        self.order.append(chunk_type)
+
+    def ordered(self, skip_display: bool = False) -> Iterator[Union[ParsedChunk, Chunk]]:
+        """Chunks in received order, parsed ones as ParsedChunk and bad ones as is"""
+        display, led, text, bad = 0, 0, 0, 0
+        for chunk_type in self.order:
+            if chunk_type == DisplayChunk.type():
+                if not skip_display:
+                    color = (self.pixel_r[display] << 4) | (self.pixel_g[display] << 2) | self.pixel_b[display]
+                    yield DisplayChunk(self.pixel_index[display], FancyByte(color))
+                display += 1
+            elif chunk_type == LEDChunk.type():
+                yield LEDChunk(FancyByte(self.leds[led]))
+                led += 1
+            elif chunk_type == TextChunk.type():
+                yield TextChunk(self.texts[text])
+                text += 1
+            else:
+                yield self.bad_chunks[bad]
+                bad += 1
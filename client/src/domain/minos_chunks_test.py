@@ -1,8 +1,9 @@
 import unittest
 
-from result import Ok
-from src.domain.minos_chunker import Chunk, MinOSChunker
-from src.domain.minos_chunks import TextChunk
+from result import Ok, Err
+from src.domain.fancy_byte import FancyByte
+from src.domain.minos_chunker import Chunk, MinOSChunker, MinOSStreamDecoder
+from src.domain.minos_chunks import TextChunk, DisplayChunk, LEDChunk
 
 
 class TestMinOSChunks(unittest.TestCase):
@@ -13,6 +14,39 @@ class TestMinOSChunks(unittest.TestCase):
 
         self.assertEqual(Ok(a), c)
 
+    def test_display_chunk(self):
+        """Check that display chunk colors are split into 2 bit r, g & b"""
+        display = DisplayChunk(7, FancyByte(0b00100111))
+        self.assertEqual(DisplayChunk.from_chunk(display.to_chunk()), Ok(display))
+        self.assertEqual((display.r(), display.g(), display.b()), (2, 1, 3))
+        self.assertIsInstance(DisplayChunk.from_chunk(Chunk(DisplayChunk.type(), b'\x01')), Err)
+
+    def test_chunk_columns(self):
+        """Check that columnar parsing agrees with per-chunk parsing and keeps received order"""
+        display = DisplayChunk(7, FancyByte(0b00100111))
+        chunks = [
+            display.to_chunk(),
+            Chunk(LEDChunk.type(), b'\x81'),
+            TextChunk("potat").to_chunk(),
+            Chunk(DisplayChunk.type(), b'\x00\x3f'),
+            Chunk(DisplayChunk.type(), b'\x01'),
+            Chunk(LEDChunk.type(), b''),
+        ]
+        stream = b''.join(MinOSChunker.encode(chunk) for chunk in chunks)
+        columns = MinOSStreamDecoder().feed_columns(stream)
+
+        self.assertEqual(list(columns.pixel_index), [7, 0])
+        self.assertEqual(list(columns.pixel_r), [2, 3])
+        self.assertEqual(list(columns.pixel_g), [1, 3])
+        self.assertEqual(list(columns.pixel_b), [3, 3])
+        self.assertEqual(list(columns.leds), [0x81, 0])
+        self.assertEqual(columns.texts, ["potat"])
+        self.assertEqual(columns.bad_chunks, [chunks[4]])
+        expected = [
+            MinOSChunker.parse_chunk(chunk).value if i != 4 else chunk for i, chunk in enumerate(chunks)]
+        self.assertEqual(list(columns.ordered()), expected)
+        self.assertEqual(list(columns.ordered(skip_display=True)), expected[1:3] + expected[4:])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,7 +3,7 @@ from typing import Any, Callable
 
 from src.domain.dip_client_error import DIPClientError
 from src.domain.fancy_byte import FancyByte
-from src.domain.minos_chunks import Chunk, ParsedChunk
+from src.domain.minos_chunks import Chunk, ParsedChunk, MinOSChunkColumns
 from src.domain.noisy_event import NoisyEvent
 from src.util.sh import LOGGER
 
@@ -62,6 +62,11 @@ class GoodChunkReceived(MinOSMonitorEvent):
     parsed_chunk: ParsedChunk
 
 
+@dataclass(frozen=True)
+class DisplayChunksReceived(MinOSMonitorEvent):
+    columns: MinOSChunkColumns
+
+
 @dataclass(frozen=True)
 class SendingParsedChunk(MinOSMonitorEvent):
     parsed_chunk: ParsedChunk
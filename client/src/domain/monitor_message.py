@@ -1,8 +1,8 @@
 """Module containing messages sent in monitor connections"""
-from typing import Union, Any, Callable, List
+from typing import Union, Any, Callable
 from dataclasses import dataclass
 from src.domain.hardware_shared_message import AuthRequest, AuthResult
-from src.domain.minos_chunks import Chunk, ParsedChunk
+from src.domain.minos_chunks import ParsedChunk, MinOSChunkColumns
 from src.domain.noisy_message import NoisyMessage
 from src.util.sh import LOGGER
 
@@ -59,8 +59,7 @@ class ButtonPress(MonitorMessage):
 
 @dataclass(frozen=True)
 class ReceiveChunks(MonitorMessage):
-    chunks: List[Chunk]
-    garbage: List[bytes]
+    columns: MinOSChunkColumns
     leftover: bytes
 
 
@@ -1,9 +1,9 @@
 """Generic board engine client functionality."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, TypeVar, Optional
 from result import Result
 from src.domain.dip_client_error import DIPClientError
-from src.engine.engine import Engine
+from src.engine.engine import Engine, EngineDispatcher
 from src.engine.board.engine_common_state import EngineCommonState
 from src.domain.hardware_control_event import COMMON_ENGINE_EVENT, log_event
 from src.engine.engine_auth import EngineAuth
@@ -31,6 +31,12 @@ class EngineCommon(Engine[PI, PO, S, E, X]):
     engine_ping: EnginePing
     engine_serial_monitor: EngineSerialMonitor
     engine_auth: EngineAuth
+    dispatcher: EngineDispatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.dispatcher = EngineDispatcher.of(
+            [self.engine_lifecycle, self.engine_upload, self.engine_serial_monitor, self.engine_auth],
+            [self.engine_lifecycle, self.engine_upload, self.engine_ping, self.engine_serial_monitor, self.engine_auth])
 
     async def start(self):
         await self.state.base.incoming_message_queue.put(InternalStartLifecycle())
@@ -49,24 +55,12 @@ class EngineCommon(Engine[PI, PO, S, E, X]):
         previous_state: EngineCommonState,
         message: COMMON_INCOMING_MESSAGE
     ) -> Result[List[COMMON_ENGINE_EVENT], DIPClientError]:
-        return self.multi_message_project([
-            self.engine_lifecycle.handle_message,
-            self.engine_upload.handle_message,
-            self.engine_serial_monitor.handle_message,
-            self.engine_auth.handle_message
-        ], previous_state, message)
+        return self.dispatcher.message_project(previous_state, message)
 
     def state_project(self, previous_state: EngineCommonState, event: COMMON_ENGINE_EVENT) -> S:
         monitored_state = self.engine_serial_monitor.state_project(previous_state, event)
         return monitored_state
 
     async def effect_project(self, previous_state: EngineCommonState, event: COMMON_ENGINE_EVENT):
-        projections = [
-            self.engine_lifecycle.effect_project,
-            self.engine_upload.effect_project,
-            self.engine_ping.effect_project,
-            self.engine_serial_monitor.effect_project,
-            self.engine_auth.effect_project
-        ]
-        return await Engine.multi_effect_project(projections, previous_state, event)
+        return await self.dispatcher.effect_project(previous_state, event)
 
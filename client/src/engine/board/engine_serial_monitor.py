@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 """Engine which reacts to server commands and supervises microcontroller"""
-import asyncio
 import dataclasses
+import time
 from dataclasses import dataclass
-from typing import TypeVar, List, Optional
+from typing import TypeVar, List, Optional, ClassVar, Tuple
 from result import Result, Err, Ok
 from src.domain.death import Death
 from src.domain.dip_client_error import DIPClientError, GenericClientError
@@ -17,7 +17,7 @@ from src.domain.hardware_control_event import COMMON_ENGINE_EVENT, StartSerialMo
     SerialMonitorAboutToStart, SerialMonitorAlreadyConfigured, MonitorDied, LifecycleEnded, UploadingBoardSoftware
 from src.engine.engine_state import EngineState, EngineBase
 from src.service.managed_serial import ManagedSerial
-from src.service.managed_serial_config import ManagedSerialConfig
+from src.service.managed_serial_config import ManagedSerialConfig, ManagedSerialStreamConfig
 from src.util import log
 
 
@@ -42,6 +42,16 @@ class EngineSerialMonitorState:
 @dataclass
 class EngineSerialMonitor:
     """Software upload related effects projected by engine"""
+    HANDLED_MESSAGES: ClassVar[Tuple[type, ...]] = (
+        SerialMonitorRequest, InternalSerialMonitorStarting, InternalStartedSerialMonitor,
+        InternalSerialMonitorStartFailure, InternalReceivedSerialBytes, SerialMonitorMessageToAgent,
+        SerialMonitorRequestStop, InternalSerialMonitorStopped, InternalSerialMonitorDied)
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (
+        SerialMonitorAlreadyConfigured, SerialMonitorAboutToStart, StartSerialMonitor, SerialMonitorStartFailure,
+        SerialMonitorStartSuccess, ReceivedSerialBytes, SendingBoardBytes, StoppingSerialMonitor, MonitorDied,
+        LifecycleEnded, UploadingBoardSoftware)
+
+    stream_config: Optional[ManagedSerialStreamConfig] = None
 
     async def connect(
         self,
@@ -70,20 +80,17 @@ class EngineSerialMonitor:
         previous_state: EngineSerialMonitorState,
         active_serial: ManagedSerial
     ):
+        if self.stream_config is not None:
+            return await self.stream_until_death(previous_state, active_serial, self.stream_config)
+
         in_queue = previous_state.base.incoming_message_queue
         engine_death = previous_state.base.death
         serial_death = previous_state.serial_death
         while not engine_death.gracing and not serial_death.gracing:
-            # Wait for new messages
-            death_or_death_or_timeout = await engine_death.or_awaitable(
-                serial_death.or_awaitable(asyncio.sleep(active_serial.config.timeout)))
-
-            # Handle potential death (and stop receiving)
-            if isinstance(death_or_death_or_timeout, Err) or isinstance(death_or_death_or_timeout.value, Err):
-                return
+            # Wait for new messages, read returns at latest after serial timeout
+            received_bytes_result = await self.read(active_serial)
 
             # Handle serial read failure (and stop receiving)
-            received_bytes_result = await self.read(active_serial)
             if isinstance(received_bytes_result, Err):
                 await in_queue.put(StoppingSerialMonitor(received_bytes_result.value))
                 return
@@ -93,6 +100,49 @@ class EngineSerialMonitor:
             if received_bytes is not None and len(received_bytes) > 0:
                 await in_queue.put(InternalReceivedSerialBytes(received_bytes_result.value))
 
+    async def stream_until_death(
+        self,
+        previous_state: EngineSerialMonitorState,
+        active_serial: ManagedSerial,
+        stream_config: ManagedSerialStreamConfig
+    ):
+        """Forward serial bytes directly to client in batches, bypassing engine events"""
+        in_queue = previous_state.base.incoming_message_queue
+        out_queue = previous_state.base.outgoing_message_queue
+        engine_death = previous_state.base.death
+        serial_death = previous_state.serial_death
+        batch = bytearray()
+        batch_started = 0.0
+        while not engine_death.gracing and not serial_death.gracing:
+            # Wait for new bytes, read returns at latest after serial timeout
+            received_bytes_result = await self.read(active_serial)
+
+            # Handle serial read failure (and stop receiving)
+            if isinstance(received_bytes_result, Err):
+                if len(batch) > 0:
+                    await out_queue.put(SerialMonitorMessageToClient(bytes(batch)))
+                await in_queue.put(StoppingSerialMonitor(received_bytes_result.value))
+                return
+
+            # Collect bytes into batch
+            received_bytes = received_bytes_result.value
+            if received_bytes is not None and len(received_bytes) > 0:
+                if len(batch) == 0:
+                    batch_started = time.monotonic()
+                batch += received_bytes
+
+            # Send batch when it is large or old enough
+            if len(batch) > 0 and (
+                len(batch) >= stream_config.max_bytes or
+                time.monotonic() - batch_started >= stream_config.max_delay
+            ):
+                await out_queue.put(SerialMonitorMessageToClient(bytes(batch)))
+                batch.clear()
+
+        # Don't lose bytes of an unfinished batch on death
+        if len(batch) > 0:
+            await out_queue.put(SerialMonitorMessageToClient(bytes(batch)))
+
     @staticmethod
     def handle_message(
         previous_state: EngineSerialMonitorState,
@@ -0,0 +1,69 @@
+import unittest
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import IsolatedAsyncioTestCase
+from result import Ok, Err, Result
+from src.domain.death import Death
+from src.domain.dip_client_error import GenericClientError, DIPClientError
+from src.domain.hardware_control_event import StoppingSerialMonitor
+from src.domain.monitor_message import SerialMonitorMessageToClient
+from src.engine.board.engine_serial_monitor import EngineSerialMonitor
+from src.engine.engine_state import EngineBase
+from src.service.managed_serial import ManagedSerial
+from src.service.managed_serial_config import ManagedSerialConfig, ManagedSerialStreamConfig
+
+
+@dataclass
+class TestSerialMonitorState:
+    base: EngineBase
+    serial_death: Death
+
+
+@dataclass
+class ScriptedSerialMonitor(EngineSerialMonitor):
+    reads: List[Result[bytes, DIPClientError]] = field(default_factory=list)
+    # Death to grace once scripted reads run out
+    death: Optional[Death] = None
+
+    async def read(self, active_serial: ManagedSerial) -> Result[bytes, DIPClientError]:
+        read = self.reads.pop(0)
+        if not self.reads and self.death is not None:
+            self.death.grace()
+        return read
+
+
+class TestEngineSerialMonitor(IsolatedAsyncioTestCase):
+    """Test suite for serial monitor streaming"""
+
+    async def test_stream_batching(self):
+        """Check that streamed bytes are batched by size and flushed on failure"""
+        base = await EngineBase.build()
+        state = TestSerialMonitorState(base, Death())
+        error = GenericClientError("Unplugged")
+        monitor = ScriptedSerialMonitor(
+            ManagedSerialStreamConfig(max_bytes=4, max_delay=60),
+            [Ok(b"ab"), Ok(b""), Ok(b"cd"), Ok(b"e"), Err(error)])
+
+        await monitor.ping_until_death(state, ManagedSerial(ManagedSerialConfig.empty()))
+
+        outgoing = [base.outgoing_message_queue.queue.get_nowait() for _ in range(2)]
+        self.assertEqual(outgoing, [SerialMonitorMessageToClient(b"abcd"), SerialMonitorMessageToClient(b"e")])
+        self.assertEqual(base.incoming_message_queue.queue.get_nowait(), StoppingSerialMonitor(error))
+        self.assertTrue(base.outgoing_message_queue.queue.empty())
+
+    async def test_stream_death_flush(self):
+        """Check that an unfinished batch is sent when serial dies mid-batch"""
+        base = await EngineBase.build()
+        state = TestSerialMonitorState(base, Death())
+        monitor = ScriptedSerialMonitor(
+            ManagedSerialStreamConfig(max_bytes=4, max_delay=60), [Ok(b"ab"), Ok(b"c")], state.serial_death)
+
+        await monitor.ping_until_death(state, ManagedSerial(ManagedSerialConfig.empty()))
+
+        self.assertEqual(base.outgoing_message_queue.queue.get_nowait(), SerialMonitorMessageToClient(b"abc"))
+        self.assertTrue(base.outgoing_message_queue.queue.empty())
+        self.assertTrue(base.incoming_message_queue.queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
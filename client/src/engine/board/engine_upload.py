@@ -1,6 +1,6 @@
 """Upload engine functionality."""
 from dataclasses import dataclass
-from typing import Callable, Tuple, List, Awaitable, Optional
+from typing import Callable, Tuple, List, Awaitable, Optional, ClassVar
 from result import Result, Err, Ok
 from src.domain.dip_client_error import DIPClientError, GenericClientError
 from src.domain.hardware_control_message import COMMON_INCOMING_MESSAGE, UploadMessage, \
@@ -34,6 +34,13 @@ class EngineUploadState(EngineState):
 @dataclass
 class EngineUpload:
     """Software upload related effects projected by engine"""
+    HANDLED_MESSAGES: ClassVar[Tuple[type, ...]] = (
+        UploadMessage, InternalSucceededSoftwareDownload, InternalFailedSoftwareDownload,
+        InternalUploadBoardSoftware, InternalSucceededSoftwareUpload, InternalFailedSoftwareUpload)
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (
+        DownloadingBoardSoftware, BoardSoftwareDownloadSuccess, BoardSoftwareDownloadFailure,
+        UploadingBoardSoftware, BoardUploadSuccess, BoardUploadFailure)
+
     backend: BackendServiceInterface
 
     # Must be implemented by board
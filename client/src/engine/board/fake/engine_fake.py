@@ -1,3 +1,5 @@
+import asyncio
+import time
 from typing import Optional
 from result import Result, Ok
 from src.domain.death import Death
@@ -8,6 +10,7 @@ from dataclasses import dataclass
 from src.domain.dip_client_error import DIPClientError
 from src.engine.board.engine_common import EngineCommon
 from src.engine.board.engine_common_state import EngineCommonState
+from src.engine.board.fake.minos_simulator import MinOSSimulator
 from src.domain.hardware_control_event import COMMON_ENGINE_EVENT
 from src.domain.hardware_control_message import COMMON_INCOMING_MESSAGE, COMMON_OUTGOING_MESSAGE
 from src.engine.board.engine_serial_monitor import EngineSerialMonitor
@@ -54,15 +57,28 @@ class EngineFakeUpload(EngineUpload):
 class EngineFakeSerialMonitor(EngineSerialMonitor):
     time_since_read: float = 0
     fake_bytes: bytes = b'to_client'
+    # Simulated MinOS board instead of echoing written bytes once per second
+    simulator: Optional[MinOSSimulator] = None
 
     async def connect(
         self,
         device_path: ExistingFilePath,
         config: ManagedSerialConfig
     ) -> Result[ManagedSerial, DIPClientError]:
+        # Every monitor connection gets a freshly booted board
+        if self.simulator is not None:
+            self.simulator = MinOSSimulator(self.simulator.config)
         return Ok(ManagedSerial(config, None))
 
     async def read(self, active_serial: ManagedSerial) -> Result[bytes, DIPClientError]:
+        # Engine reads again right away, so each read waits once, like a serial read would
+        timeout = active_serial.config.timeout
+        if self.simulator is not None:
+            # Simulated board bytes are returned as soon as they're due, at latest after read timeout
+            await asyncio.sleep(min(timeout, self.simulator.until_next_read(time.monotonic(), active_serial.config)))
+            return Ok(self.simulator.read(time.monotonic(), active_serial.config))
+        # Simulate serial read timeout
+        await asyncio.sleep(timeout)
         if self.time_since_read > 1:
             self.time_since_read = 0
             return Ok(self.fake_bytes)
@@ -75,6 +91,9 @@ class EngineFakeSerialMonitor(EngineSerialMonitor):
         previous_state: EngineFakeState,
         value: bytes
     ) -> Result[type(None), DIPClientError]:
+        if self.simulator is not None:
+            self.simulator.write(value)
+            return Ok()
         # Hack, a command & event should be issued instead
         self.fake_bytes = value
         return Ok()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from src.domain.death import Death
 from src.domain.existing_file_path import ExistingFilePath
 from src.domain.managed_uuid import ManagedUUID
@@ -6,10 +7,15 @@ from src.domain.positive_integer import PositiveInteger
 from src.engine.board.fake.engine_fake import EngineFakeBoardState, EngineFakeState, EngineFake, EngineFakeUpload, \
     EngineFakeSerialMonitor
 from src.engine.board.engine_common_test import TestCommonEngine
+from src.engine.board.fake.minos_simulator import MinOSSimulator, MinOSSimulatorConfig
+from src.domain.minos_chunker import MinOSChunker
+from src.domain.minos_chunks import TextChunk
 from src.engine.engine_lifecycle import EngineLifecycle
 from src.engine.engine_ping import EnginePing
 from src.engine.engine_state import ManagedQueue, EngineBase
 from src.service.backend import BackendServiceInterface
+from src.service.managed_serial import ManagedSerial
+from src.service.managed_serial_config import ManagedSerialConfig
 from src.util.sh import src_relative_path
 from unittest import IsolatedAsyncioTestCase
 
@@ -48,5 +54,24 @@ class TestFake(IsolatedAsyncioTestCase):
 
         await TestCommonEngine.engine_scenario(self, board_state, build_engine_state, build_engine)
 
+    async def test_read_waits_once(self):
+        """Check that each fake read waits at most one serial timeout, simulated board only until bytes are due"""
+        serial = ManagedSerial(ManagedSerialConfig.empty(), None)
+        waits = []
+
+        async def sleep(seconds):
+            waits.append(seconds)
+        with patch("src.engine.board.fake.engine_fake.asyncio.sleep", sleep):
+            await EngineFakeSerialMonitor().read(serial)
+            self.assertEqual(waits, [serial.config.timeout])
+
+            waits.clear()
+            monitor = EngineFakeSerialMonitor(simulator=MinOSSimulator(MinOSSimulatorConfig(display_rate=0)))
+            monitor.simulator.write(MinOSChunker.encode(TextChunk("hey").to_chunk()))
+            self.assertNotEqual((await monitor.read(serial)).value, b"")
+            await monitor.read(serial)
+            self.assertEqual(waits, [0, serial.config.timeout])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,101 @@
+"""Simulated MinOS board, which speaks the MinOS chunk protocol over the fake serial port"""
+from dataclasses import dataclass, field
+from typing import Optional
+from result import Result, Err, Ok
+from src.domain.dip_client_error import DIPClientError, GenericClientError
+from src.domain.fancy_byte import FancyByte
+from src.domain.minos_chunker import MinOSChunker, MinOSStreamDecoder
+from src.domain.minos_chunks import Chunk, DisplayChunk, LEDChunk, TextChunk, IndexedButtonChunk, SwitchChunk
+from src.engine.monitor.minos.minos_framebuffer import MINOS_MAX_PIXELS
+from src.monitor.monitor_input import SERIAL_BITS_PER_BYTE
+from src.service.managed_serial_config import ManagedSerialConfig
+
+# Encoded display chunk without escaped null bytes, i.e. start, type, pixel, color & end bytes
+DISPLAY_CHUNK_BYTES = 6
+# Display colors are packed as 0b00RRGGBB
+DISPLAY_COLORS = 64
+
+
+@dataclass(frozen=True)
+class MinOSSimulatorConfig:
+    """Configurations for simulated MinOS board, display rate is in pixel updates per second"""
+    display_rate: int = 64
+    pixels: int = 64
+
+    @staticmethod
+    def build(display_rate: int, pixels: int = 64) -> Result['MinOSSimulatorConfig', DIPClientError]:
+        if display_rate < 0:
+            return Err(GenericClientError("Simulated MinOS display rate can't be negative"))
+        if pixels <= 0 or pixels > MINOS_MAX_PIXELS:
+            return Err(GenericClientError(f"Simulated MinOS display must have 1 to {MINOS_MAX_PIXELS} pixels"))
+        return Ok(MinOSSimulatorConfig(display_rate, pixels))
+
+
+@dataclass
+class MinOSSimulator:
+    """MinOS board, which animates its display and reacts to input chunks
+
+    Buttons toggle LEDs & are reported as text, switches are mirrored on
+    LEDs, text is echoed back. Display pixels are cycled through colors at
+    the configured rate, but no faster than serial line rate allows.
+    """
+    config: MinOSSimulatorConfig = MinOSSimulatorConfig()
+    decoder: MinOSStreamDecoder = field(default_factory=MinOSStreamDecoder)
+    pending: bytearray = field(default_factory=bytearray)
+    leds: int = 0
+    started_at: Optional[float] = None
+    display_updates: int = 0
+    received_chunks: int = 0
+
+    def write(self, value: bytes):
+        """Receive bytes from monitor and queue responses to chunks in them"""
+        chunks, _ = self.decoder.feed(value)
+        for chunk in chunks:
+            self.received_chunks += 1
+            self.react(chunk)
+
+    def react(self, chunk: Chunk):
+        if chunk.type == IndexedButtonChunk.type() and len(chunk.content) == 1:
+            button_index = chunk.content[0]
+            self.leds ^= 0x80 >> (button_index % 8)
+            self.send(LEDChunk(FancyByte.fromInt(self.leds).value).to_chunk())
+            self.send(TextChunk(f"button {button_index}").to_chunk())
+        elif chunk.type == SwitchChunk.type() and len(chunk.content) == 1:
+            self.leds = chunk.content[0]
+            self.send(LEDChunk(FancyByte.fromInt(self.leds).value).to_chunk())
+        elif chunk.type == TextChunk.type():
+            text_result = TextChunk.from_chunk(chunk)
+            if isinstance(text_result, Ok):
+                self.send(text_result.value.to_chunk())
+
+    def send(self, chunk: Chunk):
+        self.pending += MinOSChunker.encode(chunk)
+
+    def display_rate(self, serial_config: ManagedSerialConfig) -> float:
+        line_rate = serial_config.baudrate / SERIAL_BITS_PER_BYTE / DISPLAY_CHUNK_BYTES
+        return min(self.config.display_rate, line_rate)
+
+    def until_next_read(self, now: float, serial_config: ManagedSerialConfig) -> float:
+        """Seconds until board sends something, i.e. how long a serial read would wait for bytes"""
+        if self.started_at is None or len(self.pending) > 0:
+            return 0
+        rate = self.display_rate(serial_config)
+        if rate <= 0:
+            return serial_config.timeout
+        return max(0.0, self.started_at + (self.display_updates + 1) / rate - now)
+
+    def read(self, now: float, serial_config: ManagedSerialConfig) -> bytes:
+        """Bytes sent by board until now, at most a serial read worth of them"""
+        if self.started_at is None:
+            self.started_at = now
+        due = int((now - self.started_at) * self.display_rate(serial_config)) - self.display_updates
+        pixels = self.config.pixels
+        while due > 0 and len(self.pending) < serial_config.receive_size:
+            pixel_index = self.display_updates % pixels
+            color = (self.display_updates // pixels + pixel_index) % DISPLAY_COLORS
+            self.send(DisplayChunk(pixel_index, FancyByte.fromInt(color).value).to_chunk())
+            self.display_updates += 1
+            due -= 1
+        received = bytes(self.pending[:serial_config.receive_size])
+        del self.pending[:serial_config.receive_size]
+        return received
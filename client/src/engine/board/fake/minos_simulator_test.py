@@ -0,0 +1,72 @@
+import unittest
+
+from result import Ok
+from src.domain.fancy_byte import FancyByte
+from src.domain.minos_chunker import MinOSChunker, MinOSStreamDecoder
+from src.domain.minos_chunks import IndexedButtonChunk, SwitchChunk, TextChunk, LEDChunk, DisplayChunk
+from src.engine.board.fake.minos_simulator import MinOSSimulator, MinOSSimulatorConfig
+from src.service.managed_serial_config import ManagedSerialConfig
+
+
+def parsed(output: bytes):
+    chunks, garbage = MinOSStreamDecoder().feed(output)
+    results = [MinOSChunker.parse_chunk(chunk) for chunk in chunks]
+    assert garbage == [] and all(isinstance(result, Ok) for result in results)
+    return [result.value for result in results]
+
+
+class TestMinOSSimulator(unittest.TestCase):
+    def test_react(self):
+        """Check that buttons toggle LEDs, switches are mirrored on LEDs and text is echoed"""
+        simulator = MinOSSimulator(MinOSSimulatorConfig(display_rate=0))
+        serial = ManagedSerialConfig.empty()
+        stimuli = [IndexedButtonChunk(1), IndexedButtonChunk(0), SwitchChunk(FancyByte(0b1010)), TextChunk("hey")]
+        simulator.write(b"".join(MinOSChunker.encode(stimulus.to_chunk()) for stimulus in stimuli))
+        self.assertEqual(simulator.received_chunks, 4)
+        self.assertEqual(parsed(simulator.read(0, serial)), [
+            LEDChunk(FancyByte(0b01000000)),
+            TextChunk("button 1"),
+            LEDChunk(FancyByte(0b11000000)),
+            TextChunk("button 0"),
+            LEDChunk(FancyByte(0b1010)),
+            TextChunk("hey"),
+        ])
+        self.assertEqual(simulator.read(10, serial), b"")
+
+    def test_until_next_read(self):
+        """Check that reads wait only until next display update or pending response"""
+        simulator = MinOSSimulator(MinOSSimulatorConfig(display_rate=4))
+        serial = ManagedSerialConfig.empty()
+        self.assertEqual(simulator.until_next_read(0, serial), 0)
+        simulator.read(0, serial)
+        self.assertAlmostEqual(simulator.until_next_read(0.1, serial), 0.15)
+        simulator.write(MinOSChunker.encode(TextChunk("hey").to_chunk()))
+        self.assertEqual(simulator.until_next_read(0.1, serial), 0)
+        simulator.read(0.1, serial)
+        self.assertEqual(simulator.until_next_read(0.3, serial), 0)
+        still = MinOSSimulator(MinOSSimulatorConfig(display_rate=0))
+        still.read(0, serial)
+        self.assertEqual(still.until_next_read(0, serial), serial.timeout)
+
+    def test_display_rate(self):
+        """Check that display updates are sent at configured rate, capped by line rate & read size"""
+        simulator = MinOSSimulator(MinOSSimulatorConfig(display_rate=100, pixels=64))
+        serial = ManagedSerialConfig.empty()
+        self.assertEqual(simulator.read(0, serial), b"")
+        updates = parsed(simulator.read(0.5, serial))
+        self.assertEqual(len(updates), 50)
+        self.assertEqual(updates[0], DisplayChunk(0, FancyByte(0)))
+        self.assertEqual(updates[-1], DisplayChunk(49, FancyByte(49)))
+
+        slow_serial = ManagedSerialConfig(receive_size=64, baudrate=600, timeout=0.01)
+        simulator = MinOSSimulator(MinOSSimulatorConfig(display_rate=1000))
+        self.assertEqual(simulator.display_rate(slow_serial), 10)
+        simulator.read(0, slow_serial)
+        reads = [simulator.read(100, slow_serial) for _ in range(1000)]
+        self.assertTrue(all(len(read) <= 64 for read in reads))
+        self.assertEqual(len(parsed(b"".join(reads))), 1000)
+        self.assertEqual(simulator.read(100, slow_serial), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 """Engine which reacts to server commands and supervises microcontroller"""
 import asyncio
-from dataclasses import dataclass
-from typing import TypeVar, Generic, List, Optional, Callable, Awaitable
+from dataclasses import dataclass, field
+from typing import TypeVar, Generic, List, Optional, Callable, Awaitable, Any, Dict, Tuple
 from result import Result, Err, Ok
 from src.agent.agent_error import AgentExecutionError
 from src.domain.dip_client_error import DIPClientError
@@ -16,6 +16,69 @@ PO = TypeVar('PO')
 S = TypeVar('S', bound=EngineState)
 E = TypeVar('E')
 X = TypeVar('X')
+MessageHandler = Callable[[Any, Any], Result[List[Any], DIPClientError]]
+EffectHandler = Callable[[Any, Any], Awaitable[None]]
+
+
+@dataclass
+class EngineDispatcher:
+    """Message and effect handlers registered by the types they are interested in
+
+    Handlers are resolved once per concrete message/event type (subclasses
+    included) and cached, so that only interested handlers are invoked.
+    Registration order is kept, i.e. events are produced and effects are
+    started in the same order as with a plain list of handlers.
+    """
+    message_registrations: List[Tuple[Tuple[type, ...], MessageHandler]] = field(default_factory=list)
+    effect_registrations: List[Tuple[Tuple[type, ...], EffectHandler]] = field(default_factory=list)
+    message_table: Dict[type, List[MessageHandler]] = field(default_factory=dict, repr=False)
+    effect_table: Dict[type, List[EffectHandler]] = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def of(message_engines: List[Any], effect_engines: List[Any]) -> 'EngineDispatcher':
+        """Register sub-engines by their HANDLED_MESSAGES and HANDLED_EVENTS"""
+        dispatcher = EngineDispatcher()
+        for engine in message_engines:
+            dispatcher.register_messages(engine.HANDLED_MESSAGES, engine.handle_message)
+        for engine in effect_engines:
+            dispatcher.register_effects(engine.HANDLED_EVENTS, engine.effect_project)
+        return dispatcher
+
+    def register_messages(self, message_types: Tuple[type, ...], handler: MessageHandler):
+        self.message_registrations.append((message_types, handler))
+        self.message_table.clear()
+
+    def register_effects(self, event_types: Tuple[type, ...], handler: EffectHandler):
+        self.effect_registrations.append((event_types, handler))
+        self.effect_table.clear()
+
+    def message_handlers(self, message_type: type) -> List[MessageHandler]:
+        handlers = self.message_table.get(message_type)
+        if handlers is None:
+            handlers = [
+                handler for (message_types, handler) in self.message_registrations
+                if issubclass(message_type, message_types)]
+            self.message_table[message_type] = handlers
+        return handlers
+
+    def effect_handlers(self, event_type: type) -> List[EffectHandler]:
+        handlers = self.effect_table.get(event_type)
+        if handlers is None:
+            handlers = [
+                handler for (event_types, handler) in self.effect_registrations
+                if issubclass(event_type, event_types)]
+            self.effect_table[event_type] = handlers
+        return handlers
+
+    def message_project(self, previous_state: Any, message: Any) -> Result[List[Any], DIPClientError]:
+        handlers = self.message_handlers(type(message))
+        if len(handlers) == 1:
+            return handlers[0](previous_state, message)
+        return Engine.multi_message_project(handlers, previous_state, message)
+
+    async def effect_project(self, previous_state: Any, event: Any):
+        for handler in self.effect_handlers(type(event)):
+            asyncio.create_task(handler(previous_state, event))
 
 
 @dataclass
@@ -58,9 +121,13 @@ class Engine(Generic[PI, PO, S, E, X]):
             if isinstance(death_or_incoming_event, Err):
                 return
 
-            # Handle incoming event
+            # Handle incoming event (along with other already queued events)
             event: E = death_or_incoming_event.value
-            await self.process_event(event)
+            batch_size = self.state.base.event_batch_size
+            if batch_size > 1:
+                await self.process_events([event] + self.state.base.event_queue.drain(batch_size - 1))
+            else:
+                await self.process_event(event)
 
     async def loop(self):
         """Keep listening to messages while alive and process them"""
@@ -121,6 +188,20 @@ class Engine(Generic[PI, PO, S, E, X]):
         # Execute side effects
         await self.effect_project(previous_state, event)
 
+    async def process_events(self, events: List[E]):
+        """Fold events through state projection in one pass, then execute side effects in order"""
+        # Calculate and store new state, remember state preceding each event
+        projected = []
+        for event in events:
+            await self.pre_process_event(self.state, event)
+            previous_state = self.state
+            self.state = self.state_project(previous_state, event)
+            projected.append((previous_state, event))
+
+        # Execute side effects, each seeing the same state as if processed one by one
+        for previous_state, event in projected:
+            await self.effect_project(previous_state, event)
+
     def pre_process_error(self, exception: Exception):
         pass
 
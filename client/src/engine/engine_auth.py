@@ -1,6 +1,6 @@
 """Engine auth functionality."""
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, ClassVar, Tuple
 from result import Result, Ok
 from src.domain.hardware_shared_event import StartingAuth, AuthSucceeded, AuthFailed
 from src.domain.hardware_shared_message import InternalStartLifecycle, AuthResult, AuthRequest, InternalEndLifecycle
@@ -16,6 +16,9 @@ class EngineAuthState:
 
 @dataclass
 class EngineAuth:
+    HANDLED_MESSAGES: ClassVar[Tuple[type, ...]] = (InternalStartLifecycle, AuthResult)
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (StartingAuth, AuthFailed)
+
     @staticmethod
     def handle_message(
         previous_state: EngineAuthState,
@@ -1,6 +1,6 @@
 """Engine lifecycle functionality."""
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, ClassVar, Tuple
 from result import Result, Ok
 from src.domain.hardware_shared_event import LifecycleStarted, LifecycleEnded
 from src.domain.hardware_shared_message import InternalStartLifecycle, InternalEndLifecycle
@@ -10,6 +10,9 @@ from src.domain.dip_client_error import DIPClientError
 
 @dataclass
 class EngineLifecycle:
+    HANDLED_MESSAGES: ClassVar[Tuple[type, ...]] = (InternalStartLifecycle, InternalEndLifecycle)
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (LifecycleEnded,)
+
     @staticmethod
     def handle_message(
         previous_state: EngineState,
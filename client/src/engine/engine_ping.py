@@ -2,7 +2,7 @@
 """Engine which reacts to server commands and supervises microcontroller"""
 import asyncio
 from dataclasses import dataclass
-from typing import TypeVar, Any
+from typing import TypeVar, Any, ClassVar, Tuple
 from result import Err
 from src.domain.death import Death
 from src.domain.hardware_shared_event import LifecycleStarted
@@ -26,6 +26,8 @@ class EnginePingState:
 
 @dataclass
 class EnginePing:
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (LifecycleStarted,)
+
     @staticmethod
     async def ping_until_death(
         death: Death,
@@ -1,15 +1,136 @@
 import asyncio
+import dataclasses
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Optional
+from enum import Enum
+from typing import Any, Callable, Optional, Deque, Dict, List
 from src.agent.agent_error import AgentExecutionError
 from src.domain.death import Death
 
 
+class QueueOverflowPolicy(Enum):
+    """What a bounded queue does with a new value when it is full"""
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+    merge_bytes = "merge_bytes"
+
+
+# Cache of which (single) bytes field each message type carries, if any
+PAYLOAD_FIELDS: Dict[type, Optional[str]] = {}
+
+
+def payload_field(value: Any) -> Optional[str]:
+    """Name of the single bytes field of a dataclass message, if it has one"""
+    value_type = type(value)
+    if value_type in PAYLOAD_FIELDS:
+        return PAYLOAD_FIELDS[value_type]
+    name = None
+    if dataclasses.is_dataclass(value):
+        fields = dataclasses.fields(value)
+        if len(fields) == 1 and isinstance(getattr(value, fields[0].name), bytes):
+            name = fields[0].name
+    PAYLOAD_FIELDS[value_type] = name
+    return name
+
+
+def payload_size(value: Any) -> int:
+    """Size of byte payload carried by value"""
+    if isinstance(value, bytes):
+        return len(value)
+    name = payload_field(value)
+    return len(getattr(value, name)) if name is not None else 0
+
+
+def merge_adjacent_bytes(previous: Any, value: Any) -> Optional[Any]:
+    """Merge two byte payloads or two same-typed messages with a single bytes field"""
+    if isinstance(previous, bytes) and isinstance(value, bytes):
+        return previous + value
+    if type(previous) != type(value):
+        return None
+    name = payload_field(value)
+    if name is None:
+        return None
+    return dataclasses.replace(value, **{name: getattr(previous, name) + getattr(value, name)})
+
+
+class MergingQueue:
+    """Asyncio FIFO queue which allows merging a value into the last queued value
+
+    Values are kept in an own deque instead of relying on internals of
+    asyncio.Queue, waiting producers & consumers are woken up by events.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self.values: Deque[Any] = deque()
+        self.not_empty = asyncio.Event()
+        self.not_full = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self.values)
+
+    def empty(self) -> bool:
+        return len(self.values) == 0
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self.values)
+
+    def put_nowait(self, value: Any):
+        if self.full():
+            raise asyncio.QueueFull
+        self.values.append(value)
+        self.not_empty.set()
+
+    async def put(self, value: Any):
+        while self.full():
+            self.not_full.clear()
+            await self.not_full.wait()
+        self.put_nowait(value)
+
+    def get_nowait(self) -> Any:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        value = self.values.popleft()
+        self.not_full.set()
+        return value
+
+    async def get(self) -> Any:
+        while self.empty():
+            self.not_empty.clear()
+            await self.not_empty.wait()
+        return self.get_nowait()
+
+    def merge_last(self, value: Any, merge: Callable[[Any, Any], Optional[Any]]) -> bool:
+        if self.empty():
+            return False
+        merged = merge(self.values[-1], value)
+        if merged is None:
+            return False
+        self.values[-1] = merged
+        return True
+
+
+@dataclass(frozen=True)
+class ManagedQueueMetrics:
+    """Snapshot of managed queue usage"""
+    depth: int
+    high_watermark: int
+    dropped: int
+    merged: int
+
+
 @dataclass
 class ManagedQueue:
-    queue: asyncio.Queue
+    queue: MergingQueue
     before_put: Optional[Any]
     before_get: Optional[Any]
+    policy: QueueOverflowPolicy = QueueOverflowPolicy.block
+    high_watermark: int = 0
+    dropped: int = 0
+    merged: int = 0
+    queued_bytes: int = 0
+    bytes_taken: Optional[asyncio.Event] = None
 
     def __str__(self):
         return f"ManagedQueue(...)"
@@ -20,19 +141,68 @@ class ManagedQueue:
     @staticmethod
     def build(
         before_put: Optional[Callable[[Any], type(None)]] = None,
-        before_get: Optional[Callable[[], type(None)]] = None
+        before_get: Optional[Callable[[], type(None)]] = None,
+        max_size: int = 0,
+        policy: QueueOverflowPolicy = QueueOverflowPolicy.block
     ):
-        return ManagedQueue(asyncio.Queue(), before_put, before_get)
+        return ManagedQueue(MergingQueue(max_size), before_put, before_get, policy, bytes_taken=asyncio.Event())
+
+    def metrics(self) -> ManagedQueueMetrics:
+        return ManagedQueueMetrics(self.queue.qsize(), self.high_watermark, self.dropped, self.merged)
 
     async def put(self, value):
         if self.before_put is not None:
             self.before_put(value)
-        return await self.queue.put(value)
+
+        # Handle overflow unless producer should wait
+        size = payload_size(value)
+        if self.queue.full():
+            if self.policy == QueueOverflowPolicy.drop_newest:
+                self.dropped += 1
+                return
+            elif self.policy == QueueOverflowPolicy.drop_oldest:
+                self.queued_bytes -= payload_size(self.queue.get_nowait())
+                self.dropped += 1
+                self.queue.put_nowait(value)
+                self.queued_bytes += size
+                return
+            elif self.policy == QueueOverflowPolicy.merge_bytes and \
+                    self.queue.merge_last(value, merge_adjacent_bytes):
+                self.merged += 1
+                self.queued_bytes += size
+                return
+
+        await self.queue.put(value)
+        self.queued_bytes += size
+        self.high_watermark = max(self.high_watermark, self.queue.qsize())
 
     async def get(self):
         if self.before_get is not None:
             self.before_get()
-        return await self.queue.get()
+        value = await self.queue.get()
+        self.queued_bytes -= payload_size(value)
+        if self.bytes_taken is not None:
+            self.bytes_taken.set()
+        return value
+
+    def drain(self, max_count: int) -> List[Any]:
+        """Take up to max_count already queued values without waiting"""
+        values = []
+        while len(values) < max_count and not self.queue.empty():
+            if self.before_get is not None:
+                self.before_get()
+            value = self.queue.get_nowait()
+            self.queued_bytes -= payload_size(value)
+            values.append(value)
+        if len(values) > 0 and self.bytes_taken is not None:
+            self.bytes_taken.set()
+        return values
+
+    async def wait_queued_bytes_below(self, limit: int):
+        """Wait until consumers have taken enough queued byte payloads"""
+        while self.queued_bytes >= limit and self.bytes_taken is not None:
+            self.bytes_taken.clear()
+            await self.bytes_taken.wait()
 
 
 @dataclass
@@ -41,14 +211,20 @@ class EngineBase:
     incoming_message_queue: ManagedQueue
     outgoing_message_queue: ManagedQueue
     event_queue: ManagedQueue
+    # Amount of queued events projected at once, 1 processes events one by one
+    event_batch_size: int = 1
 
     @staticmethod
-    async def build() -> 'EngineBase':
+    async def build(
+        outgoing_message_queue: Optional[ManagedQueue] = None,
+        event_batch_size: int = 1
+    ) -> 'EngineBase':
         return EngineBase(
             Death(),
             ManagedQueue.build(),
+            outgoing_message_queue if outgoing_message_queue is not None else ManagedQueue.build(),
             ManagedQueue.build(),
-            ManagedQueue.build())
+            event_batch_size)
 
 
 @dataclass
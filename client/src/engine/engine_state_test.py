@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from src.domain.monitor_message import SerialMonitorMessageToClient, MonitorUnavailable
+from src.engine.engine_state import ManagedQueue, QueueOverflowPolicy, ManagedQueueMetrics, MergingQueue
+
+
+class TestManagedQueue(IsolatedAsyncioTestCase):
+    """Test suite for bounded managed queues"""
+
+    @staticmethod
+    def drain(queue: ManagedQueue):
+        values = []
+        while not queue.queue.empty():
+            values.append(queue.queue.get_nowait())
+        return values
+
+    async def test_drop_policies(self):
+        """Check that full queues drop either oldest or newest values"""
+        oldest = ManagedQueue.build(max_size=2, policy=QueueOverflowPolicy.drop_oldest)
+        newest = ManagedQueue.build(max_size=2, policy=QueueOverflowPolicy.drop_newest)
+        for value in [1, 2, 3]:
+            await oldest.put(value)
+            await newest.put(value)
+
+        self.assertEqual(oldest.metrics(), ManagedQueueMetrics(2, 2, 1, 0))
+        self.assertEqual(TestManagedQueue.drain(oldest), [2, 3])
+        self.assertEqual(TestManagedQueue.drain(newest), [1, 2])
+
+    async def test_merge_policy(self):
+        """Check that full queues merge adjacent byte payloads"""
+        queue = ManagedQueue.build(max_size=2, policy=QueueOverflowPolicy.merge_bytes)
+        await queue.put(MonitorUnavailable("Gone"))
+        await queue.put(SerialMonitorMessageToClient(b"a"))
+        await queue.put(SerialMonitorMessageToClient(b"b"))
+        await queue.put(SerialMonitorMessageToClient(b"c"))
+
+        self.assertEqual(queue.metrics(), ManagedQueueMetrics(2, 2, 0, 2))
+        self.assertEqual(
+            TestManagedQueue.drain(queue),
+            [MonitorUnavailable("Gone"), SerialMonitorMessageToClient(b"abc")])
+
+    async def test_queued_bytes(self):
+        """Check that byte payloads are accounted and waited upon"""
+        queue = ManagedQueue.build()
+        await queue.put(SerialMonitorMessageToClient(b"abc"))
+        await queue.put(MonitorUnavailable("Gone"))
+        await queue.put(b"de")
+        self.assertEqual(queue.queued_bytes, 5)
+
+        waiter = asyncio.create_task(queue.wait_queued_bytes_below(3))
+        await queue.get()
+        await waiter
+        self.assertEqual(queue.queued_bytes, 2)
+
+
+    async def test_blocking_queue(self):
+        """Check that waiting producers & consumers are woken up in FIFO order"""
+        queue = MergingQueue(1)
+        self.assertRaises(asyncio.QueueEmpty, queue.get_nowait)
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        await queue.put(1)
+        self.assertEqual(await getter, 1)
+
+        queue.put_nowait(2)
+        self.assertRaises(asyncio.QueueFull, queue.put_nowait, 3)
+        putter = asyncio.create_task(queue.put(3))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(await queue.get(), 2)
+        await putter
+        self.assertEqual(queue.get_nowait(), 3)
+        self.assertTrue(queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import asyncio
+import dataclasses
+import unittest
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
+from unittest import IsolatedAsyncioTestCase
+from result import Ok, Err
+from src.domain.dip_client_error import GenericClientError
+from src.engine.engine import EngineDispatcher, Engine
+from src.engine.engine_state import EngineState, EngineBase
+
+
+@dataclass
+class Base:
+    pass
+
+
+@dataclass
+class Derived(Base):
+    pass
+
+
+@dataclass
+class Other:
+    pass
+
+
+@dataclass
+class SummingState(EngineState):
+    total: int = 0
+
+
+@dataclass
+class SummingEngine(Engine[Any, Any, SummingState, int, Any]):
+    """Engine which sums integer events and records state seen by each effect"""
+    effects: List[Tuple[int, int]] = field(default_factory=list)
+
+    @staticmethod
+    def state_project(previous_state: SummingState, event: int) -> SummingState:
+        return dataclasses.replace(previous_state, total=previous_state.total + event)
+
+    async def effect_project(self, previous_state: SummingState, event: int):
+        self.effects.append((previous_state.total, event))
+        if len(self.effects) == 5:
+            previous_state.base.death.grace()
+
+
+class TestEngine(IsolatedAsyncioTestCase):
+    """Test suite for engine event processing"""
+
+    async def test_batched_events(self):
+        """Check that batched event processing keeps order and per-event previous states"""
+        results = []
+        for batch_size in [1, 2, 64]:
+            base = await EngineBase.build(event_batch_size=batch_size)
+            for event in [1, 2, 3, 4, 5]:
+                await base.event_queue.put(event)
+            engine = SummingEngine(SummingState(base))
+            await engine.loop_events()
+            results.append((engine.state.total, engine.effects))
+
+        expected = (15, [(0, 1), (1, 2), (3, 3), (6, 4), (10, 5)])
+        self.assertEqual(results, [expected, expected, expected])
+
+
+class TestEngineDispatcher(IsolatedAsyncioTestCase):
+    """Test suite for type-keyed engine dispatch"""
+
+    async def test_message_dispatch(self):
+        """Check that only interested handlers are called, in registration order, subclasses included"""
+        calls: List[str] = []
+
+        def handler(name: str):
+            def handle(previous_state: Any, message: Any):
+                calls.append(name)
+                return Ok([f"{name}:{type(message).__name__}"])
+            return handle
+
+        dispatcher = EngineDispatcher()
+        dispatcher.register_messages((Base,), handler("base"))
+        dispatcher.register_messages((Other,), handler("other"))
+        dispatcher.register_messages((Derived, Other), handler("derived"))
+
+        self.assertEqual(dispatcher.message_project(None, Derived()), Ok(["base:Derived", "derived:Derived"]))
+        self.assertEqual(dispatcher.message_project(None, Base()), Ok(["base:Base"]))
+        self.assertEqual(dispatcher.message_project(None, 1), Ok([]))
+        self.assertEqual(calls, ["base", "derived", "base"])
+
+        error = GenericClientError("Failed")
+        dispatcher.register_messages((int,), lambda previous_state, message: Err(error))
+        self.assertEqual(dispatcher.message_project(None, 1), Err(error))
+
+    async def test_effect_dispatch(self):
+        """Check that effect tasks are only spawned for interested handlers"""
+        effects: List[str] = []
+
+        async def effect(previous_state: Any, event: Any):
+            effects.append(type(event).__name__)
+
+        dispatcher = EngineDispatcher()
+        dispatcher.register_effects((Derived,), effect)
+        dispatcher.register_effects((object,), effect)
+
+        await dispatcher.effect_project(None, Derived())
+        await dispatcher.effect_project(None, Other())
+        await asyncio.sleep(0)
+        self.assertEqual(effects, ["Derived", "Derived", "Other"])
+        self.assertEqual(len(dispatcher.effect_handlers(Base)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
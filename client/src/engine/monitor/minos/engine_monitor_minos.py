@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import environ
 from typing import List, Optional
 from result import Result
@@ -6,7 +6,7 @@ from src.domain.dip_client_error import DIPClientError
 from src.domain.hardware_video_message import COMMON_INCOMING_VIDEO_MESSAGE, COMMON_OUTGOING_VIDEO_MESSAGE, \
     HardwareVideoMessage, InternalStartLifecycle, InternalEndLifecycle
 from src.domain.monitor_message import log_monitor_message
-from src.engine.engine import Engine
+from src.engine.engine import Engine, EngineDispatcher
 from src.engine.engine_auth import EngineAuth
 from src.engine.engine_lifecycle import EngineLifecycle
 from src.engine.engine_ping import EnginePing
@@ -32,6 +32,12 @@ class EngineMonitorMinOS(Engine[
     engine_ping: EnginePing
     engine_minos_app: EngineMonitorMinOSApp
     engine_auth: EngineAuth
+    dispatcher: EngineDispatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.dispatcher = EngineDispatcher.of(
+            [self.engine_lifecycle, self.engine_minos_app, self.engine_auth],
+            [self.engine_lifecycle, self.engine_minos_app, self.engine_ping, self.engine_auth])
 
     async def start(self):
         await self.state.base.incoming_message_queue.put(InternalStartLifecycle())
@@ -54,11 +60,7 @@ class EngineMonitorMinOS(Engine[
         previous_state: EngineMonitorMinOSState,
         message: COMMON_INCOMING_VIDEO_MESSAGE
     ) -> Result[List[COMMON_ENGINE_EVENT], DIPClientError]:
-        return self.multi_message_project([
-            self.engine_lifecycle.handle_message,
-            self.engine_minos_app.handle_message,
-            self.engine_auth.handle_message,
-        ], previous_state, message)
+        return self.dispatcher.message_project(previous_state, message)
 
     def state_project(
         self,
@@ -69,11 +71,5 @@ class EngineMonitorMinOS(Engine[
         return stream_state
 
     async def effect_project(self, previous_state: EngineMonitorMinOSState, event: COMMON_ENGINE_EVENT):
-        projections = [
-            self.engine_lifecycle.effect_project,
-            self.engine_minos_app.effect_project,
-            self.engine_ping.effect_project,
-            self.engine_auth.effect_project,
-        ]
-        return await Engine.multi_effect_project(projections, previous_state, event)
+        return await self.dispatcher.effect_project(previous_state, event)
 
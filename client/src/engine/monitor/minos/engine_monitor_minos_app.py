@@ -1,26 +1,25 @@
 import asyncio
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import environ
-from typing import List, Any
+from typing import List, Any, ClassVar, Tuple, Optional
 from result import Result, Ok, Err
 
-from src.domain.death import Death
 from src.domain.dip_client_error import DIPClientError, NotAnError
 from src.domain.hardware_shared_event import AuthSucceeded
 from src.domain.hardware_shared_message import InternalEndLifecycle
 from src.domain.hardware_video_event import COMMON_ENGINE_EVENT
-from src.domain.minos_chunker import MinOSChunker
-from src.domain.minos_chunks import IndexedButtonChunk, SwitchChunk, TextChunk, ParsedChunk
+from src.domain.minos_chunker import MinOSChunker, MinOSStreamDecoder
+from src.domain.minos_chunks import IndexedButtonChunk, SwitchChunk, TextChunk, Chunk
 from src.domain.minos_monitor_event import MinOSMonitorEvent, StartingTUI, AddingTUISideEffect, IndexButtonClicked, \
     ReceivedChunkBytes, LeftoverChanged, BadChunkReceived, GoodChunkReceived, ModeSwitched, TextToAgent, \
-    TextChanged, SwitchesChanged, SendingParsedChunk, MinOSSuiteTimedOut
+    TextChanged, SwitchesChanged, SendingParsedChunk, MinOSSuiteTimedOut, DisplayChunksReceived
 from src.domain.monitor_message import StartTUI, AddTUISideEffect, SerialMonitorMessageToAgent, \
     SerialMonitorMessageToClient, ReceiveChunks, ButtonPress, SendParsedChunk, MinOSSuiteTimeout
-from src.engine.engine_state import ManagedQueue
 from src.engine.monitor.minos.engine_monitor_minos_state import EngineMonitorMinOSState
 from src.engine.monitor.minos.minos_app import MinOSApp, button_keys, switch_keys
-from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
+from src.engine.monitor.minos.minos_suite_recorder import MinOSSuiteRecorder
+from src.engine.monitor.minos.minos_suite_replay import MinOSReplayScheduler
 import time
 from src.protocol.s11n_json import COMMON_MINOS_SUITE_ENCODER_JSON
 import datetime
@@ -28,6 +27,15 @@ import datetime
 
 @dataclass
 class EngineMonitorMinOSApp:
+    HANDLED_MESSAGES: ClassVar[Tuple[type, ...]] = (
+        StartTUI, AddTUISideEffect, SerialMonitorMessageToClient, SendParsedChunk, ReceiveChunks, ButtonPress,
+        MinOSSuiteTimeout)
+    # Every event is also passed to subscribed TUI event handlers
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (object,)
+
+    decoder: MinOSStreamDecoder = field(default_factory=MinOSStreamDecoder)
+    replay: Optional[MinOSReplayScheduler] = None
+
     @staticmethod
     def handle_message(
         previous_state: EngineMonitorMinOSState,
@@ -43,12 +51,15 @@ class EngineMonitorMinOSApp:
             return Ok([SendingParsedChunk(message.parsed_chunk)])
         if isinstance(message, ReceiveChunks):
             events = [LeftoverChanged(message.leftover)]
-            for chunk in message.chunks:
-                chunk_result = MinOSChunker.parse_chunk(chunk)
-                if isinstance(chunk_result, Err):
-                    events.append(BadChunkReceived(chunk, chunk_result.value))
+            # Unless recorded, display chunks of the whole read are passed to TUI at once, other chunks one by one
+            batch_display = previous_state.result_recorder is None and len(message.columns.pixel_index) > 0
+            if batch_display:
+                events.append(DisplayChunksReceived(message.columns))
+            for chunk in message.columns.ordered(skip_display=batch_display):
+                if isinstance(chunk, Chunk):
+                    events.append(BadChunkReceived(chunk, MinOSChunker.parse_chunk(chunk).value))
                 else:
-                    events.append(GoodChunkReceived(chunk_result.value))
+                    events.append(GoodChunkReceived(chunk))
             return Ok(events)
         if isinstance(message, ButtonPress):
             if message.key == "ctrl+i": # i.e. TAB
@@ -78,8 +89,9 @@ class EngineMonitorMinOSApp:
             src = previous_state.source_suite
             time_ms = time.time() * 1000
             start_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-            result_suite = MinOSSuite([], src.treshold_time, src.treshold_chunks, time_ms, start_timestamp)
-            return dataclasses.replace(previous_state, result_suite=result_suite)
+            result_recorder = MinOSSuiteRecorder(
+                src.treshold_time, src.treshold_chunks, time_ms, start_timestamp, previous_state.result_jsonl)
+            return dataclasses.replace(previous_state, result_recorder=result_recorder)
         if isinstance(event, AddingTUISideEffect):
             return dataclasses.replace(previous_state, event_handlers=previous_state.event_handlers + [event.event_handler])
         if isinstance(event, LeftoverChanged):
@@ -90,49 +102,8 @@ class EngineMonitorMinOSApp:
             return dataclasses.replace(previous_state, text_out=event.text)
         if isinstance(event, SwitchesChanged):
             return dataclasses.replace(previous_state, switches=event.fancy_byte)
-        if isinstance(event, GoodChunkReceived) and previous_state.result_suite is not None:
-            received_chunks = list(filter(lambda c: not c.outgoing, previous_state.result_suite.chunks))
-            treshold = previous_state.result_suite.treshold_chunks
-            if 0 <= treshold <= len(received_chunks):
-                return previous_state
-            src = previous_state.result_suite
-            time_ms = time.time() * 1000
-            delta_ms = time_ms - previous_state.result_suite.start_time
-            sent_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-            new_chunk = MinOSSuitePacket(
-                event.parsed_chunk,
-                delta_ms,
-                sent_timestamp,
-                False
-            )
-            new_suite = dataclasses.replace(previous_state.result_suite, chunks=src.chunks + [new_chunk])
-            return dataclasses.replace(previous_state, result_suite=new_suite)
-        if isinstance(event, SendingParsedChunk) and previous_state.result_suite is not None:
-            received_chunks = list(filter(lambda c: not c.outgoing, previous_state.result_suite.chunks))
-            treshold = previous_state.result_suite.treshold_chunks
-            if 0 <= treshold <= len(received_chunks):
-                return previous_state
-            src = previous_state.result_suite
-            time_ms = time.time() * 1000
-            delta_ms = time_ms - previous_state.result_suite.start_time
-            sent_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-            new_chunk = MinOSSuitePacket(
-                event.parsed_chunk,
-                delta_ms,
-                sent_timestamp,
-                True
-            )
-            new_suite = dataclasses.replace(previous_state.result_suite, chunks=src.chunks + [new_chunk])
-            return dataclasses.replace(previous_state, result_suite=new_suite)
         return previous_state
 
-    async def suite_chunk_queue(self, chunk: ParsedChunk, death: Death, sent_at: int, queue: ManagedQueue):
-        timeout = sent_at / 1000
-        death_or_outgoing = await death.or_awaitable(asyncio.sleep(timeout))
-        if isinstance(death_or_outgoing, Err):
-            return
-        await queue.put(SendParsedChunk(chunk))
-
     async def suite_timeout(self, state_ref: EngineMonitorMinOSState):
         timeout = state_ref.source_suite.treshold_time / 1000
         death_or_outgoing = await state_ref.base.death.or_awaitable(asyncio.sleep(timeout))
@@ -140,7 +111,17 @@ class EngineMonitorMinOSApp:
             return
         await state_ref.base.incoming_message_queue.put(MinOSSuiteTimeout())
 
+    @staticmethod
+    def record(recorder: MinOSSuiteRecorder, event: Any):
+        time_ms = time.time() * 1000
+        sent_timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
+        outgoing = isinstance(event, SendingParsedChunk)
+        recorder.record(event.parsed_chunk, outgoing, time_ms, sent_timestamp)
+
     async def effect_project(self, previous_state: EngineMonitorMinOSState, event: COMMON_ENGINE_EVENT):
+        if isinstance(event, (GoodChunkReceived, SendingParsedChunk)) and previous_state.result_recorder is not None:
+            # Recorder is appended in place before anything is awaited, so packets keep the order of events
+            self.record(previous_state.result_recorder, event)
         if isinstance(event, AuthSucceeded):
             await previous_state.base.incoming_message_queue.put(StartTUI())
             pass
@@ -152,11 +133,10 @@ class EngineMonitorMinOSApp:
                 loop.create_task(MinOSApp.run_with_state(previous_state))
             if is_suite:
                 loop.create_task(self.suite_timeout(previous_state))
-                for chunk in previous_state.source_suite.chunks:
-                    if chunk.outgoing:
-                        loop.create_task(self.suite_chunk_queue(
-                            chunk.parsed_chunk, previous_state.base.death,
-                            chunk.sent_at, previous_state.base.incoming_message_queue))
+                queue = previous_state.base.incoming_message_queue
+                self.replay = MinOSReplayScheduler.of(previous_state.source_suite, previous_state.replay_config)
+                loop.create_task(self.replay.run(
+                    previous_state.base.death, lambda parsed_chunk: queue.put(SendParsedChunk(parsed_chunk))))
         elif isinstance(event, IndexButtonClicked):
             parsed_chunk = IndexedButtonChunk(event.button_index)
             await previous_state.base.incoming_message_queue.put(SendParsedChunk(parsed_chunk))
@@ -164,8 +144,9 @@ class EngineMonitorMinOSApp:
             parsed_chunk = SwitchChunk(event.fancy_byte)
             await previous_state.base.incoming_message_queue.put(SendParsedChunk(parsed_chunk))
         elif isinstance(event, ReceivedChunkBytes):
-            chunks, garbage, leftover = MinOSChunker.decode_stream(event.old_stream + event.incoming)
-            await previous_state.base.incoming_message_queue.put(ReceiveChunks(chunks, garbage, leftover))
+            # Unfinished chunk is kept by decoder across reads, old stream is informative only
+            columns = self.decoder.feed_columns(event.incoming)
+            await previous_state.base.incoming_message_queue.put(ReceiveChunks(columns, self.decoder.leftover()))
         elif isinstance(event, TextToAgent):
             parsed_chunk = TextChunk(event.text)
             await previous_state.base.incoming_message_queue.put(SendParsedChunk(parsed_chunk))
@@ -174,13 +155,16 @@ class EngineMonitorMinOSApp:
             encoded = MinOSChunker.encode(chunk)
             await previous_state.base.outgoing_message_queue.put(SerialMonitorMessageToAgent(encoded))
         if isinstance(event, GoodChunkReceived) or isinstance(event, MinOSSuiteTimedOut):
-            if previous_state.result_suite is not None:
-                received_chunks = list(filter(lambda c: not c.outgoing, previous_state.result_suite.chunks))
-                treshold = previous_state.result_suite.treshold_chunks
+            recorder = previous_state.result_recorder
+            if recorder is not None:
                 force_end = isinstance(event, MinOSSuiteTimedOut)
-                if force_end or (0 <= treshold <= len(received_chunks)):
+                if force_end or recorder.is_complete():
+                    recorder.close()
+                    result_suite = recorder.suite()
+                    if self.replay is not None:
+                        result_suite = dataclasses.replace(result_suite, replay=self.replay.report())
                     await previous_state.base.incoming_message_queue.put(InternalEndLifecycle(NotAnError(
-                        COMMON_MINOS_SUITE_ENCODER_JSON.json_encode(previous_state.result_suite)
+                        COMMON_MINOS_SUITE_ENCODER_JSON.json_encode(result_suite)
                     )))
 
         # No matter what is the event, also pass it to subscribed event handlers (TUI app components)
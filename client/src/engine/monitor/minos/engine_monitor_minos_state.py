@@ -1,12 +1,15 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, TextIO
 
 from src.domain.fancy_byte import FancyByte
 from src.domain.positive_integer import PositiveInteger
 from src.engine.engine_auth import EngineAuthState
 from src.engine.engine_ping import EnginePingState
 from src.engine.engine_state import EngineBase, EngineState
+from src.engine.monitor.minos.minos_framebuffer import MinOSDisplayConfig
 from src.engine.monitor.minos.minos_suite import MinOSSuite
+from src.engine.monitor.minos.minos_suite_recorder import MinOSSuiteRecorder
+from src.engine.monitor.minos.minos_suite_replay import MinOSReplayConfig
 from src.service.backend_config import UserPassAuthConfig
 
 
@@ -17,9 +20,12 @@ class EngineMonitorMinOSState(EngineState, EngineAuthState, EnginePingState):
     event_handlers: List
     heartbeat_seconds: PositiveInteger
     source_suite: Optional[MinOSSuite] = None
-    result_suite: Optional[MinOSSuite] = None
+    result_recorder: Optional[MinOSSuiteRecorder] = None
     chunker_stream: bytes = b""
     is_text_mode: bool = False
     text_out: str = ""
     text_in: str = ""
     switches: FancyByte = FancyByte.fromInt(0).value
+    display_config: MinOSDisplayConfig = MinOSDisplayConfig()
+    result_jsonl: Optional[TextIO] = None
+    replay_config: MinOSReplayConfig = MinOSReplayConfig()
@@ -1,6 +1,5 @@
 """Module for functionality related to serial socket monitor as button/led byte stream, specifically graphics/UI"""
 import asyncio
-from dataclasses import dataclass
 from functools import partial
 from typing import Optional, Any
 from result import Err
@@ -10,9 +9,10 @@ from textual.views import GridView
 from textual.widgets import Button
 from src.domain.minos_chunks import LEDChunk, TextChunk, DisplayChunk
 from src.domain.minos_monitor_event import GoodChunkReceived, TextChanged, ModeSwitched, SwitchesChanged, \
-    IndexButtonClicked
+    IndexButtonClicked, DisplayChunksReceived
 from src.domain.monitor_message import AddTUISideEffect, ButtonPress
 from src.engine.monitor.minos.engine_monitor_minos_state import EngineMonitorMinOSState
+from src.engine.monitor.minos.minos_framebuffer import MinOSFramebuffer
 from src.util import log
 
 LOGGER = log.timed_named_logger("minos")
@@ -55,10 +55,14 @@ class ButtonLEDScreen(GridView):
 
     def on_mount(self, event: events.Mount) -> None:
         """Event when widget is first mounted (added to a parent view)."""
+        display_config = hacked_global_app_state_storage.engine_state.display_config
+        width = display_config.width
+        height = display_config.height
+
         # Make all the pixels
         self.pixels = [
             Button(f"P{i}", style=self.BLACK, name=f"P{i}")
-            for i in range(0, 8 * 8)
+            for i in range(0, width * height)
         ]
 
         # Make all the LEDs
@@ -111,20 +115,20 @@ class ButtonLEDScreen(GridView):
         self.grid.set_align("center", "center")
 
         # Create rows / columns / areas
-        self.grid.add_column(fraction=5, name="maincol", repeat=8)
+        self.grid.add_column(fraction=5, name="maincol", repeat=width)
         self.grid.add_column(fraction=4, name="sidecol", repeat=8)
-        self.grid.add_row(name="mainrow", repeat=8)
+        self.grid.add_row(name="mainrow", repeat=height)
         self.grid.add_row(name="statsrow", repeat=1)
         areas = {
             "input": "sidecol1-start|sidecol8-end,mainrow6-start|mainrow6-end",
             "output": "sidecol1-start|sidecol8-end,mainrow7-start|mainrow7-end",
-            "stats": "maincol1-start|maincol6-end,statsrow",
-            "info": "maincol7-start|sidecol3-end,statsrow",
+            "stats": f"maincol1-start|maincol{width - 2}-end,statsrow",
+            "info": f"maincol{width - 1}-start|sidecol3-end,statsrow",
             "controls": "sidecol4-start|sidecol8-end,statsrow",
         }
-        for i in range(0, 8 * 8):
-            x = i % 8
-            y = int(i / 8)
+        for i in range(0, width * height):
+            x = i % width
+            y = int(i / width)
             area = f"p{i}"
             areas[area] = f"maincol{x + 1}-start|maincol{x + 1}-end,mainrow{y + 1}-start|mainrow{y + 1}-end"
         for i in range(0, 8):
@@ -161,36 +165,36 @@ class ButtonLEDScreen(GridView):
 
         # Display effect
         def on_pixel_change(pixel_index: int, r: int, g: int, b: int):
-            color = f"white on rgb({r},{g},{b})"
-            if pixel_index < 0: return
-            if pixel_index >= len(self.pixels): return
-            if self.pixels[pixel_index].button_style == color: return
-
-            self.pixels[pixel_index].button_style = color
+            self.pixels[pixel_index].button_style = f"white on rgb({r},{g},{b})"
             if self.pixels[pixel_index].label[-1] == "\n":
                 self.pixels[pixel_index].label = f"P{pixel_index}"
             else:
                 self.pixels[pixel_index].label = f"\nP{pixel_index}\n"
 
-        @dataclass
-        class PixelBatching:
-            batched_pixels = []
-            max_fps = 10
-        pixel_batching = PixelBatching()
+        # Pixel updates are collected in framebuffer and only changed pixels are re-rendered once per frame
+        framebuffer = MinOSFramebuffer(display_config)
 
         async def display_loop():
             while not hacked_global_app_state_storage.engine_state.base.death.gracing:
-                await asyncio.sleep(1 / pixel_batching.max_fps)
-                for c in pixel_batching.batched_pixels:
-                    on_pixel_change(c.pixel_index, c.r() * 85, c.g() * 85, c.b() * 85)
-                pixel_batching.batched_pixels = []
+                await asyncio.sleep(1 / display_config.fps)
+                changed = framebuffer.take_dirty()
+                for pixel_index, r, g, b in changed:
+                    on_pixel_change(pixel_index, r * 85, g * 85, b * 85)
+                if changed:
+                    self.stats.label = \
+                        f"Display updates: {framebuffer.updates}, rendered: {framebuffer.rendered}, " \
+                        f"merged: {framebuffer.merged}, dropped: {framebuffer.dropped}"
         asyncio.create_task(display_loop())
 
         def expect_pixel_change(state: Any, event: Any):
+            if isinstance(event, DisplayChunksReceived):
+                c = event.columns
+                framebuffer.set_pixels(c.pixel_index, c.pixel_r, c.pixel_g, c.pixel_b)
+                return
             if not isinstance(event, GoodChunkReceived): return
             if not isinstance(event.parsed_chunk, DisplayChunk): return
             c = event.parsed_chunk
-            pixel_batching.batched_pixels.append(c)
+            framebuffer.set_pixel(c.pixel_index, c.r(), c.g(), c.b())
         hacked_global_app_state_storage.message(AddTUISideEffect(partial(expect_pixel_change)))
 
         # LED effect
@@ -205,8 +209,7 @@ class ButtonLEDScreen(GridView):
             if not isinstance(event, GoodChunkReceived): return
             if not isinstance(event.parsed_chunk, LEDChunk): return
             fancy_byte = event.parsed_chunk.fancy_byte
-            bits = fancy_byte.to_binary_bits()
-            for index, is_on in enumerate(bits):
+            for index, is_on in enumerate(fancy_byte.bits()):
                 on_led_change(index, is_on)
         hacked_global_app_state_storage.message(AddTUISideEffect(partial(expect_led_change)))
 
@@ -246,8 +249,7 @@ class ButtonLEDScreen(GridView):
         def expect_switch_change(state: Any, event: Any):
             if not isinstance(event, SwitchesChanged): return
             fancy_byte = event.fancy_byte
-            bits = fancy_byte.to_binary_bits()
-            for index, is_on in enumerate(bits):
+            for index, is_on in enumerate(fancy_byte.bits()):
                 on_switch_change(index, is_on)
         hacked_global_app_state_storage.message(AddTUISideEffect(partial(expect_switch_change)))
 
@@ -0,0 +1,79 @@
+"""Model of MinOS display, which is rendered by TUI"""
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Set, Tuple
+from result import Result, Err, Ok
+from src.domain.fancy_byte import RGB_TABLE
+from src.domain.dip_client_error import DIPClientError, GenericClientError
+
+# Pixel index is sent as a single byte
+MINOS_MAX_PIXELS = 256
+
+
+@dataclass(frozen=True)
+class MinOSDisplayConfig:
+    """Configurations for MinOS display size and TUI render rate"""
+    width: int = 8
+    height: int = 8
+    fps: int = 10
+
+    @staticmethod
+    def build(width: int, height: int, fps: int) -> Result['MinOSDisplayConfig', DIPClientError]:
+        if width < 8 or height < 8:
+            return Err(GenericClientError("MinOS display must be at least 8x8 pixels"))
+        if width * height > MINOS_MAX_PIXELS:
+            return Err(GenericClientError(f"MinOS display can't have more than {MINOS_MAX_PIXELS} pixels"))
+        if fps <= 0:
+            return Err(GenericClientError("MinOS display frame rate must be positive"))
+        return Ok(MinOSDisplayConfig(width, height, fps))
+
+    def pixel_count(self) -> int:
+        return self.width * self.height
+
+
+@dataclass
+class MinOSFramebuffer:
+    """Last-write-wins pixel colors, which remembers pixels changed since last render
+
+    Colors are packed like in DisplayChunk i.e. 0b00RRGGBB. Updates to a pixel
+    already waiting for render or not changing its color are counted as merged,
+    updates to pixels outside of display are counted as dropped.
+    """
+    config: MinOSDisplayConfig
+    colors: array = field(default_factory=lambda: array("B"))
+    dirty: Set[int] = field(default_factory=set)
+    updates: int = 0
+    merged: int = 0
+    dropped: int = 0
+    rendered: int = 0
+
+    def __post_init__(self):
+        if len(self.colors) == 0:
+            self.colors = array("B", bytes(self.config.pixel_count()))
+
+    def set_pixel(self, pixel_index: int, r: int, g: int, b: int):
+        self.updates += 1
+        if pixel_index < 0 or pixel_index >= len(self.colors):
+            self.dropped += 1
+            return
+        color = (r << 4) | (g << 2) | b
+        if pixel_index in self.dirty:
+            self.merged += 1
+        elif self.colors[pixel_index] == color:
+            self.merged += 1
+            return
+        else:
+            self.dirty.add(pixel_index)
+        self.colors[pixel_index] = color
+
+    def set_pixels(self, pixel_index: array, r: array, g: array, b: array):
+        """Set pixels of a whole read at once, e.g. columns of MinOSChunkColumns"""
+        for index, pixel_r, pixel_g, pixel_b in zip(pixel_index, r, g, b):
+            self.set_pixel(index, pixel_r, pixel_g, pixel_b)
+
+    def take_dirty(self) -> List[Tuple[int, int, int, int]]:
+        """Pixel index and color components of pixels changed since last call"""
+        changed = [(pixel_index, *RGB_TABLE[self.colors[pixel_index]]) for pixel_index in sorted(self.dirty)]
+        self.dirty.clear()
+        self.rendered += len(changed)
+        return changed
@@ -0,0 +1,38 @@
+import unittest
+from array import array
+
+from result import Ok, Err
+from src.engine.monitor.minos.minos_framebuffer import MinOSFramebuffer, MinOSDisplayConfig
+
+
+class TestMinOSFramebuffer(unittest.TestCase):
+    def test_dirty_tracking(self):
+        """Check that only changed pixels are rendered, with last write winning"""
+        framebuffer = MinOSFramebuffer(MinOSDisplayConfig())
+        framebuffer.set_pixel(3, 1, 2, 3)
+        framebuffer.set_pixel(3, 3, 0, 1)
+        framebuffer.set_pixel(5, 0, 0, 0)
+        framebuffer.set_pixel(64, 1, 1, 1)
+        framebuffer.set_pixel(1, 2, 2, 2)
+
+        self.assertEqual(framebuffer.take_dirty(), [(1, 2, 2, 2), (3, 3, 0, 1)])
+        self.assertEqual(framebuffer.take_dirty(), [])
+        self.assertEqual((framebuffer.updates, framebuffer.merged, framebuffer.dropped), (5, 2, 1))
+        self.assertEqual(framebuffer.rendered, 2)
+
+        framebuffer.set_pixel(1, 2, 2, 2)
+        framebuffer.set_pixel(1, 0, 0, 1)
+        self.assertEqual(framebuffer.take_dirty(), [(1, 0, 0, 1)])
+
+    def test_set_pixels(self):
+        """Check that pixel columns of a whole read are set in order"""
+        framebuffer = MinOSFramebuffer(MinOSDisplayConfig())
+        framebuffer.set_pixels(array("B", [3, 3, 1]), array("B", [1, 3, 2]), array("B", [2, 0, 2]), array("B", [3, 1, 2]))
+        self.assertEqual(framebuffer.take_dirty(), [(1, 2, 2, 2), (3, 3, 0, 1)])
+        self.assertEqual((framebuffer.updates, framebuffer.merged), (3, 1))
+
+    def test_display_config(self):
+        self.assertEqual(MinOSDisplayConfig.build(16, 16, 30), Ok(MinOSDisplayConfig(16, 16, 30)))
+        self.assertIsInstance(MinOSDisplayConfig.build(4, 8, 10), Err)
+        self.assertIsInstance(MinOSDisplayConfig.build(16, 17, 10), Err)
+        self.assertEqual(len(MinOSFramebuffer(MinOSDisplayConfig(16, 8)).colors), 128)
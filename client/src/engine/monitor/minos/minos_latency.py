@@ -0,0 +1,92 @@
+"""Module for round-trip latency analysis of recorded MinOS suite results"""
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Dict
+from src.engine.monitor.minos.minos_suite import MinOSSuitePacket
+
+# Chunks sent by the monitor, i.e. user input, which the board is expected to respond to
+STIMULUS_TYPES = ("button", "switch", "text")
+ALL_STIMULI = "all"
+
+
+@dataclass
+class MinOSLatencySample:
+    """Outgoing stimulus paired with the first matching incoming response, if any"""
+    stimulus_type: str
+    sent_at: float
+    response_type: Optional[str]
+    latency_ms: Optional[float]
+
+
+@dataclass
+class MinOSLatencyStats:
+    """Round-trip latency percentiles of answered stimuli in milliseconds"""
+    stimulus_type: str
+    answered: int
+    unanswered: int
+    p50_ms: Optional[float]
+    p90_ms: Optional[float]
+    p99_ms: Optional[float]
+    max_ms: Optional[float]
+
+
+@dataclass
+class MinOSLatencyReport:
+    """Latency stats over all stimuli, followed by stats of each stimulus type"""
+    response_type: Optional[str]
+    stats: List[MinOSLatencyStats]
+    samples: List[MinOSLatencySample]
+
+
+def percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile, i.e. smallest value which at least percent of values don't exceed"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def pair_stimuli(packets: List[MinOSSuitePacket], response_type: Optional[str] = None) -> List[MinOSLatencySample]:
+    """Pair every outgoing stimulus with the first incoming response after it
+
+    Packets are walked once in order of sent_at, so stimuli sent before a
+    response arrives all wait for that same response. Only responses of
+    response_type are matched, if it's set.
+    """
+    samples = []
+    waiting: List[MinOSLatencySample] = []
+    for packet in sorted(packets, key=lambda p: p.sent_at):
+        packet_type = packet.parsed_chunk.type_text()
+        if packet.outgoing:
+            if packet_type in STIMULUS_TYPES:
+                sample = MinOSLatencySample(packet_type, packet.sent_at, None, None)
+                samples.append(sample)
+                waiting.append(sample)
+        elif waiting and (response_type is None or packet_type == response_type):
+            for sample in waiting:
+                sample.response_type = packet_type
+                sample.latency_ms = packet.sent_at - sample.sent_at
+            waiting = []
+    return samples
+
+
+def latency_stats(stimulus_type: str, samples: List[MinOSLatencySample]) -> MinOSLatencyStats:
+    latencies = sorted(sample.latency_ms for sample in samples if sample.latency_ms is not None)
+    return MinOSLatencyStats(
+        stimulus_type=stimulus_type,
+        answered=len(latencies),
+        unanswered=len(samples) - len(latencies),
+        p50_ms=percentile(latencies, 50),
+        p90_ms=percentile(latencies, 90),
+        p99_ms=percentile(latencies, 99),
+        max_ms=latencies[-1] if latencies else None)
+
+
+def latency_report(packets: List[MinOSSuitePacket], response_type: Optional[str] = None) -> MinOSLatencyReport:
+    samples = pair_stimuli(packets, response_type)
+    by_type: Dict[str, List[MinOSLatencySample]] = {}
+    for sample in samples:
+        by_type.setdefault(sample.stimulus_type, []).append(sample)
+    stats = [latency_stats(ALL_STIMULI, samples)]
+    stats.extend(latency_stats(stimulus_type, by_type[stimulus_type]) for stimulus_type in sorted(by_type))
+    return MinOSLatencyReport(response_type, stats, samples)
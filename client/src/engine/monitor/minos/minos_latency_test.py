@@ -0,0 +1,55 @@
+import unittest
+
+from src.domain.fancy_byte import FancyByte
+from src.domain.minos_chunks import IndexedButtonChunk, LEDChunk, SwitchChunk, TextChunk, DisplayChunk
+from src.engine.monitor.minos.minos_latency import percentile, pair_stimuli, latency_report
+from src.engine.monitor.minos.minos_suite import MinOSSuitePacket
+
+
+def packet(chunk, sent_at, outgoing):
+    return MinOSSuitePacket(chunk, sent_at, "", outgoing)
+
+
+class TestMinOSLatency(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 90), 90)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+
+    def test_pair_stimuli(self):
+        """Check that stimuli are paired with the first later response of matching type"""
+        packets = [
+            packet(LEDChunk(FancyByte(1)), 5, False),
+            packet(IndexedButtonChunk(1), 10, True),
+            packet(SwitchChunk(FancyByte(2)), 12, True),
+            packet(TextChunk("ok"), 15, False),
+            packet(DisplayChunk(0, FancyByte(3)), 20, False),
+            packet(TextChunk("hello"), 30, True),
+        ]
+        self.assertEqual(
+            [(s.stimulus_type, s.response_type, s.latency_ms) for s in pair_stimuli(packets)],
+            [("button", "text", 5), ("switch", "text", 3), ("text", None, None)])
+        self.assertEqual(
+            [(s.response_type, s.latency_ms) for s in pair_stimuli(packets, "display")],
+            [("display", 10), ("display", 8), (None, None)])
+
+    def test_latency_report(self):
+        """Check that stats are reported overall and per stimulus type"""
+        packets = []
+        for index in range(100):
+            packets.append(packet(IndexedButtonChunk(0), index * 1000, True))
+            packets.append(packet(LEDChunk(FancyByte(0)), index * 1000 + index + 1, False))
+        packets.append(packet(SwitchChunk(FancyByte(0)), 200000, True))
+        report = latency_report(packets)
+        self.assertEqual([stats.stimulus_type for stats in report.stats], ["all", "button", "switch"])
+        overall, button, switch = report.stats
+        self.assertEqual((overall.answered, overall.unanswered), (100, 1))
+        self.assertEqual((button.p50_ms, button.p90_ms, button.p99_ms, button.max_ms), (50, 90, 99, 100))
+        self.assertEqual((switch.answered, switch.unanswered, switch.max_ms), (0, 1, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 from src.domain.minos_chunks import ParsedChunk
 
 
@@ -11,6 +11,19 @@ class MinOSSuitePacket:
     outgoing: bool
 
 
+@dataclass
+class MinOSReplayReport:
+    """How late, in milliseconds, each outgoing suite packet was sent compared to its replay schedule"""
+    speed: float
+    jitter_ms: List[float]
+
+    def mean_jitter_ms(self) -> float:
+        return sum(self.jitter_ms) / len(self.jitter_ms) if self.jitter_ms else 0
+
+    def max_jitter_ms(self) -> float:
+        return max(self.jitter_ms, default=0)
+
+
 @dataclass
 class MinOSSuite:
     chunks: List[MinOSSuitePacket]
@@ -18,3 +31,4 @@ class MinOSSuite:
     treshold_chunks: int
     start_time: float
     start_timestamp: str
+    replay: Optional[MinOSReplayReport] = None
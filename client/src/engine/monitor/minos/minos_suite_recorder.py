@@ -0,0 +1,53 @@
+"""Module for recording MinOS suite results as packets arrive"""
+from dataclasses import dataclass, field
+from typing import List, Optional, TextIO
+from src.domain.minos_chunks import ParsedChunk
+from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
+from src.protocol.s11n_json import COMMON_MINOS_SUITE_PACKET_ENCODER_JSON
+
+
+@dataclass
+class MinOSSuiteRecorder:
+    """Append-only MinOS suite result with running packet counters
+
+    If jsonl is set, every packet is written to it as a JSON line as soon
+    as it's recorded instead of being kept in memory, so the resulting suite has no packets.
+    Recording does I/O, so it belongs to side effects, not to state projection.
+    """
+    treshold_time: float
+    treshold_chunks: int
+    start_time: float
+    start_timestamp: str
+    jsonl: Optional[TextIO] = field(default=None, repr=False, compare=False)
+    packets: List[MinOSSuitePacket] = field(default_factory=list)
+    incoming: int = 0
+    outgoing: int = 0
+
+    def is_complete(self) -> bool:
+        """Whether the expected amount of incoming packets has been received"""
+        return 0 <= self.treshold_chunks <= self.incoming
+
+    def record(self, parsed_chunk: ParsedChunk, outgoing: bool, time_ms: float, timestamp: str) -> bool:
+        """Append packet to the result, unless the result is already complete"""
+        if self.is_complete():
+            return False
+        packet = MinOSSuitePacket(parsed_chunk, time_ms - self.start_time, timestamp, outgoing)
+        if outgoing:
+            self.outgoing += 1
+        else:
+            self.incoming += 1
+        if self.jsonl is None:
+            self.packets.append(packet)
+            return True
+        self.jsonl.write(COMMON_MINOS_SUITE_PACKET_ENCODER_JSON.encode(packet))
+        self.jsonl.write("\n")
+        return True
+
+    def close(self):
+        if self.jsonl is not None:
+            self.jsonl.close()
+
+    def suite(self) -> MinOSSuite:
+        """Suite with the packets recorded in memory"""
+        return MinOSSuite(
+            self.packets, self.treshold_time, self.treshold_chunks, self.start_time, self.start_timestamp)
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from result import Ok, Err
+from src.domain.minos_chunks import TextChunk, IndexedButtonChunk
+from src.domain.minos_monitor_event import GoodChunkReceived, SendingParsedChunk
+from src.engine.monitor.minos.engine_monitor_minos_app import EngineMonitorMinOSApp
+from src.engine.monitor.minos.minos_suite_recorder import MinOSSuiteRecorder
+from src.protocol.s11n_json import COMMON_MINOS_SUITE_PACKET_DECODER_JSON
+
+
+class TestMinOSSuiteRecorder(unittest.TestCase):
+    def test_record(self):
+        """Check that packets are counted by direction and not recorded once enough are received"""
+        recorder = MinOSSuiteRecorder(1000, 2, 500, "start")
+        self.assertTrue(recorder.record(IndexedButtonChunk(1), True, 510, "a"))
+        self.assertTrue(recorder.record(TextChunk("one"), False, 520, "b"))
+        self.assertFalse(recorder.is_complete())
+        self.assertTrue(recorder.record(TextChunk("two"), False, 530, "c"))
+        self.assertTrue(recorder.is_complete())
+        self.assertFalse(recorder.record(TextChunk("three"), False, 540, "d"))
+
+        suite = recorder.suite()
+        self.assertEqual((recorder.incoming, recorder.outgoing), (2, 1))
+        self.assertEqual([packet.sent_at for packet in suite.chunks], [10, 20, 30])
+        self.assertEqual([packet.outgoing for packet in suite.chunks], [True, False, False])
+        self.assertEqual((suite.treshold_time, suite.treshold_chunks, suite.start_time), (1000, 2, 500))
+
+    def test_record_jsonl(self):
+        """Check that packets are streamed to JSON lines instead of memory"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.jsonl")
+            recorder = MinOSSuiteRecorder(1000, -1, 0, "start", open(path, "w"))
+            for index in range(3):
+                recorder.record(TextChunk(f"line {index}"), index == 0, index, "now")
+            recorder.close()
+
+            self.assertEqual(recorder.suite().chunks, [])
+            with open(path) as f:
+                lines = f.read().splitlines()
+            packets = [COMMON_MINOS_SUITE_PACKET_DECODER_JSON.decode(line) for line in lines]
+            self.assertEqual(len(packets), 3)
+            self.assertTrue(all(isinstance(packet, Ok) for packet in packets))
+            self.assertEqual([packet.value.parsed_chunk.text for packet in packets], ["line 0", "line 1", "line 2"])
+            self.assertEqual([packet.value.outgoing for packet in packets], [True, False, False])
+
+    def test_record_in_effects(self):
+        """Check that recording happens in side effects, leaving state projection pure"""
+        recorder = MinOSSuiteRecorder(1000, 2, 0, "start")
+        state = SimpleNamespace(result_recorder=recorder)
+        app = EngineMonitorMinOSApp()
+        self.assertIs(app.state_project(state, GoodChunkReceived(TextChunk("one"))), state)
+        self.assertEqual(recorder.incoming, 0)
+
+        EngineMonitorMinOSApp.record(recorder, GoodChunkReceived(TextChunk("one")))
+        EngineMonitorMinOSApp.record(recorder, SendingParsedChunk(IndexedButtonChunk(1)))
+        self.assertEqual((recorder.incoming, recorder.outgoing), (1, 1))
+        self.assertEqual(
+            [packet.parsed_chunk for packet in recorder.suite().chunks], [TextChunk("one"), IndexedButtonChunk(1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Module for replaying outgoing MinOS suite packets on schedule"""
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import List, Callable, Awaitable
+from result import Result, Err, Ok
+from src.domain.death import Death
+from src.domain.dip_client_error import DIPClientError, GenericClientError
+from src.domain.minos_chunks import ParsedChunk
+from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket, MinOSReplayReport
+
+
+@dataclass(frozen=True)
+class MinOSReplayConfig:
+    """Configurations for MinOS suite replay, speed above 1 sends packets sooner than specified"""
+    speed: float = 1.0
+
+    @staticmethod
+    def build(speed: float) -> Result['MinOSReplayConfig', DIPClientError]:
+        if not math.isfinite(speed) or speed <= 0:
+            return Err(GenericClientError("MinOS replay speed must be a positive number"))
+        return Ok(MinOSReplayConfig(speed))
+
+
+@dataclass
+class MinOSReplayScheduler:
+    """Sends outgoing packets in order of sent_at, waiting on a single timer at a time
+
+    Packets are scheduled against a monotonic clock from replay start, so a
+    late packet doesn't delay the ones after it, and all packets already due are sent at once.
+    """
+    packets: List[MinOSSuitePacket]
+    config: MinOSReplayConfig = MinOSReplayConfig()
+    jitter_ms: List[float] = field(default_factory=list)
+
+    @staticmethod
+    def of(suite: MinOSSuite, config: MinOSReplayConfig) -> 'MinOSReplayScheduler':
+        outgoing = [packet for packet in suite.chunks if packet.outgoing]
+        return MinOSReplayScheduler(sorted(outgoing, key=lambda packet: packet.sent_at), config)
+
+    async def run(self, death: Death, send: Callable[[ParsedChunk], Awaitable]):
+        start = time.monotonic()
+        for packet in self.packets:
+            due = start + packet.sent_at / 1000 / self.config.speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                death_or_timeout = await death.or_awaitable(asyncio.sleep(delay))
+                if isinstance(death_or_timeout, Err):
+                    return
+            elif death.gracing:
+                return
+            self.jitter_ms.append((time.monotonic() - due) * 1000)
+            await send(packet.parsed_chunk)
+
+    def report(self) -> MinOSReplayReport:
+        return MinOSReplayReport(self.config.speed, list(self.jitter_ms))
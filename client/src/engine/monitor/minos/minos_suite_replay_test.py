@@ -0,0 +1,74 @@
+import asyncio
+import time
+import unittest
+
+from result import Err
+from src.domain.death import Death
+from src.domain.minos_chunks import TextChunk, IndexedButtonChunk
+from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
+from src.engine.monitor.minos.minos_suite_replay import MinOSReplayConfig, MinOSReplayScheduler
+from src.protocol.s11n_json import COMMON_MINOS_SUITE_ENCODER_JSON
+
+
+def suite() -> MinOSSuite:
+    return MinOSSuite([
+        MinOSSuitePacket(TextChunk("third"), 200, "", True),
+        MinOSSuitePacket(TextChunk("incoming"), 50, "", False),
+        MinOSSuitePacket(TextChunk("first"), 0, "", True),
+        MinOSSuitePacket(IndexedButtonChunk(2), 100, "", True),
+    ], 1000, 1, 0, "")
+
+
+class TestMinOSSuiteReplay(unittest.TestCase):
+    def test_config(self):
+        self.assertIsInstance(MinOSReplayConfig.build(0), Err)
+        self.assertIsInstance(MinOSReplayConfig.build(float("inf")), Err)
+        self.assertEqual(MinOSReplayConfig.build(2.5).value, MinOSReplayConfig(2.5))
+
+    def test_replay(self):
+        """Check that outgoing packets are sent in order, on time, accelerated by speed"""
+        scheduler = MinOSReplayScheduler.of(suite(), MinOSReplayConfig(2))
+
+        async def scenario():
+            sent = []
+            start = time.monotonic()
+
+            async def send(parsed_chunk):
+                sent.append((parsed_chunk, time.monotonic() - start))
+
+            await scheduler.run(Death(), send)
+            return sent
+
+        sent = asyncio.run(scenario())
+        self.assertEqual([chunk for chunk, _ in sent], [TextChunk("first"), IndexedButtonChunk(2), TextChunk("third")])
+        self.assertGreaterEqual(sent[1][1], 0.05)
+        self.assertGreaterEqual(sent[2][1], 0.1)
+        self.assertLess(sent[2][1], 0.2)
+
+        report = scheduler.report()
+        self.assertEqual(len(report.jitter_ms), 3)
+        self.assertTrue(all(jitter >= 0 for jitter in report.jitter_ms))
+        encoded = COMMON_MINOS_SUITE_ENCODER_JSON.json_encode(MinOSSuite([], 1000, 1, 0, "", report))
+        self.assertEqual(encoded["replay"]["speed"], 2)
+        self.assertEqual(len(encoded["replay"]["jitterMs"]), 3)
+
+    def test_replay_death(self):
+        """Check that replay stops on death"""
+        scheduler = MinOSReplayScheduler.of(suite(), MinOSReplayConfig())
+
+        async def scenario():
+            sent = []
+            death = Death()
+
+            async def send(parsed_chunk):
+                sent.append(parsed_chunk)
+
+            asyncio.get_event_loop().call_later(0.05, death.grace)
+            await scheduler.run(death, send)
+            return sent
+
+        self.assertEqual(asyncio.run(scenario()), [TextChunk("first")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,11 @@
 """Video Stream engine functionality."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 from result import Result
 from src.domain.dip_client_error import DIPClientError
 from src.domain.hardware_video_message import COMMON_INCOMING_VIDEO_MESSAGE, COMMON_OUTGOING_VIDEO_MESSAGE, \
     HardwareVideoMessage, log_video_message, InternalStartLifecycle, InternalEndLifecycle
-from src.engine.engine import Engine
+from src.engine.engine import Engine, EngineDispatcher
 from src.engine.engine_auth import EngineAuth
 from src.engine.engine_lifecycle import EngineLifecycle
 from src.engine.engine_ping import EnginePing
@@ -30,6 +30,12 @@ class EngineVideo(Engine[
     engine_ping: EnginePing
     engine_video_stream: EngineVideoStream
     engine_auth: EngineAuth
+    dispatcher: EngineDispatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.dispatcher = EngineDispatcher.of(
+            [self.engine_lifecycle, self.engine_video_stream, self.engine_auth],
+            [self.engine_lifecycle, self.engine_video_stream, self.engine_ping, self.engine_auth])
 
     async def start(self):
         await self.state.base.incoming_message_queue.put(InternalStartLifecycle())
@@ -48,22 +54,12 @@ class EngineVideo(Engine[
         previous_state: EngineVideoState,
         message: COMMON_INCOMING_VIDEO_MESSAGE
     ) -> Result[List[COMMON_ENGINE_EVENT], DIPClientError]:
-        return self.multi_message_project([
-            self.engine_lifecycle.handle_message,
-            self.engine_video_stream.handle_message,
-            self.engine_auth.handle_message,
-        ], previous_state, message)
+        return self.dispatcher.message_project(previous_state, message)
 
     def state_project(self, previous_state: EngineVideoState, event: COMMON_ENGINE_EVENT) -> EngineVideoState:
         stream_state = self.engine_video_stream.state_project(previous_state, event)
         return stream_state
 
     async def effect_project(self, previous_state: EngineVideoState, event: COMMON_ENGINE_EVENT):
-        projections = [
-            self.engine_lifecycle.effect_project,
-            self.engine_video_stream.effect_project,
-            self.engine_ping.effect_project,
-            self.engine_auth.effect_project,
-        ]
-        return await Engine.multi_effect_project(projections, previous_state, event)
+        return await self.dispatcher.effect_project(previous_state, event)
 
@@ -3,7 +3,7 @@
 import asyncio
 import dataclasses
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple, ClassVar
 from result import Result, Ok, Err
 from src.domain.death import Death
 from src.domain.dip_client_error import DIPClientError, GenericClientError
@@ -12,8 +12,8 @@ from src.domain.hardware_video_message import COMMON_INCOMING_VIDEO_MESSAGE, Cam
     StreamSpawnSuccess, FinishedEndingStream, StopBroadcasting, CameraUnavailable, CameraChunk
 from src.engine.engine_state import EngineBase
 from src.domain.hardware_video_event import COMMON_ENGINE_EVENT, StartedStream, StartingVideoStream, EndedStream, \
-    EndingStream, ReceivedChunk
-from src.service.managed_video_stream import VideoStreamConfig, ManagedVideoStream
+    EndingStream, ReceivedChunk, JoiningVideoStream
+from src.service.managed_video_stream import VideoStreamConfig, ManagedVideoStream, VideoRelayConfig
 
 
 class EngineVideoStreamState:
@@ -25,6 +25,13 @@ class EngineVideoStreamState:
 
 @dataclass
 class EngineVideoStream:
+    HANDLED_MESSAGES: ClassVar[Tuple[type, ...]] = (
+        CameraSubscription, StreamSpawnSuccess, CameraChunk, StreamSpawnFailure, StopBroadcasting,
+        FinishedEndingStream)
+    HANDLED_EVENTS: ClassVar[Tuple[type, ...]] = (
+        StartingVideoStream, JoiningVideoStream, EndingStream, LifecycleEnded, StartedStream, ReceivedChunk)
+
+    relay_config: Optional[VideoRelayConfig] = None
 
     @staticmethod
     def handle_message(
@@ -32,6 +39,8 @@ class EngineVideoStream:
         message: COMMON_INCOMING_VIDEO_MESSAGE
     ) -> Result[List[COMMON_ENGINE_EVENT], DIPClientError]:
         if isinstance(message, CameraSubscription):
+            if previous_state.stream is not None:
+                return Ok([JoiningVideoStream(previous_state.initial_stream_config)])
             return Ok([StartingVideoStream(previous_state.initial_stream_config)])
         elif isinstance(message, StreamSpawnSuccess):
             return Ok([StartedStream(message.stream, Death())])
@@ -57,12 +66,19 @@ class EngineVideoStream:
     async def read_chunk(stream: ManagedVideoStream) -> Result[bytes, DIPClientError]:
         return await stream.read_chunk()
 
+    @staticmethod
+    async def read_available(stream: ManagedVideoStream, max_size: int) -> Result[bytes, DIPClientError]:
+        return await stream.read_available(max_size)
+
     async def stream_until_death(
         self,
         previous_state: EngineVideoStreamState,
         stream: ManagedVideoStream,
         stream_death: Death
     ):
+        if self.relay_config is not None:
+            return await self.relay_until_death(previous_state, stream, stream_death, self.relay_config)
+
         in_queue = previous_state.base.incoming_message_queue
         engine_death = previous_state.base.death
         while not engine_death.gracing and not stream_death.gracing:
@@ -88,23 +104,65 @@ class EngineVideoStream:
             if received_bytes is not None and len(received_bytes) > 0:
                 await in_queue.put(CameraChunk(received_bytes))
 
+    async def relay_until_death(
+        self,
+        previous_state: EngineVideoStreamState,
+        stream: ManagedVideoStream,
+        stream_death: Death,
+        relay_config: VideoRelayConfig
+    ):
+        """Relay stream bytes directly to outgoing queue, bypassing engine events"""
+        in_queue = previous_state.base.incoming_message_queue
+        out_queue = previous_state.base.outgoing_message_queue
+        engine_death = previous_state.base.death
+        while not engine_death.gracing and not stream_death.gracing:
+            # Wait for websocket to catch up, if too many bytes are in flight
+            if out_queue.queued_bytes >= relay_config.max_in_flight_bytes:
+                death_or_death_or_drained = await engine_death.or_awaitable(
+                    stream_death.or_awaitable(out_queue.wait_queued_bytes_below(relay_config.max_in_flight_bytes)))
+                if isinstance(death_or_death_or_drained, Err) or isinstance(death_or_death_or_drained.value, Err):
+                    return
+
+            # Read all buffered stream bytes
+            death_or_death_or_result = await engine_death.or_awaitable(
+                stream_death.or_awaitable(self.read_available(stream, relay_config.max_chunk_bytes)))
+
+            # Handle potential death (and stop receiving)
+            if isinstance(death_or_death_or_result, Err) or isinstance(death_or_death_or_result.value, Err):
+                return
+            chunk_result = death_or_death_or_result.value.value
+
+            # Handle video stream chunk read failure (and stop receiving)
+            if isinstance(chunk_result, Err):
+                await in_queue.put(CameraUnavailable(chunk_result.value))
+                return
+
+            # Send chunk as is
+            await out_queue.put(CameraChunk(chunk_result.value))
+
     async def spawn_stream(self, config: VideoStreamConfig) -> Result[ManagedVideoStream, DIPClientError]:
         return await ManagedVideoStream.spawn_stream(config)
 
+    async def restart_stream(self, previous_state: EngineVideoStreamState, config: VideoStreamConfig):
+        # Kill old stream
+        if previous_state.stream_death is not None:
+            previous_state.stream_death.grace(GenericClientError("New subscriber, new stream"))
+        if previous_state.stream is not None:
+            await previous_state.stream.end()
+        # Start new stream
+        stream_result = await self.spawn_stream(config)
+        if isinstance(stream_result, Err):
+            await previous_state.base.outgoing_message_queue.put(CameraUnavailable(stream_result.value))
+            await previous_state.base.incoming_message_queue.put(StreamSpawnFailure(stream_result.value))
+        else:
+            await previous_state.base.incoming_message_queue.put(StreamSpawnSuccess(stream_result.value))
+
     async def effect_project(self, previous_state: EngineVideoStreamState, event: COMMON_ENGINE_EVENT):
         if isinstance(event, StartingVideoStream):
-            # Kill old stream
-            if previous_state.stream_death is not None:
-                previous_state.stream_death.grace(GenericClientError("New subscriber, new stream"))
-            if previous_state.stream is not None:
-                await previous_state.stream.end()
-            # Start new stream
-            stream_result = await self.spawn_stream(event.config)
-            if isinstance(stream_result, Err):
-                await previous_state.base.outgoing_message_queue.put(CameraUnavailable(stream_result.value))
-                await previous_state.base.incoming_message_queue.put(StreamSpawnFailure(stream_result.value))
-            else:
-                await previous_state.base.incoming_message_queue.put(StreamSpawnSuccess(stream_result.value))
+            await self.restart_stream(previous_state, event.config)
+        elif isinstance(event, JoiningVideoStream):
+            # Keep streaming, server sends the joiner its cached stream header before any further chunks
+            pass
         elif isinstance(event, EndingStream):
             if previous_state.stream is not None:
                 await previous_state.stream.end()
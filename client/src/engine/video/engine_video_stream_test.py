@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+from result import Ok
+from src.domain.death import Death
+from src.domain.hardware_video_event import JoiningVideoStream, ReceivedChunk, StartingVideoStream
+from src.domain.hardware_video_message import CameraSubscription, CameraChunk, StreamSpawnSuccess
+from src.engine.engine_state import EngineBase, ManagedQueue
+from src.engine.video.engine_video_stream import EngineVideoStream
+from src.service.managed_url import ManagedURL
+from src.service.managed_video_stream import ExistingStreamConfig, VideoRelayConfig
+
+
+@dataclass
+class FakeStream:
+    """Video stream, which only remembers being ended"""
+    name: str
+    ended: bool = False
+
+    async def end(self):
+        self.ended = True
+
+
+@dataclass
+class FakeStreamState:
+    base: EngineBase
+    initial_stream_config: ExistingStreamConfig
+    stream: Optional[FakeStream]
+    stream_death: Death
+
+
+class TestEngineVideoStream(unittest.IsolatedAsyncioTestCase):
+    """Test suite for video stream shared between camera subscribers"""
+
+    async def build(self):
+        sent: List = []
+        spawned: List[FakeStream] = []
+        base = await EngineBase.build(ManagedQueue.build(sent.append))
+        config = ExistingStreamConfig(ManagedURL.build("http://localhost:8080/webcam.ogg").value)
+        state = FakeStreamState(base, config, FakeStream("first"), Death())
+        engine = EngineVideoStream()
+
+        async def spawn_stream(_):
+            spawned.append(FakeStream("second"))
+            return Ok(spawned[-1])
+        engine.spawn_stream = spawn_stream
+        return engine, state, sent, spawned
+
+    async def test_join_watched_stream(self):
+        """Check that second viewer shares the running stream, instead of restarting it for everyone"""
+        engine, state, sent, spawned = await self.build()
+        await engine.effect_project(state, ReceivedChunk(b"header-and-frames"))
+        self.assertEqual(sent, [CameraChunk(b"header-and-frames")])
+
+        events = EngineVideoStream.handle_message(state, CameraSubscription()).value
+        self.assertEqual(events, [JoiningVideoStream(state.initial_stream_config)])
+        await engine.effect_project(state, events[0])
+        await engine.effect_project(state, ReceivedChunk(b"frames"))
+
+        # Server replays cached header to the joiner, so nothing old is sent again
+        self.assertEqual(sent, [CameraChunk(b"header-and-frames"), CameraChunk(b"frames")])
+        self.assertFalse(state.stream.ended)
+        self.assertFalse(state.stream_death.gracing)
+        self.assertEqual(spawned, [])
+        self.assertTrue(state.base.incoming_message_queue.queue.empty())
+
+    async def test_start_stream(self):
+        """Check that first viewer spawns a stream"""
+        engine, state, _, spawned = await self.build()
+        state.stream = None
+        events = EngineVideoStream.handle_message(state, CameraSubscription()).value
+        self.assertEqual(events, [StartingVideoStream(state.initial_stream_config)])
+        await engine.effect_project(state, events[0])
+        self.assertEqual(len(spawned), 1)
+        self.assertEqual(state.base.incoming_message_queue.queue.get_nowait(), StreamSpawnSuccess(spawned[0]))
+
+    async def test_relay(self):
+        """Check that relayed bytes go straight to outgoing queue, pausing while too many are in flight"""
+        engine, state, sent, _ = await self.build()
+        engine.relay_config = VideoRelayConfig(max_chunk_bytes=4, max_in_flight_bytes=4)
+        reads = [Ok(b"abcd"), Ok(b"ef")]
+
+        async def read_available(_, max_size):
+            if len(reads) == 0:
+                await asyncio.sleep(10)
+            return reads.pop(0)
+        engine.read_available = read_available
+        relay = asyncio.create_task(engine.stream_until_death(state, state.stream, state.stream_death))
+
+        # First chunk fills in-flight budget, so relay waits until it's taken
+        await asyncio.sleep(0.01)
+        self.assertEqual(sent, [CameraChunk(b"abcd")])
+        self.assertEqual(await state.base.outgoing_message_queue.get(), CameraChunk(b"abcd"))
+        await asyncio.sleep(0.01)
+        self.assertEqual(sent, [CameraChunk(b"abcd"), CameraChunk(b"ef")])
+        self.assertTrue(state.base.incoming_message_queue.queue.empty())
+
+        state.stream_death.grace()
+        await relay
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Module for buffered hex dump rendering of serial monitor bytes"""
+import asyncio
+import sys
+from dataclasses import dataclass, field
+from typing import BinaryIO, Tuple
+from src.domain.death import Death
+
+# Rendered byte for every possible byte value
+HEX_RENDER_TABLE: Tuple[bytes, ...] = tuple(f"[{hex(n)}] ".encode() for n in range(256))
+# Printable ASCII characters are kept in xxd style dumps, others replaced with dots
+XXD_ASCII_TABLE: bytes = bytes(n if 0x20 <= n < 0x7f else ord(".") for n in range(256))
+XXD_LINE_BYTES = 16
+
+
+@dataclass(frozen=True)
+class HexRenderConfig:
+    """Configurations for hexbytes monitor rendering"""
+    xxd: bool = False
+    flush_ms: int = 50
+    max_lag_bytes: int = 65536
+
+
+@dataclass
+class HexRenderer:
+    """Collects received bytes and writes them out as hex once per flush interval
+
+    If more than config.max_lag_bytes are waiting to be written, the oldest ones are
+    skipped and a summary of skipped bytes is written instead, so that output doesn't
+    fall behind the serial stream.
+    """
+    config: HexRenderConfig = HexRenderConfig()
+    output: BinaryIO = field(default_factory=lambda: sys.stdout.buffer)
+    pending: bytearray = field(default_factory=bytearray)
+    offset: int = 0
+    skipped: int = 0
+    total_skipped: int = 0
+    flushes: int = 0
+
+    def add(self, content: bytes):
+        self.pending += content
+        excess = len(self.pending) - self.config.max_lag_bytes
+        if excess > 0:
+            del self.pending[:excess]
+            self.offset += excess
+            self.skipped += excess
+            self.total_skipped += excess
+
+    @staticmethod
+    def format_plain(content: bytes) -> bytes:
+        return b"".join(map(HEX_RENDER_TABLE.__getitem__, content))
+
+    @staticmethod
+    def format_xxd(content: bytes, offset: int) -> bytes:
+        lines = []
+        for start in range(0, len(content), XXD_LINE_BYTES):
+            line = content[start:start + XXD_LINE_BYTES]
+            hex_columns = line.hex(" ", -2) if len(line) > 0 else ""
+            ascii_column = line.translate(XXD_ASCII_TABLE).decode("ascii")
+            lines.append(f"{offset + start:08x}: {hex_columns:<39}  {ascii_column}\n")
+        return "".join(lines).encode()
+
+    def render(self) -> bytes:
+        """Formatted pending bytes, preceded by skipped byte summary if any were skipped"""
+        content = bytes(self.pending)
+        summary = b""
+        if self.skipped > 0:
+            summary = f"\n[skipped {self.skipped} bytes to keep up with serial stream]\n".encode()
+            self.skipped = 0
+        self.pending.clear()
+        if self.config.xxd:
+            rendered = self.format_xxd(content, self.offset)
+        else:
+            rendered = self.format_plain(content)
+        self.offset += len(content)
+        return summary + rendered
+
+    def flush(self):
+        if len(self.pending) == 0 and self.skipped == 0: return
+        self.output.write(self.render())
+        self.output.flush()
+        self.flushes += 1
+
+    async def loop(self, death: Death):
+        while not death.gracing:
+            await asyncio.sleep(self.config.flush_ms / 1000)
+            self.flush()
+        self.flush()
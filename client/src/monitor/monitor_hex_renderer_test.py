@@ -0,0 +1,42 @@
+import io
+import unittest
+
+from src.monitor.monitor_hex_renderer import HexRenderer, HexRenderConfig
+
+
+class TestHexRenderer(unittest.TestCase):
+    def test_plain(self):
+        """Check that plain rendering matches per-byte rendering and is written once per flush"""
+        output = io.BytesIO()
+        renderer = HexRenderer(HexRenderConfig(), output)
+        renderer.add(b'\x00\x0a')
+        renderer.add(b'\xff')
+        renderer.flush()
+        renderer.flush()
+
+        self.assertEqual(output.getvalue(), b"[0x0] [0xa] [0xff] ")
+        self.assertEqual(renderer.flushes, 1)
+
+    def test_xxd(self):
+        output = io.BytesIO()
+        renderer = HexRenderer(HexRenderConfig(xxd=True), output)
+        renderer.add(b'Hello, world!\n\x00\x01\x02')
+        renderer.flush()
+        renderer.add(b'A')
+        renderer.flush()
+
+        self.assertEqual(output.getvalue().decode(), (
+            "00000000: 4865 6c6c 6f2c 2077 6f72 6c64 210a 0001  Hello, world!...\n"
+            "00000010: 02                                       .\n"
+            "00000011: 41                                       A\n"))
+
+    def test_lag_summary(self):
+        """Check that the oldest bytes are skipped and summarized when output falls behind"""
+        output = io.BytesIO()
+        renderer = HexRenderer(HexRenderConfig(max_lag_bytes=2), output)
+        renderer.add(b'\x01\x02')
+        renderer.add(b'\x03\x04\x05')
+        renderer.flush()
+
+        self.assertEqual(output.getvalue(), b"\n[skipped 3 bytes to keep up with serial stream]\n[0x4] [0x5] ")
+        self.assertEqual((renderer.offset, renderer.total_skipped), (5, 3))
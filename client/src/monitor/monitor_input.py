@@ -0,0 +1,66 @@
+"""Module for batching serial monitor input from stdin & files before sending it to board"""
+import asyncio
+import time
+from asyncio import StreamReader
+from dataclasses import dataclass
+from typing import Optional, Callable, Awaitable
+from src.domain.death import Death
+
+# Bits on wire per byte, i.e. start bit, 8 data bits, stop bit
+SERIAL_BITS_PER_BYTE = 10
+
+
+@dataclass(frozen=True)
+class MonitorInputConfig:
+    """Configurations for serial monitor input batching & file sending"""
+    batch_ms: int = 5
+    max_batch_bytes: int = 4096
+    send_file: Optional[str] = None
+    send_baudrate: int = 115200
+
+
+async def read_batch(reader: StreamReader, config: MonitorInputConfig) -> bytes:
+    """Wait for input and return it together with everything else arriving within config.batch_ms
+
+    Single keystrokes are sent after at most config.batch_ms, while pasted text
+    is sent in frames of up to config.max_batch_bytes.
+    """
+    batch = await reader.read(config.max_batch_bytes)
+    if len(batch) == 0:
+        return batch
+    deadline = time.monotonic() + config.batch_ms / 1000
+    while len(batch) < config.max_batch_bytes:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            break
+        try:
+            more = await asyncio.wait_for(reader.read(config.max_batch_bytes - len(batch)), timeout)
+        except asyncio.TimeoutError:
+            break
+        if len(more) == 0:
+            break
+        batch += more
+    return batch
+
+
+async def send_file_paced(
+    death: Death,
+    content: bytes,
+    baudrate: int,
+    send: Callable[[bytes], Awaitable],
+    chunk_ms: int = 50
+) -> int:
+    """Send content in chunks no faster than the serial line can carry it, return sent byte count"""
+    bytes_per_second = baudrate / SERIAL_BITS_PER_BYTE
+    chunk_size = max(1, int(bytes_per_second * chunk_ms / 1000))
+    start = time.monotonic()
+    sent = 0
+    while sent < len(content) and not death.gracing:
+        chunk = content[sent:sent + chunk_size]
+        await send(chunk)
+        sent += len(chunk)
+        # Pace against the start time, so that slow sends don't accumulate drift
+        delay = start + sent / bytes_per_second - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    return sent
@@ -0,0 +1,40 @@
+import asyncio
+import time
+import unittest
+
+from src.domain.death import Death
+from src.monitor.monitor_input import MonitorInputConfig, read_batch, send_file_paced
+
+
+class TestMonitorInput(unittest.TestCase):
+    def test_read_batch(self):
+        """Check that pasted input is read as one batch, which is capped by size"""
+        async def scenario():
+            reader = asyncio.StreamReader()
+            config = MonitorInputConfig(batch_ms=20, max_batch_bytes=6)
+            reader.feed_data(b"abc")
+            asyncio.get_event_loop().call_later(0.005, reader.feed_data, b"defgh")
+            first = await read_batch(reader, config)
+            second = await read_batch(reader, config)
+            reader.feed_eof()
+            third = await read_batch(reader, config)
+            return first, second, third
+
+        self.assertEqual(asyncio.run(scenario()), (b"abcdef", b"gh", b""))
+
+    def test_send_file_paced(self):
+        """Check that file is sent whole in chunks at the pace of the baudrate"""
+        async def scenario():
+            chunks = []
+
+            async def send(chunk: bytes):
+                chunks.append(chunk)
+
+            start = time.monotonic()
+            sent = await send_file_paced(Death(), bytes(300), 10000, send, chunk_ms=50)
+            return sent, chunks, time.monotonic() - start
+
+        sent, chunks, elapsed = asyncio.run(scenario())
+        self.assertEqual(sent, 300)
+        self.assertEqual([len(chunk) for chunk in chunks], [50] * 6)
+        self.assertGreaterEqual(elapsed, 0.29)
@@ -0,0 +1,75 @@
+"""Module for coalescing received LED bytes into frames rendered at a bounded rate"""
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional, List, Callable
+from src.domain.death import Death
+from src.domain.fancy_byte import FancyByte, BITS_TABLE
+
+
+@dataclass(frozen=True)
+class LEDRenderConfig:
+    """Configurations for LED monitor rendering"""
+    fps: int = 30
+    persistence: bool = False
+
+
+@dataclass
+class LEDFrame:
+    """LED state received within one frame window
+
+    Without persistence only the last received byte is kept, with persistence
+    the count of bytes having each LED on is kept too, to show duty-cycle brightness.
+    """
+    persistence: bool = False
+    last_byte: Optional[FancyByte] = None
+    byte_count: int = 0
+    on_counts: List[int] = field(default_factory=lambda: [0] * 8)
+
+    def add(self, content: bytes):
+        if len(content) == 0: return
+        self.last_byte = FancyByte(content[-1])
+        self.byte_count += len(content)
+        if self.persistence:
+            on_counts = self.on_counts
+            for value, count in Counter(content).items():
+                for index, is_on in enumerate(BITS_TABLE[value]):
+                    if is_on:
+                        on_counts[index] += count
+
+    def duty_cycles(self) -> List[float]:
+        """Fraction of frame bytes in which each LED was on, from the most significant bit"""
+        if self.byte_count == 0:
+            return [0.0] * 8
+        return [on_count / self.byte_count for on_count in self.on_counts]
+
+
+@dataclass
+class LEDFrameScheduler:
+    """Collects received bytes and passes them to renderer at most config.fps times per second"""
+    config: LEDRenderConfig = LEDRenderConfig()
+    frame: Optional[LEDFrame] = None
+    frames: int = 0
+    coalesced_bytes: int = 0
+
+    def add(self, content: bytes):
+        if self.frame is None:
+            self.frame = LEDFrame(self.config.persistence)
+        self.frame.add(content)
+
+    def take(self) -> Optional[LEDFrame]:
+        """Frame collected since last call, if any bytes were received"""
+        frame = self.frame
+        self.frame = None
+        if frame is None or frame.byte_count == 0:
+            return None
+        self.frames += 1
+        self.coalesced_bytes += frame.byte_count - 1
+        return frame
+
+    async def loop(self, death: Death, render: Callable[[LEDFrame], None]):
+        while not death.gracing:
+            await asyncio.sleep(1 / self.config.fps)
+            frame = self.take()
+            if frame is not None:
+                render(frame)
@@ -0,0 +1,30 @@
+import unittest
+
+from src.domain.fancy_byte import FancyByte
+from src.monitor.monitor_led_frame import LEDFrameScheduler, LEDRenderConfig
+
+
+class TestLEDFrame(unittest.TestCase):
+    def test_last_state(self):
+        """Check that a frame keeps only the last received LED state"""
+        scheduler = LEDFrameScheduler(LEDRenderConfig(fps=30))
+        self.assertIsNone(scheduler.take())
+        scheduler.add(b'\x01\x02')
+        scheduler.add(b'')
+        scheduler.add(b'\x03\x81')
+
+        frame = scheduler.take()
+        self.assertEqual(frame.last_byte, FancyByte(0x81))
+        self.assertEqual(frame.byte_count, 4)
+        self.assertEqual(frame.on_counts, [0] * 8)
+        self.assertIsNone(scheduler.take())
+        self.assertEqual((scheduler.frames, scheduler.coalesced_bytes), (1, 3))
+
+    def test_persistence(self):
+        """Check that persistence counts the duty cycle of every LED within a frame"""
+        scheduler = LEDFrameScheduler(LEDRenderConfig(fps=30, persistence=True))
+        scheduler.add(b'\x80\x80\x81\x01')
+
+        frame = scheduler.take()
+        self.assertEqual(frame.last_byte, FancyByte(0x01))
+        self.assertEqual(frame.duty_cycles(), [0.75, 0, 0, 0, 0, 0, 0, 0.5])
@@ -0,0 +1,199 @@
+"""Module for running many MinOS suites headlessly across a pool of boards"""
+import asyncio
+import json
+import os
+import signal
+import time
+from asyncio import Task
+from dataclasses import dataclass, field, asdict
+from functools import partial
+from typing import List, Optional, Callable, Any
+from result import Result, Err, Ok
+from src.domain.death import Death
+from src.domain.dip_client_error import DIPClientError, GenericClientError, NotAnError
+from src.domain.dip_runnable import DIPRunnable
+from src.domain.managed_uuid import ManagedUUID
+from src.engine.monitor.minos.minos_suite import MinOSSuite
+from src.protocol.s11n_json import COMMON_MINOS_SUITE_DECODER_JSON
+
+SUMMARY_FILE_NAME = "summary.json"
+# Time given to running suites to end on their own after a kill signal, before they're cancelled
+SUITE_KILL_TIMEOUT_SECONDS = 5
+
+
+@dataclass
+class MinOSSuiteSpec:
+    """MinOS suite named by its spec file"""
+    name: str
+    suite: MinOSSuite
+
+
+@dataclass
+class MinOSSuiteRun:
+    """Outcome of running a single suite"""
+    name: str
+    hardware_id: str
+    seconds: float
+    packets: int = 0
+    incoming_packets: int = 0
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class MinOSSuiteRunSummary:
+    """Aggregate outcome of running all suites"""
+    suites: int
+    succeeded: int
+    failed: int
+    timeouts: int
+    concurrency: int
+    wall_seconds: float
+    packets: int
+    packets_per_second: float
+    interrupted: bool
+    runs: List[MinOSSuiteRun]
+
+
+def load_suite_specs(spec_dir: str) -> Result[List[MinOSSuiteSpec], DIPClientError]:
+    """Decode every JSON suite spec in directory, in order of file names"""
+    try:
+        file_names = sorted(name for name in os.listdir(spec_dir) if name.endswith(".json"))
+    except OSError as e:
+        return Err(GenericClientError(f"Failed to list MinOS spec directory: {e}"))
+    specs = []
+    for file_name in file_names:
+        try:
+            with open(os.path.join(spec_dir, file_name)) as f:
+                content = f.read()
+        except OSError as e:
+            return Err(GenericClientError(f"Failed to read MinOS spec '{file_name}': {e}"))
+        suite_result = COMMON_MINOS_SUITE_DECODER_JSON.decode(content)
+        if isinstance(suite_result, Err):
+            return Err(GenericClientError(f"Failed to decode MinOS spec '{file_name}': {suite_result.value}"))
+        specs.append(MinOSSuiteSpec(file_name[:-len(".json")], suite_result.value))
+    if not specs:
+        return Err(GenericClientError(f"MinOS spec directory '{spec_dir}' has no JSON specs"))
+    return Ok(specs)
+
+
+def suite_run_of(spec: MinOSSuiteSpec, hardware_id: ManagedUUID, seconds: float, outcome: Optional[DIPClientError]):
+    """Summarize suite result, a suite which received less packets than expected has timed out"""
+    run = MinOSSuiteRun(spec.name, str(hardware_id.value), round(seconds, 3))
+    if not isinstance(outcome, NotAnError):
+        run.error = outcome.text() if outcome is not None else "MinOS suite finished without a result"
+        return run
+    packets = outcome.success_value.get("chunks", []) if isinstance(outcome.success_value, dict) else []
+    run.packets = len(packets)
+    run.incoming_packets = len([packet for packet in packets if not packet.get("outgoing")])
+    run.timed_out = 0 <= spec.suite.treshold_chunks and run.incoming_packets < spec.suite.treshold_chunks
+    return run
+
+
+@dataclass
+class MinOSSuiteRunner(DIPRunnable):
+    """Runs suites concurrently in one event loop, each board running one suite at a time
+
+    Every suite result is written to output directory as '<spec name>.json',
+    aggregate timing is written to 'summary.json' and also returned as the run result.
+    Kill signals are handled by the runner, not by the monitors it runs, runner
+    death is passed to monitors instead. Once it dies, no new suites are started,
+    suites still running after SUITE_KILL_TIMEOUT_SECONDS are cancelled and the
+    summary is written for suites run so far.
+    """
+    specs: List[MinOSSuiteSpec]
+    hardware_ids: List[ManagedUUID]
+    concurrency: int
+    output_dir: str
+    monitor_for: Callable[[ManagedUUID, MinOSSuite, Death], Result[DIPRunnable, DIPClientError]]
+    runs: List[MinOSSuiteRun] = field(default_factory=list)
+    death: Death = field(default_factory=Death)
+
+    def write_json(self, file_name: str, value: Any):
+        with open(os.path.join(self.output_dir, file_name), "w") as f:
+            json.dump(value, f, indent=2)
+            f.write("\n")
+
+    def record(self, spec: MinOSSuiteSpec, hardware_id: ManagedUUID, start: float, outcome: Optional[DIPClientError]):
+        run = suite_run_of(spec, hardware_id, time.monotonic() - start, outcome)
+        if isinstance(outcome, NotAnError):
+            self.write_json(f"{spec.name}.json", outcome.success_value)
+        else:
+            self.write_json(f"{spec.name}.json", {"error": run.error})
+        self.runs.append(run)
+
+    async def run_suite(self, spec: MinOSSuiteSpec, hardware_id: ManagedUUID):
+        start = time.monotonic()
+        monitor_result = self.monitor_for(hardware_id, spec.suite, self.death)
+        if isinstance(monitor_result, Err):
+            outcome = monitor_result.value
+        else:
+            try:
+                outcome = await monitor_result.value.run()
+            except asyncio.CancelledError:
+                self.record(spec, hardware_id, start, GenericClientError("MinOS suite cancelled"))
+                raise
+            except Exception as e:
+                outcome = GenericClientError(f"MinOS suite crashed: {e}")
+        self.record(spec, hardware_id, start, outcome)
+
+    async def worker(self, hardware_id: ManagedUUID, pending: asyncio.Queue):
+        while not pending.empty() and not self.death.gracing:
+            await self.run_suite(pending.get_nowait(), hardware_id)
+
+    async def cancel_on_death(self, workers: List[Task]):
+        await self.death.wait()
+        _, running = await asyncio.wait(workers, timeout=SUITE_KILL_TIMEOUT_SECONDS)
+        for worker in running:
+            worker.cancel()
+
+    def summary(self, wall_seconds: float) -> MinOSSuiteRunSummary:
+        runs = sorted(self.runs, key=lambda run: run.name)
+        failed = len([run for run in runs if run.error is not None])
+        packets = sum(run.packets for run in runs)
+        return MinOSSuiteRunSummary(
+            suites=len(runs),
+            succeeded=len(runs) - failed,
+            failed=failed,
+            timeouts=len([run for run in runs if run.timed_out]),
+            concurrency=self.worker_count(),
+            wall_seconds=round(wall_seconds, 3),
+            packets=packets,
+            packets_per_second=round(packets / wall_seconds, 3) if wall_seconds > 0 else 0,
+            interrupted=self.death.gracing,
+            runs=runs)
+
+    def worker_count(self) -> int:
+        return max(1, min(self.concurrency, len(self.hardware_ids), len(self.specs)))
+
+    async def run(self) -> Optional[DIPClientError]:
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+        except OSError as e:
+            return GenericClientError(f"Failed to create MinOS result directory: {e}")
+        pending = asyncio.Queue()
+        for spec in self.specs:
+            pending.put_nowait(spec)
+        self.runs = []
+        start = time.monotonic()
+        workers = [
+            asyncio.create_task(self.worker(hardware_id, pending))
+            for hardware_id in self.hardware_ids[:self.worker_count()]]
+        canceller = asyncio.create_task(self.cancel_on_death(workers))
+
+        # Handle kill signals
+        def on_signal(signal_name: str, *args):
+            self.death.grace(GenericClientError(f"Signal '{signal_name}' received"))
+        previous_handlers = [
+            (signal_number, signal.signal(signal_number, partial(on_signal, signal_name)))
+            for signal_number, signal_name in [(signal.SIGINT, "SIGINT"), (signal.SIGTERM, "SIGTERM")]]
+        try:
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            canceller.cancel()
+            for signal_number, handler in previous_handlers:
+                signal.signal(signal_number, handler)
+
+        summary = asdict(self.summary(time.monotonic() - start))
+        self.write_json(SUMMARY_FILE_NAME, summary)
+        return NotAnError(summary)
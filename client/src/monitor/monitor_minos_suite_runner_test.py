@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import signal
+import tempfile
+import unittest
+import unittest.mock
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from result import Ok, Err
+from src.domain.death import Death
+from src.domain.dip_client_error import NotAnError, DIPClientError
+from src.domain.dip_runnable import DIPRunnable
+from src.domain.managed_uuid import ManagedUUID
+from src.engine.monitor.minos.minos_suite import MinOSSuite
+from src.monitor import monitor_minos_suite_runner
+from src.monitor.monitor_minos_suite_runner import MinOSSuiteRunner, load_suite_specs, SUMMARY_FILE_NAME
+
+SPEC = {"chunks": [], "tresholdTime": 1000, "tresholdChunks": 2}
+
+
+@dataclass
+class FakeSuiteMonitor(DIPRunnable):
+    """Suite monitor which receives as many packets as spec time treshold says"""
+    suite: MinOSSuite
+    running: list
+
+    async def run(self) -> Optional[DIPClientError]:
+        self.running.append(self)
+        maximum = len(self.running)
+        await asyncio.sleep(0.02)
+        self.running.remove(self)
+        received = [{"outgoing": False}] * int(self.suite.treshold_time)
+        return NotAnError({"chunks": received, "maxRunning": maximum})
+
+
+@dataclass
+class FakeStuckMonitor(DIPRunnable):
+    """Suite monitor which ends on death only if its suite time treshold allows it"""
+    suite: MinOSSuite
+    death: Death
+
+    async def run(self) -> Optional[DIPClientError]:
+        await self.death.wait()
+        await asyncio.sleep(self.suite.treshold_time)
+        return NotAnError({"chunks": []})
+
+
+class TestMinOSSuiteRunner(unittest.TestCase):
+    def test_load_suite_specs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsInstance(load_suite_specs(directory), Err)
+            with open(os.path.join(directory, "b.json"), "w") as f:
+                json.dump(SPEC, f)
+            with open(os.path.join(directory, "a.json"), "w") as f:
+                json.dump(SPEC, f)
+            with open(os.path.join(directory, "notes.txt"), "w") as f:
+                f.write("not a spec")
+            specs = load_suite_specs(directory)
+            self.assertEqual([spec.name for spec in specs.value], ["a", "b"])
+            with open(os.path.join(directory, "c.json"), "w") as f:
+                f.write("{}")
+            self.assertIsInstance(load_suite_specs(directory), Err)
+
+    def test_run(self):
+        """Check that suites run concurrently up to the board count and results are summarized"""
+        with tempfile.TemporaryDirectory() as directory:
+            spec_dir = os.path.join(directory, "specs")
+            output_dir = os.path.join(directory, "results")
+            os.makedirs(spec_dir)
+            for index in range(6):
+                with open(os.path.join(spec_dir, f"suite{index}.json"), "w") as f:
+                    # Every third suite receives one packet too few, i.e. times out
+                    json.dump(dict(SPEC, tresholdTime=1 if index % 3 == 0 else 2), f)
+            running = []
+
+            def monitor_for(hardware_id: ManagedUUID, suite: MinOSSuite, death: Death):
+                return Ok(FakeSuiteMonitor(suite, running))
+
+            hardware_ids = [ManagedUUID(UUID(f"00000000-0000-0000-0000-00000000000{index}")) for index in range(3)]
+            runner = MinOSSuiteRunner(load_suite_specs(spec_dir).value, hardware_ids, 2, output_dir, monitor_for)
+            outcome = asyncio.run(runner.run())
+
+            self.assertIsInstance(outcome, NotAnError)
+            summary = outcome.success_value
+            self.assertEqual(summary["suites"], 6)
+            self.assertEqual(summary["failed"], 0)
+            self.assertEqual(summary["timeouts"], 2)
+            self.assertEqual(summary["concurrency"], 2)
+            self.assertEqual(summary["packets"], 10)
+            self.assertFalse(summary["interrupted"])
+            with open(os.path.join(output_dir, SUMMARY_FILE_NAME)) as f:
+                self.assertEqual(json.load(f), summary)
+            for index in range(6):
+                with open(os.path.join(output_dir, f"suite{index}.json")) as f:
+                    self.assertLessEqual(json.load(f)["maxRunning"], 2)
+
+    def test_interrupt(self):
+        """Check that a signal kills running suites, cancels stuck ones and still writes the summary"""
+        with tempfile.TemporaryDirectory() as directory:
+            spec_dir = os.path.join(directory, "specs")
+            output_dir = os.path.join(directory, "results")
+            os.makedirs(spec_dir)
+            # Suite 0 ends once killed, suite 1 gets stuck, suite 2 never starts
+            for index, treshold_time in enumerate([0, 60, 0]):
+                with open(os.path.join(spec_dir, f"suite{index}.json"), "w") as f:
+                    json.dump(dict(SPEC, tresholdTime=treshold_time), f)
+
+            def monitor_for(hardware_id: ManagedUUID, suite: MinOSSuite, death: Death):
+                return Ok(FakeStuckMonitor(suite, death))
+
+            async def run_interrupted():
+                hardware_ids = [ManagedUUID(UUID(f"00000000-0000-0000-0000-00000000000{index}")) for index in range(2)]
+                runner = MinOSSuiteRunner(load_suite_specs(spec_dir).value, hardware_ids, 2, output_dir, monitor_for)
+                run_task = asyncio.create_task(runner.run())
+                await asyncio.sleep(0.05)
+                os.kill(os.getpid(), signal.SIGINT)
+                return await run_task
+
+            previous_handler = signal.getsignal(signal.SIGINT)
+            with unittest.mock.patch.object(monitor_minos_suite_runner, "SUITE_KILL_TIMEOUT_SECONDS", 0.1):
+                outcome = asyncio.run(run_interrupted())
+            self.assertIs(signal.getsignal(signal.SIGINT), previous_handler)
+
+            summary = outcome.success_value
+            self.assertTrue(summary["interrupted"])
+            self.assertEqual([(run["name"], run["error"]) for run in summary["runs"]], [
+                ("suite0", None),
+                ("suite1", "MinOS suite cancelled"),
+            ])
+            with open(os.path.join(output_dir, SUMMARY_FILE_NAME)) as f:
+                self.assertEqual(json.load(f), summary)
+            self.assertFalse(os.path.exists(os.path.join(output_dir, "suite2.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
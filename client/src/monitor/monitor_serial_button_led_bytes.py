@@ -1,15 +1,16 @@
 """Module for functionality related to serial socket monitor as button/led byte stream"""
 
 import asyncio
+from dataclasses import dataclass
 from typing import Callable, Optional
 import signal
 from pprint import pformat
 from result import Err, Result
 from websockets.exceptions import ConnectionClosedError
 from src.domain.dip_client_error import DIPClientError, GenericClientError
-from src.domain.fancy_byte import FancyByte
 from src.domain.monitor_message import MONITOR_LISTENER_INCOMING_MESSAGE, SerialMonitorMessageToClient, \
     MonitorUnavailable, SerialMonitorMessageToAgent, MONITOR_LISTENER_OUTGOING_MESSAGE
+from src.monitor.monitor_led_frame import LEDRenderConfig, LEDFrameScheduler
 from src.monitor.monitor_serial import MonitorSerial
 from src.monitor.monitor_serial_button_led_bytes_app import AppState
 from src.monitor.monitor_serial_button_led_bytes_app import ButtonLEDApp
@@ -22,8 +23,10 @@ from functools import partial
 LOGGER = log.timed_named_logger("monitor_button_led_bytes")
 
 
+@dataclass
 class MonitorSerialButtonLedBytes(MonitorSerial):
     """Serial socket monitor which interprets the byte stream as a buttons & LEDs"""
+    render_config: LEDRenderConfig = LEDRenderConfig()
 
     @staticmethod
     def handle_finish(
@@ -35,18 +38,13 @@ class MonitorSerialButtonLedBytes(MonitorSerial):
         asyncio_loop.create_task(socketlike.disconnect())
 
     @staticmethod
-    def render_incoming_message(app_state: AppState, incoming_message: SerialMonitorMessageToClient):
-        for byte in incoming_message.content_bytes:
-            fancy_byte_result = FancyByte.fromInt(byte)
-            if isinstance(fancy_byte_result, Err): return
-            fancy_byte = fancy_byte_result.value
-            bits = fancy_byte.to_binary_bits()
-            for index, is_on in enumerate(bits):
-                app_state.indexed_led_change(fancy_byte, index, is_on)
+    def render_incoming_message(scheduler: LEDFrameScheduler, incoming_message: SerialMonitorMessageToClient):
+        # Bytes are only collected here, rendering happens once per frame
+        scheduler.add(incoming_message.content_bytes)
 
     @staticmethod
     def render_message_data_or_finish(
-        app_state: AppState,
+        scheduler: LEDFrameScheduler,
         death: Death,
         handle_finish: Callable,
         incoming_message_result: Result[MONITOR_LISTENER_INCOMING_MESSAGE, Exception]
@@ -75,7 +73,7 @@ class MonitorSerialButtonLedBytes(MonitorSerial):
             handle_finish()
             return GenericClientError(f"Monitor not available anymore: {incoming_message.reason}")
         elif isinstance(incoming_message, SerialMonitorMessageToClient):
-            MonitorSerialButtonLedBytes.render_incoming_message(app_state, incoming_message)
+            MonitorSerialButtonLedBytes.render_incoming_message(scheduler, incoming_message)
             return None
         else:
             handle_finish()
@@ -121,9 +119,11 @@ class MonitorSerialButtonLedBytes(MonitorSerial):
             asyncio_loop = asyncio.get_event_loop()
             asyncio_loop.add_signal_handler(getattr(signal, signame), handle_finish)
 
-        # Start app
+        # Start app and LED frame rendering
+        scheduler = LEDFrameScheduler(self.render_config)
         loop = asyncio.get_event_loop()
         loop.create_task(ButtonLEDApp.run_with_state(state))
+        loop.create_task(scheduler.loop(state.death, state.led_frame))
 
         # Run monitor loop
         while not state.death.gracing:
@@ -135,6 +135,6 @@ class MonitorSerialButtonLedBytes(MonitorSerial):
                 return
 
             incoming_message_result = death_or_incoming_message.value
-            result = self.render_message_data_or_finish(state, state.death, handle_finish, incoming_message_result)
+            result = self.render_message_data_or_finish(scheduler, state.death, handle_finish, incoming_message_result)
             if result is not None:
                 return result
@@ -9,6 +9,7 @@ from textual.app import App
 from textual.views import GridView
 from textual.widgets import Button
 from src.domain.fancy_byte import FancyByte
+from src.monitor.monitor_led_frame import LEDFrame
 from src.util import log
 from src.domain.death import Death
 
@@ -18,7 +19,7 @@ LOGGER = log.timed_named_logger("monitor_button_led_bytes_app")
 class AppState:
     death = Death()
     on_indexed_button_click = []
-    on_indexed_led_change = []
+    on_led_frame = []
     last_byte_in: FancyByte = FancyByte(0)
     last_byte_out: FancyByte = FancyByte(0)
     bytes_in = 0
@@ -46,21 +47,19 @@ class AppState:
             for c in self.on_indexed_button_click:
                 c(button_index)
 
-    def set_on_indexed_led_change(
+    def set_on_led_frame(
             self,
-            on_indexed_led_change: Callable[[FancyByte, int, bool], None]
+            on_led_frame: Callable[[LEDFrame], None]
     ):
-        self.on_indexed_led_change.append(on_indexed_led_change)
+        self.on_led_frame.append(on_led_frame)
 
-    def indexed_led_change(
+    def led_frame(
             self,
-            fancy_byte: FancyByte,
-            led_index: int,
-            led_on: bool
+            frame: LEDFrame
     ):
-        if self.on_indexed_led_change is not None:
-            for c in self.on_indexed_led_change:
-                c(fancy_byte, led_index, led_on)
+        if self.on_led_frame is not None:
+            for c in self.on_led_frame:
+                c(frame)
 
 
 class AppStateStorage:
@@ -129,17 +128,34 @@ class ButtonLEDScreen(GridView):
             self.stats.label = hacked_global_app_state_storage.state.stats()
         hacked_global_app_state_storage.state.set_on_indexed_button_click(on_button_click)
 
-        def on_led_change(fancy_byte: FancyByte, led_index: int, led_on: bool):
-            if 0 <= led_index < len(self.leds):
-                self.leds[led_index].button_style = self.RED if led_on else self.DARK
-                i = str(7 - led_index)
-                s = "on" if led_on else "off"
-                self.leds[led_index].label = f"LED{i} | {s}"
-                hacked_global_app_state_storage.state.last_byte_in = fancy_byte
-                hacked_global_app_state_storage.state.bytes_in += 1 / 8
-                self.stats.label = hacked_global_app_state_storage.state.stats()
-
-        hacked_global_app_state_storage.state.set_on_indexed_led_change(on_led_change)
+        def on_led_change(led_index: int, led_on: bool):
+            style = self.RED if led_on else self.DARK
+            if self.leds[led_index].button_style == style: return
+            self.leds[led_index].button_style = style
+            i = str(7 - led_index)
+            s = "on" if led_on else "off"
+            self.leds[led_index].label = f"LED{i} | {s}"
+
+        def on_led_duty_cycle(led_index: int, duty_cycle: float):
+            # Blend from dark to red by the fraction of time the LED was on
+            red = int(51 + (215 - 51) * duty_cycle)
+            rest = int(51 * (1 - duty_cycle))
+            self.leds[led_index].button_style = f"white on rgb({red},{rest},{rest})"
+            i = str(7 - led_index)
+            self.leds[led_index].label = f"LED{i} | {round(duty_cycle * 100)}%"
+
+        def on_led_frame(frame: LEDFrame):
+            if frame.persistence:
+                for index, duty_cycle in enumerate(frame.duty_cycles()):
+                    on_led_duty_cycle(index, duty_cycle)
+            else:
+                for index, is_on in enumerate(frame.last_byte.bits()):
+                    on_led_change(index, is_on)
+            hacked_global_app_state_storage.state.last_byte_in = frame.last_byte
+            hacked_global_app_state_storage.state.bytes_in += frame.byte_count
+            self.stats.label = hacked_global_app_state_storage.state.stats()
+
+        hacked_global_app_state_storage.state.set_on_led_frame(on_led_frame)
 
         self.grid.place(stats=self.stats)
 
@@ -4,6 +4,7 @@ import sys
 import asyncio
 import warnings
 from asyncio import Task, StreamReader
+from dataclasses import dataclass
 from typing import Any, Callable, Optional
 import termios
 import tty
@@ -15,6 +16,8 @@ from websockets.exceptions import ConnectionClosedError
 from src.domain.dip_client_error import DIPClientError, GenericClientError
 from src.domain.monitor_message import MONITOR_LISTENER_INCOMING_MESSAGE, MONITOR_LISTENER_OUTGOING_MESSAGE, \
     SerialMonitorMessageToAgent, SerialMonitorMessageToClient, MonitorUnavailable
+from src.monitor.monitor_hex_renderer import HexRenderConfig, HexRenderer
+from src.monitor.monitor_input import MonitorInputConfig, read_batch, send_file_paced
 from src.monitor.monitor_serial import MonitorSerial
 from src.protocol.codec import CodecParseException
 from src.service.ws import SocketInterface
@@ -26,8 +29,11 @@ from src.util import log
 LOGGER = log.timed_named_logger("hexbytes_monitor")
 
 
+@dataclass
 class MonitorSerialHexbytes(MonitorSerial):
     """Serial socket monitor, which sends keyboard keys as bytes & prints incoming data as hex bytes"""
+    render_config: HexRenderConfig = HexRenderConfig()
+    input_config: MonitorInputConfig = MonitorInputConfig()
 
     @staticmethod
     def silence_stdin() -> list:
@@ -57,14 +63,30 @@ class MonitorSerialHexbytes(MonitorSerial):
     async def keep_transmitting_to_agent(
         death: Death,
         stdin_reader: StreamReader,
-        socketlike: SocketInterface[MONITOR_LISTENER_INCOMING_MESSAGE, MONITOR_LISTENER_OUTGOING_MESSAGE]
+        socketlike: SocketInterface[MONITOR_LISTENER_INCOMING_MESSAGE, MONITOR_LISTENER_OUTGOING_MESSAGE],
+        input_config: MonitorInputConfig = MonitorInputConfig()
     ):
-        """Send keyboard data from stdin straight to serial monitor socket"""
+        """Send keyboard data from stdin to serial monitor socket, pasted text in as few messages as possible"""
         while not death.gracing:
-            read_bytes = await stdin_reader.read(1)
+            read_bytes = await read_batch(stdin_reader, input_config)
+            if len(read_bytes) == 0:
+                return
             message = SerialMonitorMessageToAgent(read_bytes)
             await socketlike.tx(message)
 
+    @staticmethod
+    async def keep_sending_file_to_agent(
+        death: Death,
+        content: bytes,
+        socketlike: SocketInterface[MONITOR_LISTENER_INCOMING_MESSAGE, MONITOR_LISTENER_OUTGOING_MESSAGE],
+        input_config: MonitorInputConfig
+    ):
+        """Send file content to serial monitor socket at the pace of serial baudrate"""
+        async def send(chunk: bytes):
+            await socketlike.tx(SerialMonitorMessageToAgent(chunk))
+        sent = await send_file_paced(death, content, input_config.send_baudrate, send)
+        LOGGER.debug(f"Sent {sent} of {len(content)} bytes from file: {input_config.send_file}")
+
     @staticmethod
     def handle_finish(
         socket: SocketInterface[MONITOR_LISTENER_INCOMING_MESSAGE, MONITOR_LISTENER_OUTGOING_MESSAGE],
@@ -79,14 +101,13 @@ class MonitorSerialHexbytes(MonitorSerial):
         MonitorSerialHexbytes.unsilence_stdin(tattr)
 
     @staticmethod
-    def render_incoming_message(incoming_message: SerialMonitorMessageToClient):
-        for byte_int in incoming_message.content_bytes:
-            render = f"[{hex(byte_int)}] "
-            sys.stdout.buffer.write(str.encode(render))
-            sys.stdout.buffer.flush()
+    def render_incoming_message(renderer: HexRenderer, incoming_message: SerialMonitorMessageToClient):
+        # Bytes are only collected here, writing out happens once per flush interval
+        renderer.add(incoming_message.content_bytes)
 
     @staticmethod
     def render_message_data_or_finish(
+        renderer: HexRenderer,
         death: Death,
         handle_finish: Callable,
         incoming_message_result: Result[MONITOR_LISTENER_INCOMING_MESSAGE, Exception]
@@ -114,7 +135,7 @@ class MonitorSerialHexbytes(MonitorSerial):
             handle_finish()
             return GenericClientError(f"Monitor not available: {incoming_message.reason}")
         elif isinstance(incoming_message, SerialMonitorMessageToClient):
-            MonitorSerialHexbytes.render_incoming_message(incoming_message)
+            MonitorSerialHexbytes.render_incoming_message(renderer, incoming_message)
             return None
         else:
             handle_finish()
@@ -132,6 +153,15 @@ class MonitorSerialHexbytes(MonitorSerial):
         for signame in ('SIGINT', 'SIGTERM'):
             asyncio_loop.add_signal_handler(getattr(signal, signame), partial(death.grace))
 
+        # Read file to be sent to board
+        send_file_content: Optional[bytes] = None
+        if self.input_config.send_file is not None:
+            try:
+                with open(self.input_config.send_file, "rb") as f:
+                    send_file_content = f.read()
+            except Exception as e:
+                return GenericClientError(f"Failed to read file to send, reason: {e}")
+
         # Start socket
         connect_error = await self.socket.connect()
         if connect_error is not None:
@@ -151,7 +181,12 @@ class MonitorSerialHexbytes(MonitorSerial):
         silencer_code = await stdin_reader.read(7) # The first 7 bytes are the stdin silencer codes
         LOGGER.debug(f"Suppressed 7 stdin silencer bytes: {silencer_code}")
         stdin_capture_task = asyncio_loop.create_task(
-            self.keep_transmitting_to_agent(death, stdin_reader, self.socket))
+            self.keep_transmitting_to_agent(death, stdin_reader, self.socket, self.input_config))
+
+        # Stream file to serial monitor socket
+        if send_file_content is not None:
+            asyncio_loop.create_task(
+                self.keep_sending_file_to_agent(death, send_file_content, self.socket, self.input_config))
 
         # Define end-of-hexbytes handler
         handle_finish = partial(
@@ -163,6 +198,10 @@ class MonitorSerialHexbytes(MonitorSerial):
         for signame in ('SIGINT', 'SIGTERM'):
             asyncio_loop.add_signal_handler(getattr(signal, signame), handle_finish)
 
+        # Write out received bytes in background
+        renderer = HexRenderer(self.render_config)
+        asyncio_loop.create_task(renderer.loop(death))
+
         # Run monitor loop
         while not death.gracing:
             # Wait for new message
@@ -173,7 +212,7 @@ class MonitorSerialHexbytes(MonitorSerial):
                 return
 
             incoming_message_result = death_or_incoming_message.value
-            result = self.render_message_data_or_finish(death, handle_finish, incoming_message_result)
+            result = self.render_message_data_or_finish(renderer, death, handle_finish, incoming_message_result)
             if result is not None:
                 return result
 
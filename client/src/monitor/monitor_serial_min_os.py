@@ -1,7 +1,9 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, TextIO
 from src.agent.agent import Agent
 from src.agent.agent_config import AgentConfig
+from src.domain.death import Death
 from src.domain.dip_client_error import DIPClientError
 from src.domain.dip_runnable import DIPRunnable
 from src.domain.fancy_byte import FancyByte
@@ -13,7 +15,9 @@ from src.engine.engine_state import EngineBase
 from src.engine.monitor.minos.engine_monitor_minos import EngineMonitorMinOS
 from src.engine.monitor.minos.engine_monitor_minos_app import EngineMonitorMinOSApp
 from src.engine.monitor.minos.engine_monitor_minos_state import EngineMonitorMinOSState
+from src.engine.monitor.minos.minos_framebuffer import MinOSDisplayConfig
 from src.engine.monitor.minos.minos_suite import MinOSSuite
+from src.engine.monitor.minos.minos_suite_replay import MinOSReplayConfig
 from src.protocol import s11n_hybrid
 from src.service.backend_config import UserPassAuthConfig
 from src.service.managed_url import ManagedURL
@@ -26,12 +30,18 @@ class MonitorSerialMinOS(DIPRunnable):
     auth: UserPassAuthConfig
     monitor_url: ManagedURL
     suite: Optional[MinOSSuite]
+    display_config: MinOSDisplayConfig = MinOSDisplayConfig()
+    result_jsonl: Optional[TextIO] = None
+    replay_config: MinOSReplayConfig = MinOSReplayConfig()
+    # Death of whoever runs this monitor, which then also handles signals
+    death: Optional[Death] = None
 
     async def run(self) -> Optional[DIPClientError]:
         base = await EngineBase.build()
         engine_state = EngineMonitorMinOSState(
             base, self.auth, [], self.heartbeat_seconds, self.suite,
-            None, b"", False, "", "", FancyByte.fromInt(0).value)
+            None, b"", False, "", "", FancyByte.fromInt(0).value, self.display_config,
+            self.result_jsonl, self.replay_config)
         engine_lifecycle = EngineLifecycle()
         engine_ping = EnginePing()
         engine_minos_app = EngineMonitorMinOSApp()
@@ -42,6 +52,17 @@ class MonitorSerialMinOS(DIPRunnable):
         decoder = s11n_hybrid.MONITOR_LISTENER_INCOMING_MESSAGE_DECODER
         encoder = s11n_hybrid.MONITOR_LISTENER_OUTGOING_MESSAGE_ENCODER
         websocket = WebSocket(self.monitor_url, decoder, encoder)
-        agent = Agent(AgentConfig(engine, websocket))
+        agent = Agent(AgentConfig(engine, websocket, handle_signals=self.death is None))
+        if self.death is None:
+            return await agent.run()
 
-        return await agent.run()
+        kill_task = asyncio.create_task(self.kill_on_death(engine, self.death))
+        try:
+            return await agent.run()
+        finally:
+            kill_task.cancel()
+
+    @staticmethod
+    async def kill_on_death(engine: EngineMonitorMinOS, death: Death):
+        await death.wait()
+        await engine.kill(death.reason)
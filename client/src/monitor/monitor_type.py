@@ -2,12 +2,17 @@
 """Available virtual monitoring interfaces"""
 from dataclasses import dataclass
 from enum import Enum, unique
-from typing import Optional
+from typing import Optional, TextIO
 from result import Result, Err, Ok
 from src.domain.dip_client_error import DIPClientError
 from src.domain.dip_runnable import DIPRunnable
 from src.domain.positive_integer import PositiveInteger
+from src.engine.monitor.minos.minos_framebuffer import MinOSDisplayConfig
 from src.engine.monitor.minos.minos_suite import MinOSSuite
+from src.engine.monitor.minos.minos_suite_replay import MinOSReplayConfig
+from src.monitor.monitor_hex_renderer import HexRenderConfig
+from src.monitor.monitor_input import MonitorInputConfig
+from src.monitor.monitor_led_frame import LEDRenderConfig
 from src.monitor.monitor_serial import MonitorSerialHelper
 from src.monitor.monitor_serial_button_led_bytes import MonitorSerialButtonLedBytes
 from src.monitor.monitor_serial_hex_bytes import MonitorSerialHexbytes
@@ -68,18 +73,26 @@ class MonitorType(Enum):
         heartbeat_seconds: PositiveInteger,
         socket_url: ManagedURL,
         auth: UserPassAuthConfig,
-        minos_suite: Optional[MinOSSuite]
+        minos_suite: Optional[MinOSSuite],
+        minos_display: MinOSDisplayConfig = MinOSDisplayConfig(),
+        led_render: LEDRenderConfig = LEDRenderConfig(),
+        hex_render: HexRenderConfig = HexRenderConfig(),
+        monitor_input: MonitorInputConfig = MonitorInputConfig(),
+        minos_result_jsonl: Optional[TextIO] = None,
+        minos_replay: MinOSReplayConfig = MinOSReplayConfig()
     ) -> Result[DIPRunnable, MonitorResolutionError]:
         # Monitor implementation resolution
         monitor: Optional[DIPRunnable] = None
         if self is MonitorType.hexbytes:
             socket = MonitorType.socket(socket_url)
-            monitor = MonitorSerialHexbytes(MonitorSerialHelper(), socket, auth)
+            monitor = MonitorSerialHexbytes(MonitorSerialHelper(), socket, auth, hex_render, monitor_input)
         elif self is MonitorType.buttonleds:
             socket = MonitorType.socket(socket_url)
-            monitor = MonitorSerialButtonLedBytes(MonitorSerialHelper(), socket, auth)
+            monitor = MonitorSerialButtonLedBytes(MonitorSerialHelper(), socket, auth, led_render)
         elif self is MonitorType.minos:
-            monitor = MonitorSerialMinOS(heartbeat_seconds, auth, socket_url, None)
+            monitor = MonitorSerialMinOS(heartbeat_seconds, auth, socket_url, None, minos_display)
         elif self is MonitorType.minosrequest and minos_suite is not None:
-            monitor = MonitorSerialMinOS(heartbeat_seconds, auth, socket_url, minos_suite)
+            monitor = MonitorSerialMinOS(
+                heartbeat_seconds, auth, socket_url, minos_suite, minos_display, minos_result_jsonl,
+                minos_replay)
         return Ok(monitor)
@@ -1,7 +1,7 @@
 """Generic data serializer between Raw <-> Serializable <-> Domain"""
 
 from __future__ import annotations
-from typing import TypeVar, Generic, Callable
+from typing import TypeVar, Generic, Callable, Dict, Type, Optional, Any
 from result import Result
 
 
@@ -29,6 +29,38 @@ class Encoder(Generic[R, D]):
         self.encode = encode
 
 
+V = TypeVar('V')
+
+
+class TypeLookup(Generic[V]):
+    """Lookup of values registered per class, which also matches subclass instances
+
+    Matches the first registered class the value is an instance of, like iterating
+    isinstance checks would, but resolves each concrete type only once.
+    """
+
+    def __init__(self, entries: Dict[Type, V]):
+        self.entries = entries
+        self.resolved: Dict[Type, Optional[V]] = {}
+        for clazz in entries.keys():
+            self.resolved[clazz] = self.resolve(clazz)
+
+    def resolve(self, clazz: Type) -> Optional[V]:
+        for entry_clazz, entry in self.entries.items():
+            if issubclass(clazz, entry_clazz):
+                return entry
+        return None
+
+    def get(self, value: Any) -> Optional[V]:
+        clazz = type(value)
+        try:
+            return self.resolved[clazz]
+        except KeyError:
+            entry = self.resolve(clazz)
+            self.resolved[clazz] = entry
+            return entry
+
+
 class Codec(Generic[R, D]):
     """Serialization codec between Raw <-> Domain"""
     decoder: Decoder[R, D]
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 from typing import TypeVar, Callable, Any, Union
-from result import Result, Err
+from result import Result
 from src.protocol.codec import Decoder, CodecParseException, Encoder, Codec
-from src.protocol.codec_json import DecoderJSON, EncoderJSON
+from src.protocol.codec_json import EncoderJSON
 
 D = TypeVar('D')
 
@@ -16,14 +16,8 @@ class DecoderHybrid(Decoder[Union[str, bytes], D]):
         self.decode = decode
 
     def raw_decode(self, value: Union[str, bytes]) -> Result[D, CodecParseException]:
-        """Decode raw directly to domain"""
-        serializable = value
-        if not isinstance(value, bytes):
-            json_result = DecoderJSON.raw_as_serializable(value)
-            if isinstance(json_result, Err):
-                return serializable
-            serializable = json_result.value
-        return self.decode(serializable)
+        """Decode raw directly to domain, JSON text is parsed only once by the JSON decoder"""
+        return self.decode(value)
 
 
 class EncoderHybrid(Encoder[Union[str, bytes], D]):
@@ -35,7 +29,7 @@ class EncoderHybrid(Encoder[Union[str, bytes], D]):
     def raw_encode(self, value: D) -> Any:
         """Serialize domain directly to raw"""
         serializable = self.encode(value)
-        if isinstance(serializable, bytes):
+        if isinstance(serializable, (bytes, str)):
             return serializable
         else:
             return EncoderJSON.serializable_as_raw(serializable)
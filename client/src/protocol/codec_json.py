@@ -3,13 +3,12 @@
 from __future__ import annotations
 from typing import TypeVar, Callable, Any
 from result import Result, Ok, Err
-import json
 
 from src.protocol.codec import Decoder, CodecParseException, Encoder, Codec
+from src.protocol import json_backend
 
 JSON = Any
 D = TypeVar('D')
-NO_WHITESPACE_SEPERATORS = (',', ':')
 
 
 class DecoderJSON(Decoder[str, D]):
@@ -29,7 +28,7 @@ class DecoderJSON(Decoder[str, D]):
     def raw_as_serializable(text: str) -> Result[JSON, CodecParseException]:
         """Unserialize JSON from a string"""
         try:
-            return Ok(json.loads(text))
+            return Ok(json_backend.JSON_BACKEND.loads(text))
         except Exception as e:
             return Err(CodecParseException(str(e)))
 
@@ -53,7 +52,7 @@ class EncoderJSON(Encoder[str, D]):
     @staticmethod
     def serializable_as_raw(data: JSON) -> str:
         """Serialize JSON into a string"""
-        return json.dumps(data, separators=NO_WHITESPACE_SEPERATORS)
+        return json_backend.JSON_BACKEND.dumps(data)
 
     @staticmethod
     def identity() -> EncoderJSON[JSON]:
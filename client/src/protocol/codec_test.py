@@ -3,6 +3,7 @@
 
 import unittest
 from result import Ok
+from src.protocol.codec import TypeLookup
 from src.protocol.codec_json import DecoderJSON, EncoderJSON
 
 
@@ -20,6 +21,20 @@ class TestCodec(unittest.TestCase):
         self.assertEqual(text, as_str)
         self.assertEqual(Ok(data), as_json)
 
+    def test_type_lookup(self):
+        """Test type lookup matches the first registered class, like ordered isinstance checks"""
+        class Base: pass
+        class Child(Base): pass
+        class GrandChild(Child): pass
+
+        lookup = TypeLookup({Base: "base", Child: "child", int: "int"})
+
+        self.assertEqual(lookup.get(Child()), "base")
+        self.assertEqual(lookup.get(GrandChild()), "base")
+        self.assertEqual(lookup.get(True), "int")
+        self.assertEqual(lookup.get("potat"), None)
+        self.assertIn(GrandChild, lookup.resolved)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,95 @@
+"""JSON parsing & serialization backends used by JSON codecs
+
+Backend is selected at startup with environment variable JSON_BACKEND, which
+can be 'auto' (default, fastest installed backend), 'json' (standard library)
+or 'orjson' (https://github.com/ijl/orjson, if installed).
+"""
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Any, Union, Optional, Dict
+
+JSON = Any
+NO_WHITESPACE_SEPERATORS = (',', ':')
+# Exponent, as orjson writes e.g. 1e16 & 1e-7, starting with a literal for fast search
+ORJSON_EXPONENT = re.compile(rb"e-?[0-9]")
+DIGITS = b"0123456789"
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """Pair of JSON serialization functions with standard library output semantics"""
+    name: str
+    dumps: Callable[[JSON], str]
+    loads: Callable[[Union[str, bytes]], JSON]
+
+
+STDLIB_JSON_BACKEND = JSONBackend(
+    "json",
+    partial(json.dumps, separators=NO_WHITESPACE_SEPERATORS),
+    json.loads)
+
+
+def orjson_backend() -> Optional[JSONBackend]:
+    """Backend using orjson, falling back to standard library wherever their output would differ"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    # orjson members are defined in its native extension, so they aren't detected
+    # pylint: disable=E1101
+    # Types standard library can't serialize are passed to a missing default, i.e. fail like there
+    passthrough_options = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | \
+        orjson.OPT_PASSTHROUGH_SUBCLASS
+
+    def dumps(data: JSON) -> str:
+        # Standard library escapes non-ASCII characters, handles big integers, writes
+        # exponents like '1e+16' and non-finite floats as NaN/Infinity (where orjson writes null),
+        # so anything which might differ is serialized by standard library instead
+        try:
+            raw = orjson.dumps(data, option=passthrough_options)
+        except orjson.JSONEncodeError:
+            return STDLIB_JSON_BACKEND.dumps(data)
+        if not raw.isascii() or b"null" in raw or has_exponent(raw):
+            return STDLIB_JSON_BACKEND.dumps(data)
+        return raw.decode()
+
+    def loads(text: Union[str, bytes]) -> JSON:
+        # Standard library accepts NaN & Infinity and reports its own errors
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return STDLIB_JSON_BACKEND.loads(text)
+
+    return JSONBackend("orjson", dumps, loads)
+
+
+def has_exponent(raw: bytes) -> bool:
+    """Check for a number with exponent, might also match inside strings"""
+    for match in ORJSON_EXPONENT.finditer(raw):
+        start = match.start()
+        if start > 0 and raw[start - 1] in DIGITS:
+            return True
+    return False
+
+
+def available_json_backends() -> Dict[str, JSONBackend]:
+    """Installed backends by name"""
+    backends = {STDLIB_JSON_BACKEND.name: STDLIB_JSON_BACKEND}
+    orjson_json_backend = orjson_backend()
+    if orjson_json_backend is not None:
+        backends[orjson_json_backend.name] = orjson_json_backend
+    return backends
+
+
+def select_json_backend(name: str) -> JSONBackend:
+    """Backend by name, or fastest installed one for 'auto' or a backend which isn't installed"""
+    backends = available_json_backends()
+    if name in backends:
+        return backends[name]
+    return backends.get("orjson", STDLIB_JSON_BACKEND)
+
+
+JSON_BACKEND: JSONBackend = select_json_backend(os.environ.get("JSON_BACKEND", "auto").lower())
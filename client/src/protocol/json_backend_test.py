@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Module to test that all JSON backends behave like standard library"""
+
+import math
+import unittest
+from result import Ok
+from src.protocol import json_backend
+from src.benchmark.codec_benchmark import codec_cases
+from src.protocol.json_backend import STDLIB_JSON_BACKEND, available_json_backends, select_json_backend
+
+
+class TestJSONBackend(unittest.TestCase):
+    """Conformance suite for JSON backends"""
+
+    def tearDown(self):
+        json_backend.JSON_BACKEND = select_json_backend("auto")
+
+    def test_values(self):
+        """Test backends serialize & parse edge case values exactly like standard library"""
+        values = [
+            {"text": "potat", "none": None, "nested": [1, [2.5, True], {}]},
+            "ūdens 💧",
+            [0.1, 1e16, 1e-7, -0.0, math.inf, 2 ** 70],
+            {"b": 1, "a": 2},
+        ]
+        for backend in available_json_backends().values():
+            for value in values:
+                with self.subTest(backend=backend.name, value=value):
+                    raw = backend.dumps(value)
+                    self.assertEqual(raw, STDLIB_JSON_BACKEND.dumps(value))
+                    self.assertEqual(backend.loads(raw), STDLIB_JSON_BACKEND.loads(raw))
+            with self.subTest(backend=backend.name):
+                self.assertTrue(math.isnan(backend.loads("NaN")))
+                with self.assertRaises(TypeError):
+                    backend.dumps(object())
+
+    def test_codecs(self):
+        """Test every exported codec encodes & decodes identically with every backend"""
+        cases = codec_cases()
+        json_backend.JSON_BACKEND = STDLIB_JSON_BACKEND
+        expectations = []
+        for case in cases:
+            encoded = case.codec.encoder.encode(case.message)
+            expectations.append((encoded, case.codec.decoder.decode(encoded)))
+
+        for backend in available_json_backends().values():
+            json_backend.JSON_BACKEND = backend
+            for case, (encoded, decoded) in zip(cases, expectations):
+                with self.subTest(backend=backend.name, case=case.name):
+                    self.assertEqual(case.codec.encoder.encode(case.message), encoded)
+                    self.assertIsInstance(decoded, Ok)
+                    self.assertEqual(case.codec.decoder.decode(encoded), decoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
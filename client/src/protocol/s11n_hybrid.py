@@ -5,7 +5,7 @@ from functools import partial
 from result import Result, Err
 from src.domain import hardware_control_message, monitor_message, hardware_video_message, hardware_shared_message
 from src.protocol import s11n_json, s11n_binary
-from src.protocol.codec import Encoder, CodecParseException
+from src.protocol.codec import Encoder, CodecParseException, TypeLookup
 from src.protocol.codec_binary import DecoderBinary
 from src.protocol.codec_hybrid import EncoderHybrid, DecoderHybrid, CodecHybrid
 from src.protocol.codec_json import DecoderJSON
@@ -15,13 +15,13 @@ HYBRID_MESSAGE = TypeVar('HYBRID_MESSAGE')
 
 
 def hybrid_encode(
-    encoders: Dict[Type[HYBRID_MESSAGE], Encoder[Union[str, bytes], HYBRID_MESSAGE]],
+    encoders: TypeLookup[Encoder[Union[str, bytes], HYBRID_MESSAGE]],
     value: HYBRID_MESSAGE
 ) -> Union[str, bytes]:
     """Encode hybrid message"""
-    for clazz, encoder in encoders.items():
-        if isinstance(value, clazz):
-            return encoder.encode(value)
+    encoder = encoders.get(value)
+    if encoder is not None:
+        return encoder.encode(value)
     # Not very functional, if this becomes a problem, refactor Encoder result type :/
     raise CodecParseException(f"This encoder can't encode {type(value).__name__}")
 
@@ -30,7 +30,7 @@ def hybrid_encoder(
     encoders: Dict[Type[HYBRID_MESSAGE], Encoder[Union[str, bytes], HYBRID_MESSAGE]],
 ) -> EncoderHybrid[HYBRID_MESSAGE]:
     """Build hybrid message format encoder"""
-    return EncoderHybrid(partial(hybrid_encode, encoders))
+    return EncoderHybrid(partial(hybrid_encode, TypeLookup(encoders)))
 
 
 def hybrid_decode(
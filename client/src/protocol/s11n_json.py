@@ -7,8 +7,9 @@ from result import Result, Err, Ok
 from src.domain.fancy_byte import FancyByte
 from src.domain.managed_uuid import ManagedUUID
 from src.domain.minos_chunks import TextChunk, ParsedChunk, DisplayChunk, LEDChunk, SwitchChunk, IndexedButtonChunk
+from src.engine.monitor.minos.minos_latency import MinOSLatencyReport, MinOSLatencyStats
 from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
-from src.protocol.codec import CodecParseException
+from src.protocol.codec import CodecParseException, TypeLookup
 from src.domain import hardware_control_message, backend_entity, backend_management_message, monitor_message, config, \
     hardware_shared_message, hardware_video_message
 from src.protocol.codec_json import JSON, EncoderJSON, DecoderJSON, CodecJSON
@@ -115,17 +116,29 @@ def named_message_decoder_json(name: str) -> DecoderJSON[JSON]:
     return DecoderJSON(partial(named_message_encode_json, name))
 
 
+def named_message_union_index(
+    decoders: Dict[Type[NAMED_MESSAGE], Tuple[str, DecoderJSON[NAMED_MESSAGE]]]
+) -> Dict[str, List[DecoderJSON[NAMED_MESSAGE]]]:
+    """Index named message union decoders by command name, keeping their order"""
+    index = {}
+    for _, (name, decoder) in decoders.items():
+        index.setdefault(name, []).append(decoder)
+    return index
+
+
 def named_message_union_decode(
-    decoders: Dict[Type[NAMED_MESSAGE], Tuple[str, DecoderJSON[NAMED_MESSAGE]]],
+    index: Dict[str, List[DecoderJSON[NAMED_MESSAGE]]],
     value: JSON
 ) -> NAMED_MESSAGE_UNION:
     """Decode named message union"""
-    for _, (name, decoder) in decoders.items():
-        payload_result_json = named_message_decode_json(name, value)
-        if isinstance(payload_result_json, Ok):
-            result = decoder.json_decode(payload_result_json.value)
-            if isinstance(result, Ok):
-                return Ok(result.value)
+    if isinstance(value, dict) and "payload" in value:
+        command = value.get("command")
+        if isinstance(command, str):
+            payload = value["payload"]
+            for decoder in index.get(command, ()):
+                result = decoder.json_decode(payload)
+                if isinstance(result, Ok):
+                    return Ok(result.value)
     return Err(CodecParseException("Failed to decode any named message from decoder union"))
 
 
@@ -133,7 +146,7 @@ def named_message_union_decoder_json(
     decoders: Dict[Type[NAMED_MESSAGE], Tuple[str, DecoderJSON[NAMED_MESSAGE]]]
 ) -> DecoderJSON[NAMED_MESSAGE]:
     """Create named message union decoder"""
-    return DecoderJSON(partial(named_message_union_decode, decoders))
+    return DecoderJSON(partial(named_message_union_decode, named_message_union_index(decoders)))
 
 
 def named_message_encode_json(name: str, value: JSON) -> JSON:
@@ -150,13 +163,14 @@ def named_message_encoder_json(name: str) -> EncoderJSON[JSON]:
 
 
 def named_message_union_encode_json(
-    encoders: Dict[Type[NAMED_MESSAGE], Tuple[str, EncoderJSON[NAMED_MESSAGE]]],
+    encoders: TypeLookup[Tuple[str, EncoderJSON[NAMED_MESSAGE]]],
     value: NAMED_MESSAGE_UNION
 ) -> JSON:
     """Encode named message union"""
-    for clazz, (name, encoder) in encoders.items():
-        if isinstance(value, clazz):
-            return named_message_encode_json(name, encoder.json_encode(value))
+    named_encoder = encoders.get(value)
+    if named_encoder is not None:
+        name, encoder = named_encoder
+        return named_message_encode_json(name, encoder.json_encode(value))
     # Not very functional, if this becomes a problem, refactor Encoder result type :/
     raise CodecParseException(f"This encoder can't encode {type(value).__name__}")
 
@@ -165,7 +179,7 @@ def named_message_union_encoder_json(
     encoders: Dict[Type[NAMED_MESSAGE], Tuple[str, EncoderJSON[NAMED_MESSAGE]]],
 ) -> EncoderJSON[NAMED_MESSAGE]:
     """Create named message union encoder"""
-    return EncoderJSON(partial(named_message_union_encode_json, encoders))
+    return EncoderJSON(partial(named_message_union_encode_json, TypeLookup(encoders)))
 
 
 # protocol.UploadMessage
@@ -807,8 +821,9 @@ def minos_suite_packet_decode_json(
     if not isinstance(outgoing, bool):
         return Err(CodecParseException("MinOSPacket outgoing must be a boolean or None"))
     sent_at = value.get("sentAt")
-    if not isinstance(sent_at, int):
-        return Err(CodecParseException("MinOSPacket sentAt must be an integer"))
+    # Recorded results have fractional milliseconds
+    if not isinstance(sent_at, (int, float)) or isinstance(sent_at, bool):
+        return Err(CodecParseException("MinOSPacket sentAt must be a number"))
     sent_timestamp = value.get("sentTimestamp")
     if sent_timestamp is not None and not isinstance(sent_timestamp, str):
         return Err(CodecParseException("MinOSPacket sentTimestamp must be an string or None"))
@@ -830,6 +845,21 @@ def minos_suite_packet_decode_json(
         if not isinstance(payload, int):
             return Err(CodecParseException("MinOSPacket switch chunk payload must be a boolean array"))
         parsed_chunk = IndexedButtonChunk(payload)
+    elif packet_type == LEDChunk.type_text():
+        if not isinstance(payload, list):
+            return Err(CodecParseException("MinOSPacket LED chunk payload must be a boolean array"))
+        byte_result = FancyByte.from_bits(payload)
+        if isinstance(byte_result, Err):
+            return Err(CodecParseException(f"MinOSPacket LED chunk payload parse error: {byte_result.value}"))
+        parsed_chunk = LEDChunk(byte_result.value)
+    elif packet_type == DisplayChunk.type_text():
+        if not isinstance(payload, dict) or not isinstance(payload.get("index"), int) or \
+                not isinstance(payload.get("bits"), list):
+            return Err(CodecParseException("MinOSPacket display chunk payload must be an object with index & bits"))
+        byte_result = FancyByte.from_bits(payload["bits"])
+        if isinstance(byte_result, Err):
+            return Err(CodecParseException(f"MinOSPacket display chunk payload parse error: {byte_result.value}"))
+        parsed_chunk = DisplayChunk(payload["index"], byte_result.value)
     else:
         return Err(CodecParseException(f"MinOSPacket type unknown"))
     return Ok(MinOSSuitePacket(parsed_chunk, sent_at, sent_timestamp, outgoing))
@@ -849,13 +879,21 @@ def minos_suite_encode_json(value: MinOSSuite) -> JSON:
     for packet in value.chunks:
         encoded = COMMON_MINOS_SUITE_PACKET_ENCODER_JSON.json_encode(packet)
         packets.append(encoded)
-    return {
+    encoded = {
         "chunks": packets,
         "tresholdTime": value.treshold_time,
         "tresholdChunks": value.treshold_chunks,
         "startTime": value.start_time,
         "startTimeStamp": value.start_timestamp
     }
+    if value.replay is not None:
+        encoded["replay"] = {
+            "speed": value.replay.speed,
+            "jitterMs": [round(jitter, 3) for jitter in value.replay.jitter_ms],
+            "meanJitterMs": round(value.replay.mean_jitter_ms(), 3),
+            "maxJitterMs": round(value.replay.max_jitter_ms(), 3)
+        }
+    return encoded
 
 
 def minos_suite_decode_json(
@@ -879,8 +917,8 @@ def minos_suite_decode_json(
     start_time = value.get("startTime")
     if start_time is None:
         start_time = 0
-    if not isinstance(start_time, int):
-        return Err(CodecParseException("MinOSPacket startTime must be an integer"))
+    if not isinstance(start_time, (int, float)) or isinstance(start_time, bool):
+        return Err(CodecParseException("MinOSPacket startTime must be a number"))
     start_timestamp = value.get("startTimestamp")
     if start_timestamp is not None and not isinstance(start_timestamp, str):
         return Err(CodecParseException("MinOSPacket startTimestamp must be an string or None"))
@@ -892,3 +930,36 @@ COMMON_MINOS_SUITE_DECODER_JSON: DecoderJSON[MinOSSuite] = DecoderJSON(minos_sui
 COMMON_MINOS_SUITE_CODEC_JSON: CodecJSON[MinOSSuite] = CodecJSON(
     COMMON_MINOS_SUITE_DECODER_JSON,
     COMMON_MINOS_SUITE_ENCODER_JSON)
+
+
+# MinOSLatencyReport
+def minos_latency_stats_encode_json(value: MinOSLatencyStats) -> JSON:
+    """Serialize MinOSLatencyStats into JSON"""
+    return {
+        "stimulusType": value.stimulus_type,
+        "answered": value.answered,
+        "unanswered": value.unanswered,
+        "p50Ms": value.p50_ms,
+        "p90Ms": value.p90_ms,
+        "p99Ms": value.p99_ms,
+        "maxMs": value.max_ms
+    }
+
+
+def minos_latency_report_encode_json(value: MinOSLatencyReport) -> JSON:
+    """Serialize MinOSLatencyReport into JSON"""
+    return {
+        "responseType": value.response_type,
+        "stats": [minos_latency_stats_encode_json(stats) for stats in value.stats],
+        "samples": [{
+            "stimulusType": sample.stimulus_type,
+            "sentAt": sample.sent_at,
+            "responseType": sample.response_type,
+            "latencyMs": sample.latency_ms
+        } for sample in value.samples]
+    }
+
+
+MINOS_LATENCY_REPORT_ENCODER_JSON: EncoderJSON[MinOSLatencyReport] = EncoderJSON(minos_latency_report_encode_json)
+MINOS_LATENCY_STATS_LIST_ENCODER_JSON: EncoderJSON[List[MinOSLatencyStats]] = \
+    list_encoder_json(EncoderJSON(minos_latency_stats_encode_json))
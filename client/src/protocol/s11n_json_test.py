@@ -6,7 +6,8 @@ from uuid import UUID
 from result import Ok, Err
 
 from src.domain.managed_uuid import ManagedUUID
-from src.domain.minos_chunks import TextChunk
+from src.domain.fancy_byte import FancyByte
+from src.domain.minos_chunks import TextChunk, LEDChunk, DisplayChunk
 from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
 from src.protocol import s11n_json
 from src.protocol.codec import CodecParseException
@@ -66,6 +67,20 @@ class TestS11nJSON(unittest.TestCase):
         self.assertTrue(isinstance(bad_unserialization, Err))
         self.assertEqual(bad_unserialization.value, bad_unserialization_expectation)
 
+    def test_named_message_union_index(self):
+        """Test union decoder only tries decoders of the message command, in registration order"""
+        decoder = s11n_json.named_message_union_decoder_json({
+            str: ("text", s11n_json.STRING_DECODER_JSON),
+            dict: ("text", s11n_json.UNIT_DECODER_JSON),
+        })
+
+        self.assertEqual(decoder.json_decode({"command": "text", "payload": "potat"}), Ok("potat"))
+        self.assertEqual(decoder.json_decode({"command": "text", "payload": {}}), Ok({}))
+        for bad_message in [{"command": "other", "payload": "potat"}, {"command": "text"}, {"payload": "potat"}]:
+            self.assertEqual(
+                decoder.json_decode(bad_message),
+                Err(CodecParseException("Failed to decode any named message from decoder union")))
+
     def test_minos_suite_codec(self):
         codec = s11n_json.COMMON_MINOS_SUITE_CODEC_JSON
         input = MinOSSuite([
@@ -105,6 +120,17 @@ class TestS11nJSON(unittest.TestCase):
         output = codec.decoder.json_decode(serialized_json)
         self.assertEqual(Ok(input), output)
 
+    def test_minos_suite_packet_codec(self):
+        """Test recorded packets, i.e. board output with fractional timing, decode back"""
+        codec = s11n_json.COMMON_MINOS_SUITE_PACKET_CODEC_JSON
+        packets = [
+            MinOSSuitePacket(LEDChunk(FancyByte(0b10000001)), 12.5, "2022-01-01 00:00:00.000000", False),
+            MinOSSuitePacket(DisplayChunk(3, FancyByte(0b00110000)), 20.25, "2022-01-01 00:00:00.000000", False),
+        ]
+        for packet in packets:
+            with self.subTest(packet=packet):
+                self.assertEqual(codec.decoder.json_decode(codec.encoder.json_encode(packet)), Ok(packet))
+
 
 if __name__ == '__main__':
     unittest.main()
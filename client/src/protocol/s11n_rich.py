@@ -1,9 +1,10 @@
 """Module containing Python-to-rich serialization logic"""
 from dataclasses import dataclass
-from typing import TypeVar, Generic, Tuple, List
+from typing import TypeVar, Generic, Tuple, List, Optional
 from rich.table import Table
 
 from src.domain.backend_entity import Hardware, User, Software
+from src.engine.monitor.minos.minos_latency import MinOSLatencyStats
 
 A = TypeVar("A")
 
@@ -60,3 +61,22 @@ class RichUserEncoder(RichEncoder[Hardware]):
         for value in values:
             table.add_row(*RichUserEncoder.toRow(value))
         return table
+
+
+@dataclass
+class RichMinOSLatencyEncoder(RichEncoder[MinOSLatencyStats]):
+    @staticmethod
+    def toRow(value: MinOSLatencyStats) -> Tuple[str, str, str, str, str, str, str]:
+        def ms(latency: Optional[float]) -> str:
+            return "-" if latency is None else f"{latency:.1f}"
+        return value.stimulus_type, str(value.answered), str(value.unanswered), \
+            ms(value.p50_ms), ms(value.p90_ms), ms(value.p99_ms), ms(value.max_ms)
+
+    @staticmethod
+    def toTable(values: List[MinOSLatencyStats]) -> Table:
+        table = Table(
+            "Stimulus", "Answered", "Unanswered", "p50 ms", "p90 ms", "p99 ms", "Max ms",
+            title="MinOS round-trip latency")
+        for value in values:
+            table.add_row(*RichMinOSLatencyEncoder.toRow(value))
+        return table
@@ -3,12 +3,13 @@
 import asyncio
 import sys
 import webbrowser
-from typing import Tuple, Optional, List, Union, TypeVar, Any
+from typing import Tuple, Optional, List, Union, TypeVar, Any, TextIO
 
 import appdirs
 from result import Err, Result, Ok
 from rich.table import Table
 from src.agent.agent import Agent
+from src.agent.agent_coalescer import AgentCoalescer
 from src.agent.agent_config import AgentConfig
 from src.domain.backend_entity import User, Hardware, Software
 from src.domain.config import Config
@@ -24,6 +25,7 @@ from src.domain.positive_integer import PositiveInteger
 from src.engine.board.anvyl.engine_anvyl_upload import EngineAnvylUpload
 from src.engine.board.fake.engine_fake import EngineFakeBoardState, EngineFakeState, EngineFakeUpload, \
     EngineFakeSerialMonitor, EngineFake
+from src.engine.board.fake.minos_simulator import MinOSSimulator, MinOSSimulatorConfig
 from src.engine.board.icestick.engine_icestick import EngineIcestick
 from src.engine.board.icestick.engine_icestick_state import EngineIcestickBoardState, EngineIcestickState
 from src.engine.board.icestick.engine_icestick_upload import EngineIcestickUpload
@@ -34,24 +36,34 @@ from src.engine.engine_auth import EngineAuth
 from src.engine.engine_lifecycle import EngineLifecycle
 from src.engine.engine_ping import EnginePing
 from src.engine.board.engine_serial_monitor import EngineSerialMonitor
-from src.engine.engine_state import EngineBase
-from src.engine.monitor.minos.minos_suite import MinOSSuite
+from src.engine.engine_state import EngineBase, ManagedQueue, QueueOverflowPolicy
+from src.engine.monitor.minos.minos_framebuffer import MinOSDisplayConfig
+from src.engine.monitor.minos.minos_latency import MinOSLatencyReport, latency_report
+from src.engine.monitor.minos.minos_suite import MinOSSuite, MinOSSuitePacket
+from src.engine.monitor.minos.minos_suite_replay import MinOSReplayConfig
 from src.engine.video.engine_video import EngineVideo
 from src.engine.video.engine_video_state import EngineVideoState
 from src.engine.video.engine_video_stream import EngineVideoStream
+from src.monitor.monitor_hex_renderer import HexRenderConfig
+from src.monitor.monitor_input import MonitorInputConfig
+from src.monitor.monitor_led_frame import LEDRenderConfig
+from src.monitor.monitor_minos_suite_runner import MinOSSuiteRunner, load_suite_specs
 from src.monitor.monitor_serial import MonitorSerial
+from src.monitor.monitor_serial_min_os import MonitorSerialMinOS
 from src.monitor.monitor_type import MonitorType
 from src.protocol.codec_json import JSON, EncoderJSON, DecoderJSON
 from src.protocol.s11n_hybrid import COMMON_INCOMING_MESSAGE_DECODER, COMMON_OUTGOING_MESSAGE_ENCODER, \
     COMMON_OUTGOING_VIDEO_MESSAGE_ENCODER, COMMON_INCOMING_VIDEO_MESSAGE_DECODER
 from src.protocol.s11n_json import CONFIG_ENCODER_JSON, COMMON_MINOS_SUITE_DECODER_JSON, list_decode_json, \
-    COMMON_MINOS_SUITE_PACKET_DECODER_JSON
+    COMMON_MINOS_SUITE_PACKET_DECODER_JSON, MINOS_LATENCY_REPORT_ENCODER_JSON
 from src.protocol.s11n_rich import RichEncoder
 from src.service.backend import BackendConfig, BackendService, BackendServiceInterface
 from src.service.backend_config import UserPassAuthConfig
 from src.service.config_service import ConfigService
+from src.service.managed_serial_config import ManagedSerialStreamConfig
 from src.service.managed_url import ManagedURL
-from src.service.managed_video_stream import VideoStreamConfig, ExistingStreamConfig, VLCStreamConfig
+from src.service.managed_video_stream import VideoStreamConfig, ExistingStreamConfig, VLCStreamConfig, \
+    VideoRelayConfig, PipeStreamConfig, VideoPipeCodec
 from src.service.ws import WebSocket
 from src.util import log
 from rich import print as richprint, print_json
@@ -121,7 +133,14 @@ class CLIInterface:
         username_str: Optional[str],
         password_str: Optional[str],
         heartbeat_seconds: int,
-        device_path_str: str
+        device_path_str: str,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         pass
 
@@ -136,7 +155,14 @@ class CLIInterface:
         heartbeat_seconds: int,
         device_name_str: str,
         scan_chain_index: int,
-        device_path_str: str
+        device_path_str: str,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         pass
 
@@ -148,7 +174,16 @@ class CLIInterface:
         static_server_str: Optional[str],
         username_str: Optional[str],
         password_str: Optional[str],
-        heartbeat_seconds: int
+        heartbeat_seconds: int,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int],
+        fake_board: str,
+        fake_minos_display_rate: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         pass
 
@@ -254,6 +289,19 @@ class CLIInterface:
         minos_spec_json: Optional[str],
         minos_spec_timeout: Optional[int],
         minos_spec_chunks: Optional[int],
+        minos_result_jsonl: Optional[str],
+        minos_replay_speed: Optional[float],
+        minos_display_width: Optional[int],
+        minos_display_height: Optional[int],
+        minos_display_fps: Optional[int],
+        led_render_fps: Optional[int],
+        led_persistence: bool,
+        hex_xxd: bool,
+        hex_flush_ms: Optional[int],
+        hex_max_lag_bytes: Optional[int],
+        input_batch_ms: Optional[int],
+        send_file: Optional[str],
+        send_file_baudrate: Optional[int],
     ):
         pass
 
@@ -275,9 +323,45 @@ class CLIInterface:
         minos_spec_json: Optional[str],
         minos_spec_timeout: Optional[int],
         minos_spec_chunks: Optional[int],
+        minos_result_jsonl: Optional[str],
+        minos_replay_speed: Optional[float],
+        minos_display_width: Optional[int],
+        minos_display_height: Optional[int],
+        minos_display_fps: Optional[int],
+        led_render_fps: Optional[int],
+        led_persistence: bool,
+        hex_xxd: bool,
+        hex_flush_ms: Optional[int],
+        hex_max_lag_bytes: Optional[int],
+        input_batch_ms: Optional[int],
+        send_file: Optional[str],
+        send_file_baudrate: Optional[int],
     ) -> Result[Optional[DIPRunnable], DIPClientError]:
         pass
 
+    @staticmethod
+    def minos_suite_run(
+        config_path_str: Optional[str],
+        control_server_str: Optional[str],
+        username_str: Optional[str],
+        password_str: Optional[str],
+        heartbeat_seconds: int,
+        minos_spec_dir: str,
+        hardware_ids_str: str,
+        minos_concurrency: Optional[int],
+        minos_output_dir: str,
+        minos_replay_speed: Optional[float],
+    ) -> Result[DIPRunnable, DIPClientError]:
+        pass
+
+    @staticmethod
+    def minos_latency(
+        minos_result_file: str,
+        minos_latency_response: Optional[str],
+        minos_latency_output: Optional[str],
+    ) -> Result[MinOSLatencyReport, DIPClientError]:
+        pass
+
     @staticmethod
     async def agent_hardware_camera(
         config_path_str: Optional[str],
@@ -295,8 +379,18 @@ class CLIInterface:
         audio_sample_rate: Optional[int],
         audio_buffer_size: Optional[int],
         port: Optional[int],
+        stream_pipe: bool,
+        stream_encoder: Optional[str],
+        stream_codec_str: Optional[str],
+        stream_bitrate: Optional[int],
+        stream_fps: Optional[int],
         username_str: Optional[str],
         password_str: Optional[str],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int],
+        stream_relay_chunk: Optional[int],
+        stream_relay_in_flight: Optional[int],
     ) -> Result[Agent, DIPClientError]:
         pass
 
@@ -555,6 +649,64 @@ class CLI(CLIInterface):
             device_path_result.value
         ))
 
+    @staticmethod
+    def parsed_outgoing_queue(
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str]
+    ) -> Result[ManagedQueue, DIPClientError]:
+        if outgoing_queue_size is None:
+            return Ok(ManagedQueue.build())
+
+        max_size_result = PositiveInteger.build(outgoing_queue_size)
+        if isinstance(max_size_result, Err): return Err(max_size_result.value.of_type("outgoing queue size"))
+        policy_str = outgoing_queue_policy_str if outgoing_queue_policy_str is not None \
+            else QueueOverflowPolicy.block.value
+        try:
+            policy = QueueOverflowPolicy(policy_str)
+        except ValueError:
+            return Err(GenericClientError(f"Unknown outgoing queue policy '{policy_str}'"))
+
+        return Ok(ManagedQueue.build(max_size=max_size_result.value.value, policy=policy))
+
+    @staticmethod
+    def parsed_event_batch_size(event_batch_size: Optional[int]) -> Result[int, DIPClientError]:
+        if event_batch_size is None:
+            return Ok(1)
+
+        batch_size_result = PositiveInteger.build(event_batch_size)
+        if isinstance(batch_size_result, Err): return Err(batch_size_result.value.of_type("event batch size"))
+        return Ok(batch_size_result.value.value)
+
+    @staticmethod
+    def parsed_serial_stream_config(
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int]
+    ) -> Result[Optional[ManagedSerialStreamConfig], DIPClientError]:
+        if serial_stream_bytes is None and serial_stream_delay is None:
+            return Ok(None)
+
+        max_bytes_result = PositiveInteger.build(serial_stream_bytes if serial_stream_bytes is not None else 4096)
+        if isinstance(max_bytes_result, Err): return Err(max_bytes_result.value.of_type("serial stream bytes"))
+        max_delay_result = PositiveInteger.build(serial_stream_delay if serial_stream_delay is not None else 10)
+        if isinstance(max_delay_result, Err): return Err(max_delay_result.value.of_type("serial stream delay"))
+
+        return Ok(ManagedSerialStreamConfig(max_bytes_result.value.value, max_delay_result.value.value / 1000))
+
+    @staticmethod
+    def parsed_agent_coalescer(
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int]
+    ) -> Result[Optional[AgentCoalescer], DIPClientError]:
+        if serial_coalesce_bytes is None and serial_coalesce_delay is None:
+            return Ok(None)
+
+        max_bytes_result = PositiveInteger.build(serial_coalesce_bytes if serial_coalesce_bytes is not None else 4096)
+        if isinstance(max_bytes_result, Err): return Err(max_bytes_result.value.of_type("serial coalesce bytes"))
+        max_delay_result = PositiveInteger.build(serial_coalesce_delay if serial_coalesce_delay is not None else 10)
+        if isinstance(max_delay_result, Err): return Err(max_delay_result.value.of_type("serial coalesce delay"))
+
+        return Ok(AgentCoalescer(max_bytes_result.value.value, max_delay_result.value.value / 1000))
+
     @staticmethod
     async def agent_nrf52(
         config_path_str: Optional[str],
@@ -564,7 +716,14 @@ class CLI(CLIInterface):
         username_str: Optional[str],
         password_str: Optional[str],
         heartbeat_seconds: int,
-        device_path_str: str
+        device_path_str: str,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         # Common agent input
         common_agent_input_result: Result = CLI.parsed_agent_input(
@@ -573,16 +732,24 @@ class CLI(CLIInterface):
         if isinstance(common_agent_input_result, Err): return common_agent_input_result
         (hardware_id, heartbeat_seconds, backend, hardware_control_url, device_path) = \
             common_agent_input_result.value
+        stream_config_result = CLI.parsed_serial_stream_config(serial_stream_bytes, serial_stream_delay)
+        if isinstance(stream_config_result, Err): return Err(stream_config_result.value)
+        coalescer_result = CLI.parsed_agent_coalescer(serial_coalesce_bytes, serial_coalesce_delay)
+        if isinstance(coalescer_result, Err): return Err(coalescer_result.value)
+        outgoing_queue_result = CLI.parsed_outgoing_queue(outgoing_queue_size, outgoing_queue_policy_str)
+        if isinstance(outgoing_queue_result, Err): return Err(outgoing_queue_result.value)
+        event_batch_size_result = CLI.parsed_event_batch_size(event_batch_size)
+        if isinstance(event_batch_size_result, Err): return Err(event_batch_size_result.value)
 
         # Engine
-        base = await EngineBase.build()
+        base = await EngineBase.build(outgoing_queue_result.value, event_batch_size_result.value)
         board_state = EngineNRF52BoardState(device_path)
         engine_state = \
             EngineNRF52State(base, hardware_id, backend, heartbeat_seconds, board_state, backend.config.auth)
         engine_lifecycle = EngineLifecycle()
         engine_upload = EngineNRF52Upload(backend)
         engine_ping = EnginePing()
-        engine_serial_monitor = EngineSerialMonitor()
+        engine_serial_monitor = EngineSerialMonitor(stream_config_result.value)
         engine_auth = EngineAuth()
         engine = \
             EngineNRF52(engine_state, engine_lifecycle, engine_upload, engine_ping, engine_serial_monitor, engine_auth)
@@ -592,7 +759,7 @@ class CLI(CLIInterface):
         decoder = COMMON_INCOMING_MESSAGE_DECODER
         websocket = WebSocket(hardware_control_url, decoder, encoder)
 
-        return Ok(Agent(AgentConfig(engine, websocket)))
+        return Ok(Agent(AgentConfig(engine, websocket, coalescer_result.value)))
 
     @staticmethod
     async def agent_icestick(
@@ -604,7 +771,14 @@ class CLI(CLIInterface):
         password_str: Optional[str],
         heartbeat_seconds: int,
         device_name_str: str,
-        device_path_str: str
+        device_path_str: str,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         # Common agent input
         common_agent_input_result: Result = CLI.parsed_agent_input(
@@ -613,16 +787,24 @@ class CLI(CLIInterface):
         if isinstance(common_agent_input_result, Err): return common_agent_input_result
         (hardware_id, heartbeat_seconds, backend, hardware_control_url, device_path) = \
             common_agent_input_result.value
+        stream_config_result = CLI.parsed_serial_stream_config(serial_stream_bytes, serial_stream_delay)
+        if isinstance(stream_config_result, Err): return Err(stream_config_result.value)
+        coalescer_result = CLI.parsed_agent_coalescer(serial_coalesce_bytes, serial_coalesce_delay)
+        if isinstance(coalescer_result, Err): return Err(coalescer_result.value)
+        outgoing_queue_result = CLI.parsed_outgoing_queue(outgoing_queue_size, outgoing_queue_policy_str)
+        if isinstance(outgoing_queue_result, Err): return Err(outgoing_queue_result.value)
+        event_batch_size_result = CLI.parsed_event_batch_size(event_batch_size)
+        if isinstance(event_batch_size_result, Err): return Err(event_batch_size_result.value)
 
         # Engine
-        base = await EngineBase.build()
+        base = await EngineBase.build(outgoing_queue_result.value, event_batch_size_result.value)
         board_state = EngineIcestickBoardState(device_name_str, device_path)
         engine_state = \
             EngineIcestickState(base, hardware_id, backend, heartbeat_seconds, board_state, backend.config.auth)
         engine_lifecycle = EngineLifecycle()
         engine_upload = EngineIcestickUpload(backend)
         engine_ping = EnginePing()
-        engine_serial_monitor = EngineSerialMonitor()
+        engine_serial_monitor = EngineSerialMonitor(stream_config_result.value)
         engine_auth = EngineAuth()
         engine = \
             EngineIcestick(engine_state, engine_lifecycle, engine_upload, engine_ping, engine_serial_monitor, engine_auth)
@@ -632,7 +814,7 @@ class CLI(CLIInterface):
         decoder = COMMON_INCOMING_MESSAGE_DECODER
         websocket = WebSocket(hardware_control_url, decoder, encoder)
 
-        return Ok(Agent(AgentConfig(engine, websocket)))
+        return Ok(Agent(AgentConfig(engine, websocket, coalescer_result.value)))
 
     @staticmethod
     async def agent_anvyl(
@@ -645,7 +827,14 @@ class CLI(CLIInterface):
         heartbeat_seconds: int,
         device_name_str: str,
         scan_chain_index: int,
-        device_path_str: str
+        device_path_str: str,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         # Common agent input
         common_agent_input_result: Result = CLI.parsed_agent_input(
@@ -654,16 +843,24 @@ class CLI(CLIInterface):
         if isinstance(common_agent_input_result, Err): return common_agent_input_result
         (hardware_id, heartbeat_seconds, backend, hardware_control_url, device_path) = \
             common_agent_input_result.value
+        stream_config_result = CLI.parsed_serial_stream_config(serial_stream_bytes, serial_stream_delay)
+        if isinstance(stream_config_result, Err): return Err(stream_config_result.value)
+        coalescer_result = CLI.parsed_agent_coalescer(serial_coalesce_bytes, serial_coalesce_delay)
+        if isinstance(coalescer_result, Err): return Err(coalescer_result.value)
+        outgoing_queue_result = CLI.parsed_outgoing_queue(outgoing_queue_size, outgoing_queue_policy_str)
+        if isinstance(outgoing_queue_result, Err): return Err(outgoing_queue_result.value)
+        event_batch_size_result = CLI.parsed_event_batch_size(event_batch_size)
+        if isinstance(event_batch_size_result, Err): return Err(event_batch_size_result.value)
 
         # Engine
-        base = await EngineBase.build()
+        base = await EngineBase.build(outgoing_queue_result.value, event_batch_size_result.value)
         board_state = EngineAnvylBoardState(device_name_str, device_path, scan_chain_index)
         engine_state = \
             EngineAnvylState(base, hardware_id, backend, heartbeat_seconds, board_state, backend.config.auth)
         engine_lifecycle = EngineLifecycle()
         engine_upload = EngineAnvylUpload(backend)
         engine_ping = EnginePing()
-        engine_serial_monitor = EngineSerialMonitor()
+        engine_serial_monitor = EngineSerialMonitor(stream_config_result.value)
         engine_auth = EngineAuth()
         engine = \
             EngineAnvyl(engine_state, engine_lifecycle, engine_upload, engine_ping, engine_serial_monitor, engine_auth)
@@ -673,7 +870,7 @@ class CLI(CLIInterface):
         decoder = COMMON_INCOMING_MESSAGE_DECODER
         websocket = WebSocket(hardware_control_url, decoder, encoder)
 
-        return Ok(Agent(AgentConfig(engine, websocket)))
+        return Ok(Agent(AgentConfig(engine, websocket, coalescer_result.value)))
 
     @staticmethod
     async def agent_fake(
@@ -683,7 +880,16 @@ class CLI(CLIInterface):
         static_server_str: Optional[str],
         username_str: Optional[str],
         password_str: Optional[str],
-        heartbeat_seconds: int
+        heartbeat_seconds: int,
+        serial_stream_bytes: Optional[int],
+        serial_stream_delay: Optional[int],
+        serial_coalesce_bytes: Optional[int],
+        serial_coalesce_delay: Optional[int],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int],
+        fake_board: str,
+        fake_minos_display_rate: Optional[int]
     ) -> Result[Agent, DIPClientError]:
         # Common agent input
         device_path = ExistingFilePath(src_relative_path("static/test/device"))
@@ -693,15 +899,25 @@ class CLI(CLIInterface):
         if isinstance(common_agent_input_result, Err): return common_agent_input_result
         (hardware_id, heartbeat_seconds, backend, hardware_control_url, device_path) = \
             common_agent_input_result.value
+        stream_config_result = CLI.parsed_serial_stream_config(serial_stream_bytes, serial_stream_delay)
+        if isinstance(stream_config_result, Err): return Err(stream_config_result.value)
+        coalescer_result = CLI.parsed_agent_coalescer(serial_coalesce_bytes, serial_coalesce_delay)
+        if isinstance(coalescer_result, Err): return Err(coalescer_result.value)
+        outgoing_queue_result = CLI.parsed_outgoing_queue(outgoing_queue_size, outgoing_queue_policy_str)
+        if isinstance(outgoing_queue_result, Err): return Err(outgoing_queue_result.value)
+        event_batch_size_result = CLI.parsed_event_batch_size(event_batch_size)
+        if isinstance(event_batch_size_result, Err): return Err(event_batch_size_result.value)
+        simulator_result = CLI.parsed_minos_simulator(fake_board, fake_minos_display_rate)
+        if isinstance(simulator_result, Err): return Err(simulator_result.value)
 
         # Engine
-        base = await EngineBase.build()
+        base = await EngineBase.build(outgoing_queue_result.value, event_batch_size_result.value)
         board_state = EngineFakeBoardState(device_path)
         engine_state = EngineFakeState(base, hardware_id, backend, heartbeat_seconds, board_state, backend.config.auth)
         engine_lifecycle = EngineLifecycle()
         engine_upload = EngineFakeUpload(backend)
         engine_ping = EnginePing()
-        engine_serial_monitor = EngineFakeSerialMonitor()
+        engine_serial_monitor = EngineFakeSerialMonitor(stream_config_result.value, simulator=simulator_result.value)
         engine_auth = EngineAuth()
         engine = \
             EngineFake(engine_state, engine_lifecycle, engine_upload, engine_ping, engine_serial_monitor, engine_auth)
@@ -711,7 +927,7 @@ class CLI(CLIInterface):
         decoder = COMMON_INCOMING_MESSAGE_DECODER
         websocket = WebSocket(hardware_control_url, decoder, encoder)
 
-        return Ok(Agent(AgentConfig(engine, websocket)))
+        return Ok(Agent(AgentConfig(engine, websocket, coalescer_result.value)))
 
     @staticmethod
     def user_list(
@@ -887,7 +1103,90 @@ class CLI(CLIInterface):
                 return Err(GenericClientError(f"MinOSSuite time treshold must be defined"))
             if minos_spec_chunks is None:
                 return Err(GenericClientError(f"MinOSSuite chunk treshold must be defined"))
-            return Ok(MinOSSuite(suite_packets_result.value, minos_spec_timeout, minos_spec_chunks, 0))
+            return Ok(MinOSSuite(suite_packets_result.value, minos_spec_timeout, minos_spec_chunks, 0, None))
+
+    @staticmethod
+    def parsed_minos_result_jsonl(
+        monitor_type: MonitorType,
+        minos_result_jsonl: Optional[str],
+    ) -> Result[Optional[TextIO], DIPClientError]:
+        if monitor_type != MonitorType.minosrequest or minos_result_jsonl is None: return Ok(None)
+        try:
+            # Line buffered, so that packets of an interrupted suite aren't lost
+            return Ok(open(minos_result_jsonl, "w", buffering=1))
+        except OSError as e:
+            return Err(GenericClientError(f"Failed to open MinOS result file: {e}"))
+
+    @staticmethod
+    def parsed_minos_simulator(
+        fake_board: str,
+        fake_minos_display_rate: Optional[int]
+    ) -> Result[Optional[MinOSSimulator], DIPClientError]:
+        if fake_board != "minos": return Ok(None)
+        config_result = MinOSSimulatorConfig.build(
+            fake_minos_display_rate if fake_minos_display_rate is not None else 64)
+        if isinstance(config_result, Err): return Err(config_result.value)
+        return Ok(MinOSSimulator(config_result.value))
+
+    @staticmethod
+    def parsed_minos_display_config(
+        minos_display_width: Optional[int],
+        minos_display_height: Optional[int],
+        minos_display_fps: Optional[int]
+    ) -> Result[MinOSDisplayConfig, DIPClientError]:
+        width_result = PositiveInteger.build(minos_display_width if minos_display_width is not None else 8)
+        if isinstance(width_result, Err): return Err(width_result.value.of_type("MinOS display width"))
+        height_result = PositiveInteger.build(minos_display_height if minos_display_height is not None else 8)
+        if isinstance(height_result, Err): return Err(height_result.value.of_type("MinOS display height"))
+        fps_result = PositiveInteger.build(minos_display_fps if minos_display_fps is not None else 10)
+        if isinstance(fps_result, Err): return Err(fps_result.value.of_type("MinOS display fps"))
+
+        return MinOSDisplayConfig.build(width_result.value.value, height_result.value.value, fps_result.value.value)
+
+    @staticmethod
+    def parsed_led_render_config(
+        led_render_fps: Optional[int],
+        led_persistence: bool
+    ) -> Result[LEDRenderConfig, DIPClientError]:
+        fps_result = PositiveInteger.build(led_render_fps if led_render_fps is not None else 30)
+        if isinstance(fps_result, Err): return Err(fps_result.value.of_type("LED render fps"))
+
+        return Ok(LEDRenderConfig(fps_result.value.value, led_persistence))
+
+    @staticmethod
+    def parsed_hex_render_config(
+        hex_xxd: bool,
+        hex_flush_ms: Optional[int],
+        hex_max_lag_bytes: Optional[int]
+    ) -> Result[HexRenderConfig, DIPClientError]:
+        flush_ms_result = PositiveInteger.build(hex_flush_ms if hex_flush_ms is not None else 50)
+        if isinstance(flush_ms_result, Err): return Err(flush_ms_result.value.of_type("hex flush milliseconds"))
+        max_lag_result = PositiveInteger.build(hex_max_lag_bytes if hex_max_lag_bytes is not None else 65536)
+        if isinstance(max_lag_result, Err): return Err(max_lag_result.value.of_type("hex max lag bytes"))
+
+        return Ok(HexRenderConfig(hex_xxd, flush_ms_result.value.value, max_lag_result.value.value))
+
+    @staticmethod
+    def parsed_monitor_input_config(
+        input_batch_ms: Optional[int],
+        send_file: Optional[str],
+        send_file_baudrate: Optional[int]
+    ) -> Result[MonitorInputConfig, DIPClientError]:
+        batch_ms_result = PositiveInteger.build(input_batch_ms if input_batch_ms is not None else 5)
+        if isinstance(batch_ms_result, Err): return Err(batch_ms_result.value.of_type("input batch milliseconds"))
+        baudrate_result = PositiveInteger.build(send_file_baudrate if send_file_baudrate is not None else 115200)
+        if isinstance(baudrate_result, Err): return Err(baudrate_result.value.of_type("send file baudrate"))
+
+        send_file_path: Optional[str] = None
+        if send_file is not None:
+            file_result = ExistingFilePath.build(send_file)
+            if isinstance(file_result, Err): return Err(file_result.value.of_type("send file"))
+            send_file_path = file_result.value.value
+
+        return Ok(MonitorInputConfig(
+            batch_ms=batch_ms_result.value.value,
+            send_file=send_file_path,
+            send_baudrate=baudrate_result.value.value))
 
     @staticmethod
     def hardware_serial_monitor(
@@ -902,6 +1201,19 @@ class CLI(CLIInterface):
         minos_spec_json: Optional[str],
         minos_spec_timeout: Optional[int],
         minos_spec_chunks: Optional[int],
+        minos_result_jsonl: Optional[str],
+        minos_replay_speed: Optional[float],
+        minos_display_width: Optional[int],
+        minos_display_height: Optional[int],
+        minos_display_fps: Optional[int],
+        led_render_fps: Optional[int],
+        led_persistence: bool,
+        hex_xxd: bool,
+        hex_flush_ms: Optional[int],
+        hex_max_lag_bytes: Optional[int],
+        input_batch_ms: Optional[int],
+        send_file: Optional[str],
+        send_file_baudrate: Optional[int],
     ) -> Result[MonitorSerial, DIPClientError]:
         # Build backend
         backend_result = CLI.parsed_backend(config_path_str, control_server_str, None, username_str, password_str)
@@ -931,9 +1243,36 @@ class CLI(CLIInterface):
         if isinstance(minos_suite_result, Err): return Err(minos_suite_result.value)
         minos_suite = minos_suite_result.value
 
+        # MinOS suite replay
+        minos_replay_result = MinOSReplayConfig.build(minos_replay_speed if minos_replay_speed is not None else 1.0)
+        if isinstance(minos_replay_result, Err): return Err(minos_replay_result.value)
+
+        # MinOS display
+        minos_display_result = CLI.parsed_minos_display_config(
+            minos_display_width, minos_display_height, minos_display_fps)
+        if isinstance(minos_display_result, Err): return Err(minos_display_result.value)
+
+        # LED rendering
+        led_render_result = CLI.parsed_led_render_config(led_render_fps, led_persistence)
+        if isinstance(led_render_result, Err): return Err(led_render_result.value)
+
+        # Hex rendering
+        hex_render_result = CLI.parsed_hex_render_config(hex_xxd, hex_flush_ms, hex_max_lag_bytes)
+        if isinstance(hex_render_result, Err): return Err(hex_render_result.value)
+
+        # Monitor input
+        monitor_input_result = CLI.parsed_monitor_input_config(input_batch_ms, send_file, send_file_baudrate)
+        if isinstance(monitor_input_result, Err): return Err(monitor_input_result.value)
+
+        # MinOS suite result stream, opened last so that nothing else can fail after it
+        minos_result_jsonl_result = CLI.parsed_minos_result_jsonl(monitor_serial, minos_result_jsonl)
+        if isinstance(minos_result_jsonl_result, Err): return Err(minos_result_jsonl_result.value)
+
         # Monitor
         return monitor_serial.resolve(
-            heartbeat_seconds_result.value, url_result.value, backend.config.auth, minos_suite)
+            heartbeat_seconds_result.value, url_result.value, backend.config.auth, minos_suite,
+            minos_display_result.value, led_render_result.value, hex_render_result.value,
+            monitor_input_result.value, minos_result_jsonl_result.value, minos_replay_result.value)
 
     @staticmethod
     async def quick_run(
@@ -952,7 +1291,20 @@ class CLI(CLIInterface):
         minos_spec_file: Optional[str],
         minos_spec_json: Optional[str],
         minos_spec_timeout: Optional[int],
-        minos_spec_chunks: Optional[int]
+        minos_spec_chunks: Optional[int],
+        minos_result_jsonl: Optional[str],
+        minos_replay_speed: Optional[float],
+        minos_display_width: Optional[int],
+        minos_display_height: Optional[int],
+        minos_display_fps: Optional[int],
+        led_render_fps: Optional[int],
+        led_persistence: bool,
+        hex_xxd: bool,
+        hex_flush_ms: Optional[int],
+        hex_max_lag_bytes: Optional[int],
+        input_batch_ms: Optional[int],
+        send_file: Optional[str],
+        send_file_baudrate: Optional[int]
     ) -> Result[Optional[DIPRunnable], DIPClientError]:
         # Upload software to platform
         LOGGER.info("Uploading software to platform")
@@ -973,7 +1325,11 @@ class CLI(CLIInterface):
             monitor_result = CLI.hardware_serial_monitor(
                 config_path_str, control_server_str, hardware_id_str, monitor_type_str,
                 username_str, password_str, heartbeat_seconds,
-                minos_spec_file, minos_spec_json, minos_spec_timeout, minos_spec_chunks)
+                minos_spec_file, minos_spec_json, minos_spec_timeout, minos_spec_chunks,
+                minos_result_jsonl, minos_replay_speed,
+                minos_display_width, minos_display_height, minos_display_fps,
+                led_render_fps, led_persistence, hex_xxd, hex_flush_ms, hex_max_lag_bytes,
+                input_batch_ms, send_file, send_file_baudrate)
             if isinstance(monitor_result, Err): return Err(monitor_result.value)
             maybe_monitor = monitor_result.value
         # Open stream in background
@@ -985,6 +1341,122 @@ class CLI(CLIInterface):
         # Return monitor if it was started
         return Ok(maybe_monitor)
 
+    @staticmethod
+    def minos_suite_run(
+        config_path_str: Optional[str],
+        control_server_str: Optional[str],
+        username_str: Optional[str],
+        password_str: Optional[str],
+        heartbeat_seconds: int,
+        minos_spec_dir: str,
+        hardware_ids_str: str,
+        minos_concurrency: Optional[int],
+        minos_output_dir: str,
+        minos_replay_speed: Optional[float],
+    ) -> Result[DIPRunnable, DIPClientError]:
+        # Build backend
+        backend_result = CLI.parsed_backend(config_path_str, control_server_str, None, username_str, password_str)
+        if isinstance(backend_result, Err): return Err(backend_result.value)
+        backend = backend_result.value
+
+        # Hardware pool
+        hardware_ids = []
+        for hardware_id_str in hardware_ids_str.split(","):
+            if hardware_id_str.strip() == "": continue
+            hardware_id_result = ManagedUUID.build(hardware_id_str.strip())
+            if isinstance(hardware_id_result, Err): return Err(hardware_id_result.value.of_type("hardware"))
+            hardware_ids.append(hardware_id_result.value)
+        if not hardware_ids: return Err(GenericClientError("At least one hardware id is required"))
+
+        # Heartbeat
+        heartbeat_seconds_result = PositiveInteger.build(heartbeat_seconds)
+        if isinstance(heartbeat_seconds_result, Err): return Err(heartbeat_seconds_result.value.of_type("heartbeat"))
+
+        # Concurrency
+        concurrency_result = PositiveInteger.build(minos_concurrency if minos_concurrency is not None else 4)
+        if isinstance(concurrency_result, Err): return Err(concurrency_result.value.of_type("MinOS concurrency"))
+
+        # MinOS suite replay
+        minos_replay_result = MinOSReplayConfig.build(minos_replay_speed if minos_replay_speed is not None else 1.0)
+        if isinstance(minos_replay_result, Err): return Err(minos_replay_result.value)
+
+        # MinOS suites
+        specs_result = load_suite_specs(minos_spec_dir)
+        if isinstance(specs_result, Err): return Err(specs_result.value)
+
+        # Monitor for every suite
+        def monitor_for(
+            hardware_id: ManagedUUID,
+            suite: MinOSSuite,
+            death: Death
+        ) -> Result[DIPRunnable, DIPClientError]:
+            url_result = backend.hardware_serial_monitor_url(hardware_id)
+            if isinstance(url_result, Err): return Err(url_result.value)
+            return Ok(MonitorSerialMinOS(
+                heartbeat_seconds_result.value, backend.config.auth, url_result.value, suite,
+                replay_config=minos_replay_result.value, death=death))
+
+        return Ok(MinOSSuiteRunner(
+            specs_result.value, hardware_ids, concurrency_result.value.value, minos_output_dir, monitor_for))
+
+    @staticmethod
+    def parsed_minos_result_packets(minos_result_file: str) -> Result[List[MinOSSuitePacket], DIPClientError]:
+        """Read packets of a minosrequest result, either a suite JSON, its printed
+        '{"success": suite}' output or a --minos-result-jsonl stream"""
+        file_result = ExistingFilePath.build(minos_result_file)
+        if isinstance(file_result, Err):
+            return Err(file_result.value.of_type("minos_result"))
+        content: str
+        try:
+            with open(file_result.value.value) as f:
+                content = f.read()
+        except Exception as e:
+            return Err(GenericClientError(f"Failed to read result file: {e}"))
+
+        if minos_result_file.endswith(".jsonl"):
+            packets = []
+            for number, line in enumerate(content.splitlines(), start=1):
+                if line.strip() == "": continue
+                packet_result = COMMON_MINOS_SUITE_PACKET_DECODER_JSON.decode(line)
+                if isinstance(packet_result, Err):
+                    return Err(GenericClientError(f"MinOSSuite packet on line {number} invalid: {packet_result.value}"))
+                packets.append(packet_result.value)
+            return Ok(packets)
+
+        json_result = DecoderJSON.raw_as_serializable(content)
+        if isinstance(json_result, Err):
+            return Err(GenericClientError("MinOSSuite result must be valid JSON"))
+        json = json_result.value
+        if isinstance(json, dict) and "success" in json:
+            json = json["success"]
+        suite_result = COMMON_MINOS_SUITE_DECODER_JSON.json_decode(json)
+        if isinstance(suite_result, Err):
+            return Err(GenericClientError(f"Failed to decode JSON result: {suite_result.value}"))
+        return Ok(suite_result.value.chunks)
+
+    @staticmethod
+    def minos_latency(
+        minos_result_file: str,
+        minos_latency_response: Optional[str],
+        minos_latency_output: Optional[str],
+    ) -> Result[MinOSLatencyReport, DIPClientError]:
+        # Recorded packets
+        packets_result = CLI.parsed_minos_result_packets(minos_result_file)
+        if isinstance(packets_result, Err): return Err(packets_result.value)
+
+        # Analysis
+        report = latency_report(packets_result.value, minos_latency_response)
+
+        # Export
+        if minos_latency_output is not None:
+            try:
+                with open(minos_latency_output, "w") as f:
+                    f.write(MINOS_LATENCY_REPORT_ENCODER_JSON.encode(report))
+                    f.write("\n")
+            except Exception as e:
+                return Err(GenericClientError(f"Failed to write latency report: {e}"))
+        return Ok(report)
+
     @staticmethod
     def parsed_video_config(
         is_stream_existing: bool,
@@ -997,7 +1469,12 @@ class CLI(CLIInterface):
         video_buffer_size: Optional[int],
         audio_sample_rate: Optional[int],
         audio_buffer_size: Optional[int],
-        port: Optional[int]
+        port: Optional[int],
+        stream_pipe: bool,
+        stream_encoder: Optional[str],
+        stream_codec_str: Optional[str],
+        stream_bitrate: Optional[int],
+        stream_fps: Optional[int]
     ) -> Result[VideoStreamConfig, DIPClientError]:
         if is_stream_existing:
             if stream_url_str is None:
@@ -1010,6 +1487,25 @@ class CLI(CLIInterface):
             if isinstance(video_device_result, Err): return Err(video_device_result.value.of_type("video"))
             if video_width is None: return Err(GenericClientError("Video stream width is required"))
             if video_height is None: return Err(GenericClientError("Video stream height is required"))
+            if stream_pipe:
+                try:
+                    codec = VideoPipeCodec(stream_codec_str) if stream_codec_str is not None else None
+                except ValueError:
+                    return Err(GenericClientError(f"Unknown video stream codec '{stream_codec_str}'"))
+                if stream_bitrate is not None:
+                    bitrate_result = PositiveInteger.build(stream_bitrate)
+                    if isinstance(bitrate_result, Err): return Err(bitrate_result.value.of_type("stream bitrate"))
+                if stream_fps is not None:
+                    fps_result = PositiveInteger.build(stream_fps)
+                    if isinstance(fps_result, Err): return Err(fps_result.value.of_type("stream fps"))
+                return Ok(PipeStreamConfig.build(
+                    stream_encoder,
+                    video_device_result.value,
+                    video_width,
+                    video_height,
+                    codec,
+                    stream_bitrate,
+                    stream_fps))
             return Ok(VLCStreamConfig.build(
                 video_vlc,
                 audio_device,
@@ -1021,6 +1517,22 @@ class CLI(CLIInterface):
                 audio_buffer_size,
                 port))
 
+    @staticmethod
+    def parsed_video_relay_config(
+        stream_relay_chunk: Optional[int],
+        stream_relay_in_flight: Optional[int]
+    ) -> Result[Optional[VideoRelayConfig], DIPClientError]:
+        if stream_relay_chunk is None and stream_relay_in_flight is None:
+            return Ok(None)
+
+        max_chunk_result = PositiveInteger.build(stream_relay_chunk if stream_relay_chunk is not None else 65536)
+        if isinstance(max_chunk_result, Err): return Err(max_chunk_result.value.of_type("stream relay chunk"))
+        max_in_flight_result = PositiveInteger.build(
+            stream_relay_in_flight if stream_relay_in_flight is not None else 1048576)
+        if isinstance(max_in_flight_result, Err): return Err(max_in_flight_result.value.of_type("stream relay in flight"))
+
+        return Ok(VideoRelayConfig(max_chunk_result.value.value, max_in_flight_result.value.value))
+
     @staticmethod
     async def agent_hardware_camera(
         config_path_str: Optional[str],
@@ -1038,8 +1550,18 @@ class CLI(CLIInterface):
         audio_sample_rate: Optional[int],
         audio_buffer_size: Optional[int],
         port: Optional[int],
+        stream_pipe: bool,
+        stream_encoder: Optional[str],
+        stream_codec_str: Optional[str],
+        stream_bitrate: Optional[int],
+        stream_fps: Optional[int],
         username_str: Optional[str],
         password_str: Optional[str],
+        outgoing_queue_size: Optional[int],
+        outgoing_queue_policy_str: Optional[str],
+        event_batch_size: Optional[int],
+        stream_relay_chunk: Optional[int],
+        stream_relay_in_flight: Optional[int],
     ) -> Result[Agent, DIPClientError]:
         # Common agent input
         common_agent_input_result: Result = CLI.parsed_agent_input(
@@ -1061,8 +1583,19 @@ class CLI(CLIInterface):
             video_buffer_size,
             audio_sample_rate,
             audio_buffer_size,
-            port)
+            port,
+            stream_pipe,
+            stream_encoder,
+            stream_codec_str,
+            stream_bitrate,
+            stream_fps)
         if isinstance(video_config_result, Err): return Err(video_config_result.value)
+        outgoing_queue_result = CLI.parsed_outgoing_queue(outgoing_queue_size, outgoing_queue_policy_str)
+        if isinstance(outgoing_queue_result, Err): return Err(outgoing_queue_result.value)
+        event_batch_size_result = CLI.parsed_event_batch_size(event_batch_size)
+        if isinstance(event_batch_size_result, Err): return Err(event_batch_size_result.value)
+        relay_config_result = CLI.parsed_video_relay_config(stream_relay_chunk, stream_relay_in_flight)
+        if isinstance(relay_config_result, Err): return Err(relay_config_result.value)
 
         # Build video source connection URL
         video_source_url_result = backend.hardware_video_source_url(hardware_id)
@@ -1070,12 +1603,12 @@ class CLI(CLIInterface):
         video_source_url = video_source_url_result.value
 
         # Engine
-        base = await EngineBase.build()
+        base = await EngineBase.build(outgoing_queue_result.value, event_batch_size_result.value)
         engine_state = EngineVideoState(
             base, hardware_id, heartbeat_seconds, video_config_result.value, None, Death(), backend.config.auth)
         engine_lifecycle = EngineLifecycle()
         engine_ping = EnginePing()
-        engine_video_stream = EngineVideoStream()
+        engine_video_stream = EngineVideoStream(relay_config_result.value)
         engine_auth = EngineAuth()
         engine = EngineVideo(engine_state, engine_lifecycle, engine_ping, engine_video_stream, engine_auth)
 
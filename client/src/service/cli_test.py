@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 """Test command line interface definition for agent"""
 import os
+import tempfile
 import unittest
 from uuid import UUID
 
-from result import Ok
+from result import Ok, Err
 
 from src.domain.existing_file_path import ExistingFilePath
+from src.monitor.monitor_type import MonitorType
 from src.service.cli import CLI
 from src.service.managed_url import ManagedURL
 from src.util.sh import src_relative_path
@@ -51,6 +53,20 @@ class TestCLI(unittest.TestCase):
         if ExistingFilePath.exists(self.test_config_path):
             os.remove(self.test_config_path)
 
+    def test_result_jsonl_opened_at_startup(self):
+        """Check that result file is only opened for request suites and a bad path fails before running"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.jsonl")
+            self.assertEqual(CLI.parsed_minos_result_jsonl(MonitorType.minos, path), Ok(None))
+            self.assertFalse(os.path.exists(path))
+
+            stream_result = CLI.parsed_minos_result_jsonl(MonitorType.minosrequest, path)
+            self.assertIsInstance(stream_result, Ok)
+            stream_result.value.close()
+            self.assertTrue(os.path.exists(path))
+
+            missing_path = os.path.join(directory, "missing", "result.jsonl")
+            self.assertIsInstance(CLI.parsed_minos_result_jsonl(MonitorType.minosrequest, missing_path), Err)
 
 
 if __name__ == '__main__':
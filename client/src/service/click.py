@@ -4,7 +4,9 @@ import asyncio
 import webbrowser
 from typing import Optional
 import click
+from src.engine.engine_state import QueueOverflowPolicy
 from src.monitor.monitor_type import MonitorType
+from src.service.managed_video_stream import VideoPipeCodec
 from src.service.cli import CLI
 from src.protocol import s11n_json, s11n_rich
 
@@ -80,6 +82,47 @@ SCAN_CHAIN_INDEX_OPTION = click.option(
     '--scanchainindex', '-s', "scan_chain_index", show_envvar=True,
     type=int, envvar=f"{ENV_PREFIX}_SCAN_CHAIN_INDEX", required=True,
     help='Scan chain index of target JTAG device (e.g. 0), used for upload')
+SERIAL_STREAM_BYTES_OPTION = click.option(
+    '--serial-stream-bytes', "serial_stream_bytes", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_SERIAL_STREAM_BYTES", required=False,
+    help='Stream serial bytes directly to monitors in batches of at most this many bytes, default: 4096 '
+         '(if any serial stream option is set)')
+SERIAL_STREAM_DELAY_OPTION = click.option(
+    '--serial-stream-delay', "serial_stream_delay", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_SERIAL_STREAM_DELAY", required=False,
+    help='Stream serial bytes directly to monitors, delaying batches at most this many milliseconds, default: 10 '
+         '(if any serial stream option is set)')
+SERIAL_COALESCE_BYTES_OPTION = click.option(
+    '--serial-coalesce-bytes', "serial_coalesce_bytes", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_SERIAL_COALESCE_BYTES", required=False,
+    help='Merge consecutive serial frames sent to monitors up to this many bytes, default: 4096 '
+         '(if any serial coalesce option is set)')
+SERIAL_COALESCE_DELAY_OPTION = click.option(
+    '--serial-coalesce-delay', "serial_coalesce_delay", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_SERIAL_COALESCE_DELAY", required=False,
+    help='Wait up to this many milliseconds for more serial frames during bursts, default: 10 '
+         '(if any serial coalesce option is set)')
+OUTGOING_QUEUE_SIZE_OPTION = click.option(
+    '--outgoing-queue-size', "outgoing_queue_size", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_OUTGOING_QUEUE_SIZE", required=False,
+    help='Maximum amount of messages waiting to be sent to control server, default: unbounded')
+OUTGOING_QUEUE_POLICY_OPTION = click.option(
+    '--outgoing-queue-policy', "outgoing_queue_policy_str", type=click.Choice([p.value for p in QueueOverflowPolicy]),
+    show_envvar=True, envvar=f"{ENV_PREFIX}_OUTGOING_QUEUE_POLICY", required=False,
+    help='What to do with new messages when the outgoing queue is full, default: block')
+EVENT_BATCH_SIZE_OPTION = click.option(
+    '--event-batch-size', "event_batch_size", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_EVENT_BATCH_SIZE", required=False,
+    help='Project up to this many queued engine events at once, default: 1 (i.e. one by one)')
+FAKE_BOARD_OPTION = click.option(
+    '--fake-board', "fake_board", type=click.Choice(["echo", "minos"]),
+    show_envvar=True, envvar=f"{ENV_PREFIX}_FAKE_BOARD", required=False, default="echo",
+    help='Fake board behaviour, either echo last written bytes once per second or simulate a MinOS board')
+FAKE_MINOS_DISPLAY_RATE_OPTION = click.option(
+    '--fake-minos-display-rate', "fake_minos_display_rate", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_FAKE_MINOS_DISPLAY_RATE", required=False,
+    help='Display pixel updates per second sent by simulated MinOS board, capped by serial line rate, '
+         'default: 64 (0 disables display updates)')
 
 # Monitor options
 MONITOR_TYPE_OPTION = click.option(
@@ -107,6 +150,106 @@ MONITOR_MINOSREQUEST_SPEC_EXPECT_CHUNKS = click.option(
     show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_SPEC_CHUNKS", required=False,
     help="How many packets/chunks to wait for in MinOS request")
 
+MONITOR_MINOSREQUEST_RESULT_JSONL_OPTION = click.option(
+    "--minos-result-jsonl", "minos_result_jsonl", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_RESULT_JSONL", required=False,
+    help="File to stream MinOS request result packets to as JSON lines, instead of keeping them in printed result")
+
+MONITOR_MINOSREQUEST_REPLAY_SPEED_OPTION = click.option(
+    "--minos-replay-speed", "minos_replay_speed", type=float,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_REPLAY_SPEED", required=False,
+    help="Multiplier for how fast outgoing MinOS request packets are replayed, default: 1.0")
+
+MONITOR_MINOS_SPEC_DIR_OPTION = click.option(
+    "--minos-spec-dir", "minos_spec_dir", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_SPEC_DIR", required=True,
+    help="Directory with MinOS request specification JSON files, one suite per file")
+
+MONITOR_MINOS_HARDWARE_IDS_OPTION = click.option(
+    "--hardware-ids", "hardware_ids_str", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_HARDWARE_IDS", required=True,
+    help="Comma separated UUIDs of hardware to run MinOS suites on, each runs one suite at a time")
+
+MONITOR_MINOS_CONCURRENCY_OPTION = click.option(
+    "--concurrency", "minos_concurrency", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_CONCURRENCY", required=False,
+    help="Maximum amount of MinOS suites running at once, default: 4")
+
+MONITOR_MINOS_OUTPUT_DIR_OPTION = click.option(
+    "--output-dir", "minos_output_dir", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_OUTPUT_DIR", required=True,
+    help="Directory to write MinOS suite results & summary.json to")
+
+MONITOR_MINOS_RESULT_FILE_OPTION = click.option(
+    "--minos-result-file", "minos_result_file", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_RESULT_FILE", required=True,
+    help="MinOS request result JSON, or JSON lines file written with --minos-result-jsonl")
+
+MONITOR_MINOS_LATENCY_RESPONSE_OPTION = click.option(
+    "--minos-latency-response", "minos_latency_response", type=click.Choice(["led", "display", "text"]),
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_LATENCY_RESPONSE", required=False,
+    help="Only count incoming packets of this type as responses, default: any incoming packet")
+
+MONITOR_MINOS_LATENCY_OUTPUT_OPTION = click.option(
+    "--minos-latency-output", "minos_latency_output", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_LATENCY_OUTPUT", required=False,
+    help="File to export full MinOS latency report to as JSON, i.e. including every sample")
+
+MONITOR_MINOS_DISPLAY_WIDTH_OPTION = click.option(
+    "--minos-display-width", "minos_display_width", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_DISPLAY_WIDTH", required=False,
+    help="Width of MinOS display in pixels, default: 8")
+
+MONITOR_MINOS_DISPLAY_HEIGHT_OPTION = click.option(
+    "--minos-display-height", "minos_display_height", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_DISPLAY_HEIGHT", required=False,
+    help="Height of MinOS display in pixels, default: 8")
+
+MONITOR_MINOS_DISPLAY_FPS_OPTION = click.option(
+    "--minos-display-fps", "minos_display_fps", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_MINOS_DISPLAY_FPS", required=False,
+    help="How many times per second changed MinOS display pixels are rendered, default: 10")
+
+MONITOR_LED_RENDER_FPS_OPTION = click.option(
+    "--led-render-fps", "led_render_fps", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_LED_RENDER_FPS", required=False,
+    help="How many times per second received LED state is rendered in buttonleds monitor, default: 30")
+
+MONITOR_LED_PERSISTENCE_OPTION = click.option(
+    "--led-persistence", "led_persistence", type=bool,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_LED_PERSISTENCE", required=False, default=False,
+    help="Show LED brightness by how often it was on within each frame in buttonleds monitor, default: False")
+
+MONITOR_HEX_XXD_OPTION = click.option(
+    "--hex-xxd", "hex_xxd", type=bool,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_HEX_XXD", required=False, default=False,
+    help="Print hexbytes monitor output as xxd-style offset, hex & ASCII columns, default: False")
+
+MONITOR_HEX_FLUSH_MS_OPTION = click.option(
+    "--hex-flush-ms", "hex_flush_ms", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_HEX_FLUSH_MS", required=False,
+    help="How often in milliseconds received bytes are written out by hexbytes monitor, default: 50")
+
+MONITOR_HEX_MAX_LAG_BYTES_OPTION = click.option(
+    "--hex-max-lag-bytes", "hex_max_lag_bytes", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_HEX_MAX_LAG_BYTES", required=False,
+    help="Most bytes hexbytes monitor output may fall behind before skipping them, default: 65536")
+
+MONITOR_INPUT_BATCH_MS_OPTION = click.option(
+    "--input-batch-ms", "input_batch_ms", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_INPUT_BATCH_MS", required=False,
+    help="How long in milliseconds hexbytes monitor collects typed/pasted input into one message, default: 5")
+
+MONITOR_SEND_FILE_OPTION = click.option(
+    "--send-file", "send_file", type=str,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_SEND_FILE", required=False,
+    help="File to be sent to board through hexbytes monitor")
+
+MONITOR_SEND_FILE_BAUDRATE_OPTION = click.option(
+    "--send-file-baudrate", "send_file_baudrate", type=int,
+    show_envvar=True, envvar=f"{ENV_PREFIX}_SEND_FILE_BAUDRATE", required=False,
+    help="Board serial baudrate, which file sending is paced to, default: 115200")
+
 # Formatting
 JSON_OUTPUT_OPTION = click.option(
     "--json-output", '-j', "json_output", show_envvar=True, default=False,
@@ -184,6 +327,45 @@ STREAM_PORT_OPTION = click.option(
     type=str, envvar=f"{ENV_PREFIX}_STREAM_URL", required=False,
     help='Port number for VLC video source (if not is_stream_existing), default: 8081'
 )
+# Video stream (piped encoder)
+STREAM_PIPE_OPTION = click.option(
+    '--stream-pipe', "stream_pipe", show_envvar=True, default=False,
+    type=bool, envvar=f"{ENV_PREFIX}_STREAM_PIPE", required=False,
+    help='Read video stream from encoder output directly instead of VLC over HTTP (if not is_stream_existing), '
+         'default: False'
+)
+STREAM_ENCODER_OPTION = click.option(
+    '--stream-encoder', "stream_encoder", show_envvar=True,
+    type=str, envvar=f"{ENV_PREFIX}_STREAM_ENCODER", required=False,
+    help='FFmpeg command to be used for piped video stream, default: ffmpeg'
+)
+STREAM_CODEC_OPTION = click.option(
+    '--stream-codec', "stream_codec_str", type=click.Choice([c.value for c in VideoPipeCodec]),
+    show_envvar=True, envvar=f"{ENV_PREFIX}_STREAM_CODEC", required=False,
+    help='Codec for piped video stream, default: theora (server serves the stream as Ogg)'
+)
+STREAM_BITRATE_OPTION = click.option(
+    '--stream-bitrate', "stream_bitrate", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_STREAM_BITRATE", required=False,
+    help='Bitrate in kbit/s for piped video stream, default: 1000'
+)
+STREAM_FPS_OPTION = click.option(
+    '--stream-fps', "stream_fps", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_STREAM_FPS", required=False,
+    help='Frame rate for piped video stream, default: 15'
+)
+STREAM_RELAY_CHUNK_OPTION = click.option(
+    '--stream-relay-chunk', "stream_relay_chunk", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_STREAM_RELAY_CHUNK", required=False,
+    help='Relay video stream directly to server in chunks of at most this many bytes, default: 65536 '
+         '(if any stream relay option is set)'
+)
+STREAM_RELAY_IN_FLIGHT_OPTION = click.option(
+    '--stream-relay-in-flight', "stream_relay_in_flight", show_envvar=True,
+    type=int, envvar=f"{ENV_PREFIX}_STREAM_RELAY_IN_FLIGHT", required=False,
+    help='Relay video stream directly to server with at most this many bytes waiting to be sent, default: 1048576 '
+         '(if any stream relay option is set)'
+)
 # Quick-run specific
 QUICK_RUN_NO_MONITOR = click.option(
     '--no-monitor', "no_monitor", show_envvar=True,
@@ -205,6 +387,9 @@ def cli_client():
      Use environment variable LOG_LEVEL with values CRITICAL, ERROR,
      WARNING, INFO, DEBUG, NOTSET to configure amount of printed logs
 
+     Use environment variable JSON_BACKEND with values auto, json, orjson
+     to choose JSON library for messages (auto prefers orjson if installed)
+
      Use <command> --help for more information about commands. Note that
      most command options can also be defined as environment variables!
      """
@@ -323,6 +508,13 @@ def session_control_server_remove(
 @PASSWORD_OPTION
 @HEARTBEAT_SECONDS_OPTION
 @DEVICE_PATH_OPTION
+@SERIAL_STREAM_BYTES_OPTION
+@SERIAL_STREAM_DELAY_OPTION
+@SERIAL_COALESCE_BYTES_OPTION
+@SERIAL_COALESCE_DELAY_OPTION
+@OUTGOING_QUEUE_SIZE_OPTION
+@OUTGOING_QUEUE_POLICY_OPTION
+@EVENT_BATCH_SIZE_OPTION
 def agent_nrf52(
     config_path_str: Optional[str],
     hardware_id_str: str,
@@ -331,7 +523,14 @@ def agent_nrf52(
     username_str: Optional[str],
     password_str: Optional[str],
     heartbeat_seconds: int,
-    device_path_str: str
+    device_path_str: str,
+    serial_stream_bytes: Optional[int],
+    serial_stream_delay: Optional[int],
+    serial_coalesce_bytes: Optional[int],
+    serial_coalesce_delay: Optional[int],
+    outgoing_queue_size: Optional[int],
+    outgoing_queue_policy_str: Optional[str],
+    event_batch_size: Optional[int]
 ):
     """NRF52 MCU agent (Linux specific)"""
     async def exec():
@@ -344,7 +543,14 @@ def agent_nrf52(
                 username_str,
                 password_str,
                 heartbeat_seconds,
-                device_path_str), "NRF52 agent finished work")
+                device_path_str,
+                serial_stream_bytes,
+                serial_stream_delay,
+                serial_coalesce_bytes,
+                serial_coalesce_delay,
+                outgoing_queue_size,
+                outgoing_queue_policy_str,
+                event_batch_size), "NRF52 agent finished work")
     asyncio.run(exec())
 
 
@@ -358,6 +564,13 @@ def agent_nrf52(
 @HEARTBEAT_SECONDS_OPTION
 @DEVICE_NAME_OPTION
 @DEVICE_PATH_OPTION
+@SERIAL_STREAM_BYTES_OPTION
+@SERIAL_STREAM_DELAY_OPTION
+@SERIAL_COALESCE_BYTES_OPTION
+@SERIAL_COALESCE_DELAY_OPTION
+@OUTGOING_QUEUE_SIZE_OPTION
+@OUTGOING_QUEUE_POLICY_OPTION
+@EVENT_BATCH_SIZE_OPTION
 def agent_icestick(
     config_path_str: Optional[str],
     hardware_id_str: str,
@@ -367,7 +580,14 @@ def agent_icestick(
     password_str: Optional[str],
     heartbeat_seconds: int,
     device_name_str: str,
-    device_path_str: str
+    device_path_str: str,
+    serial_stream_bytes: Optional[int],
+    serial_stream_delay: Optional[int],
+    serial_coalesce_bytes: Optional[int],
+    serial_coalesce_delay: Optional[int],
+    outgoing_queue_size: Optional[int],
+    outgoing_queue_policy_str: Optional[str],
+    event_batch_size: Optional[int]
 ):
     """iCEstick FPGA agent (Linux specific)"""
     async def exec():
@@ -381,7 +601,14 @@ def agent_icestick(
                 password_str,
                 heartbeat_seconds,
                 device_name_str,
-                device_path_str), "iCEstick agent finished work")
+                device_path_str,
+                serial_stream_bytes,
+                serial_stream_delay,
+                serial_coalesce_bytes,
+                serial_coalesce_delay,
+                outgoing_queue_size,
+                outgoing_queue_policy_str,
+                event_batch_size), "iCEstick agent finished work")
     asyncio.run(exec())
 
 
@@ -396,6 +623,13 @@ def agent_icestick(
 @DEVICE_NAME_OPTION
 @SCAN_CHAIN_INDEX_OPTION
 @DEVICE_PATH_OPTION
+@SERIAL_STREAM_BYTES_OPTION
+@SERIAL_STREAM_DELAY_OPTION
+@SERIAL_COALESCE_BYTES_OPTION
+@SERIAL_COALESCE_DELAY_OPTION
+@OUTGOING_QUEUE_SIZE_OPTION
+@OUTGOING_QUEUE_POLICY_OPTION
+@EVENT_BATCH_SIZE_OPTION
 def agent_anvyl(
     config_path_str: Optional[str],
     hardware_id_str: str,
@@ -406,7 +640,14 @@ def agent_anvyl(
     heartbeat_seconds: int,
     device_name_str: str,
     scan_chain_index: int,
-    device_path_str: str
+    device_path_str: str,
+    serial_stream_bytes: Optional[int],
+    serial_stream_delay: Optional[int],
+    serial_coalesce_bytes: Optional[int],
+    serial_coalesce_delay: Optional[int],
+    outgoing_queue_size: Optional[int],
+    outgoing_queue_policy_str: Optional[str],
+    event_batch_size: Optional[int]
 ):
     """Anvyl FPGA agent (Linux specific)"""
     async def exec():
@@ -421,7 +662,14 @@ def agent_anvyl(
                 heartbeat_seconds,
                 device_name_str,
                 scan_chain_index,
-                device_path_str), "NRF52 agent finished work")
+                device_path_str,
+                serial_stream_bytes,
+                serial_stream_delay,
+                serial_coalesce_bytes,
+                serial_coalesce_delay,
+                outgoing_queue_size,
+                outgoing_queue_policy_str,
+                event_batch_size), "NRF52 agent finished work")
     asyncio.run(exec())
 
 
@@ -433,6 +681,15 @@ def agent_anvyl(
 @USERNAME_OPTION
 @PASSWORD_OPTION
 @HEARTBEAT_SECONDS_OPTION
+@SERIAL_STREAM_BYTES_OPTION
+@SERIAL_STREAM_DELAY_OPTION
+@SERIAL_COALESCE_BYTES_OPTION
+@SERIAL_COALESCE_DELAY_OPTION
+@OUTGOING_QUEUE_SIZE_OPTION
+@OUTGOING_QUEUE_POLICY_OPTION
+@EVENT_BATCH_SIZE_OPTION
+@FAKE_BOARD_OPTION
+@FAKE_MINOS_DISPLAY_RATE_OPTION
 def agent_fake(
     config_path_str: Optional[str],
     hardware_id_str: str,
@@ -440,7 +697,16 @@ def agent_fake(
     static_server_str: Optional[str],
     username_str: Optional[str],
     password_str: Optional[str],
-    heartbeat_seconds: int
+    heartbeat_seconds: int,
+    serial_stream_bytes: Optional[int],
+    serial_stream_delay: Optional[int],
+    serial_coalesce_bytes: Optional[int],
+    serial_coalesce_delay: Optional[int],
+    outgoing_queue_size: Optional[int],
+    outgoing_queue_policy_str: Optional[str],
+    event_batch_size: Optional[int],
+    fake_board: str,
+    fake_minos_display_rate: Optional[int]
 ):
     """Fake board agent"""
     async def exec():
@@ -452,7 +718,16 @@ def agent_fake(
                 static_server_str,
                 username_str,
                 password_str,
-                heartbeat_seconds), "Fake agent finished work")
+                heartbeat_seconds,
+                serial_stream_bytes,
+                serial_stream_delay,
+                serial_coalesce_bytes,
+                serial_coalesce_delay,
+                outgoing_queue_size,
+                outgoing_queue_policy_str,
+                event_batch_size,
+                fake_board,
+                fake_minos_display_rate), "Fake agent finished work")
     asyncio.run(exec())
 
 
@@ -654,6 +929,19 @@ def hardware_software_upload(
 @MONITOR_MINOSREQUEST_SPEC_JSON_OPTION
 @MONITOR_MINOSREQUEST_SPEC_TIMEOUT_OPTION
 @MONITOR_MINOSREQUEST_SPEC_EXPECT_CHUNKS
+@MONITOR_MINOSREQUEST_RESULT_JSONL_OPTION
+@MONITOR_MINOSREQUEST_REPLAY_SPEED_OPTION
+@MONITOR_MINOS_DISPLAY_WIDTH_OPTION
+@MONITOR_MINOS_DISPLAY_HEIGHT_OPTION
+@MONITOR_MINOS_DISPLAY_FPS_OPTION
+@MONITOR_LED_RENDER_FPS_OPTION
+@MONITOR_LED_PERSISTENCE_OPTION
+@MONITOR_HEX_XXD_OPTION
+@MONITOR_HEX_FLUSH_MS_OPTION
+@MONITOR_HEX_MAX_LAG_BYTES_OPTION
+@MONITOR_INPUT_BATCH_MS_OPTION
+@MONITOR_SEND_FILE_OPTION
+@MONITOR_SEND_FILE_BAUDRATE_OPTION
 def hardware_serial_monitor(
     config_path_str: Optional[str],
     control_server_str: Optional[str],
@@ -666,6 +954,19 @@ def hardware_serial_monitor(
     minos_spec_json: Optional[str],
     minos_spec_timeout: Optional[int],
     minos_spec_chunks: Optional[int],
+    minos_result_jsonl: Optional[str],
+    minos_replay_speed: Optional[float],
+    minos_display_width: Optional[int],
+    minos_display_height: Optional[int],
+    minos_display_fps: Optional[int],
+    led_render_fps: Optional[int],
+    led_persistence: bool,
+    hex_xxd: bool,
+    hex_flush_ms: Optional[int],
+    hex_max_lag_bytes: Optional[int],
+    input_batch_ms: Optional[int],
+    send_file: Optional[str],
+    send_file_baudrate: Optional[int],
 ):
     """Monitor hardware's serial port"""
     async def exec():
@@ -681,10 +982,84 @@ def hardware_serial_monitor(
             minos_spec_json,
             minos_spec_timeout,
             minos_spec_chunks,
+            minos_result_jsonl,
+            minos_replay_speed,
+            minos_display_width,
+            minos_display_height,
+            minos_display_fps,
+            led_render_fps,
+            led_persistence,
+            hex_xxd,
+            hex_flush_ms,
+            hex_max_lag_bytes,
+            input_batch_ms,
+            send_file,
+            send_file_baudrate,
         ), "Finished monitoring", monitor_type_str == MonitorType.minosrequest)
     asyncio.run(exec())
 
 
+@CLI_COMMAND
+@CONFIG_PATH_OPTION
+@CONTROL_SERVER_OPTION
+@USERNAME_OPTION
+@PASSWORD_OPTION
+@HEARTBEAT_SECONDS_OPTION
+@MONITOR_MINOS_SPEC_DIR_OPTION
+@MONITOR_MINOS_HARDWARE_IDS_OPTION
+@MONITOR_MINOS_CONCURRENCY_OPTION
+@MONITOR_MINOS_OUTPUT_DIR_OPTION
+@MONITOR_MINOSREQUEST_REPLAY_SPEED_OPTION
+def minos_suite_run(
+    config_path_str: Optional[str],
+    control_server_str: Optional[str],
+    username_str: Optional[str],
+    password_str: Optional[str],
+    heartbeat_seconds: int,
+    minos_spec_dir: str,
+    hardware_ids_str: str,
+    minos_concurrency: Optional[int],
+    minos_output_dir: str,
+    minos_replay_speed: Optional[float],
+):
+    """Run directory of MinOS suites headlessly across many boards"""
+    async def exec():
+        await CLI.execute_runnable_result(CLI.minos_suite_run(
+            config_path_str,
+            control_server_str,
+            username_str,
+            password_str,
+            heartbeat_seconds,
+            minos_spec_dir,
+            hardware_ids_str,
+            minos_concurrency,
+            minos_output_dir,
+            minos_replay_speed,
+        ), "Finished MinOS suites", True)
+    asyncio.run(exec())
+
+
+@CLI_COMMAND
+@JSON_OUTPUT_OPTION
+@MONITOR_MINOS_RESULT_FILE_OPTION
+@MONITOR_MINOS_LATENCY_RESPONSE_OPTION
+@MONITOR_MINOS_LATENCY_OUTPUT_OPTION
+def minos_latency(
+    json_output: bool,
+    minos_result_file: str,
+    minos_latency_response: Optional[str],
+    minos_latency_output: Optional[str],
+):
+    """Report round-trip latency percentiles of a MinOS request result"""
+    report_result = CLI.minos_latency(minos_result_file, minos_latency_response, minos_latency_output)
+    CLI.execute_table_result(
+        json_output,
+        report_result.map(lambda report: report.stats),
+        s11n_json.MINOS_LATENCY_STATS_LIST_ENCODER_JSON,
+        s11n_rich.RichMinOSLatencyEncoder()
+    )
+
+
 @CLI_COMMAND
 @CONFIG_PATH_OPTION
 @CONTROL_SERVER_OPTION
@@ -702,6 +1077,19 @@ def hardware_serial_monitor(
 @MONITOR_MINOSREQUEST_SPEC_JSON_OPTION
 @MONITOR_MINOSREQUEST_SPEC_TIMEOUT_OPTION
 @MONITOR_MINOSREQUEST_SPEC_EXPECT_CHUNKS
+@MONITOR_MINOSREQUEST_RESULT_JSONL_OPTION
+@MONITOR_MINOSREQUEST_REPLAY_SPEED_OPTION
+@MONITOR_MINOS_DISPLAY_WIDTH_OPTION
+@MONITOR_MINOS_DISPLAY_HEIGHT_OPTION
+@MONITOR_MINOS_DISPLAY_FPS_OPTION
+@MONITOR_LED_RENDER_FPS_OPTION
+@MONITOR_LED_PERSISTENCE_OPTION
+@MONITOR_HEX_XXD_OPTION
+@MONITOR_HEX_FLUSH_MS_OPTION
+@MONITOR_HEX_MAX_LAG_BYTES_OPTION
+@MONITOR_INPUT_BATCH_MS_OPTION
+@MONITOR_SEND_FILE_OPTION
+@MONITOR_SEND_FILE_BAUDRATE_OPTION
 def quick_run(
     config_path_str: Optional[str],
     control_server_str: Optional[str],
@@ -719,6 +1107,19 @@ def quick_run(
     minos_spec_json: Optional[str],
     minos_spec_timeout: Optional[int],
     minos_spec_chunks: Optional[int],
+    minos_result_jsonl: Optional[str],
+    minos_replay_speed: Optional[float],
+    minos_display_width: Optional[int],
+    minos_display_height: Optional[int],
+    minos_display_fps: Optional[int],
+    led_render_fps: Optional[int],
+    led_persistence: bool,
+    hex_xxd: bool,
+    hex_flush_ms: Optional[int],
+    hex_max_lag_bytes: Optional[int],
+    input_batch_ms: Optional[int],
+    send_file: Optional[str],
+    send_file_baudrate: Optional[int],
 ):
     """Upload, forward & monitor board software"""
     async def exec():
@@ -740,6 +1141,19 @@ def quick_run(
                 minos_spec_json,
                 minos_spec_timeout,
                 minos_spec_chunks,
+                minos_result_jsonl,
+                minos_replay_speed,
+                minos_display_width,
+                minos_display_height,
+                minos_display_fps,
+                led_render_fps,
+                led_persistence,
+                hex_xxd,
+                hex_flush_ms,
+                hex_max_lag_bytes,
+                input_batch_ms,
+                send_file,
+                send_file_baudrate,
             ), "Finished quick run", monitor_type_str == MonitorType.minosrequest)
     asyncio.run(exec())
 
@@ -759,8 +1173,18 @@ def quick_run(
 @STREAM_SAMPLE_RATE_OPTION
 @STREAM_AUDIO_BUFFER_OPTION
 @STREAM_PORT_OPTION
+@STREAM_PIPE_OPTION
+@STREAM_ENCODER_OPTION
+@STREAM_CODEC_OPTION
+@STREAM_BITRATE_OPTION
+@STREAM_FPS_OPTION
 @USERNAME_OPTION
 @PASSWORD_OPTION
+@OUTGOING_QUEUE_SIZE_OPTION
+@OUTGOING_QUEUE_POLICY_OPTION
+@EVENT_BATCH_SIZE_OPTION
+@STREAM_RELAY_CHUNK_OPTION
+@STREAM_RELAY_IN_FLIGHT_OPTION
 def agent_hardware_video(
     config_path_str: Optional[str],
     hardware_id_str: str,
@@ -777,8 +1201,18 @@ def agent_hardware_video(
     audio_sample_rate: Optional[int],
     audio_buffer_size: Optional[int],
     port: Optional[int],
+    stream_pipe: bool,
+    stream_encoder: Optional[str],
+    stream_codec_str: Optional[str],
+    stream_bitrate: Optional[int],
+    stream_fps: Optional[int],
     username_str: Optional[str],
     password_str: Optional[str],
+    outgoing_queue_size: Optional[int],
+    outgoing_queue_policy_str: Optional[str],
+    event_batch_size: Optional[int],
+    stream_relay_chunk: Optional[int],
+    stream_relay_in_flight: Optional[int],
 ):
     """Video stream broadcast (Linux specific)"""
     async def exec():
@@ -799,8 +1233,18 @@ def agent_hardware_video(
                 audio_sample_rate,
                 audio_buffer_size,
                 port,
+                stream_pipe,
+                stream_encoder,
+                stream_codec_str,
+                stream_bitrate,
+                stream_fps,
                 username_str,
                 password_str,
+                outgoing_queue_size,
+                outgoing_queue_policy_str,
+                event_batch_size,
+                stream_relay_chunk,
+                stream_relay_in_flight,
             ), "Hardware camera agent finished work")
     asyncio.run(exec())
 
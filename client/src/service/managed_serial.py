@@ -1,7 +1,10 @@
 """Module for handling serial connections"""
-from dataclasses import dataclass
+import asyncio
+import concurrent.futures
+import threading
+from dataclasses import dataclass, field
 from pprint import pformat
-from typing import Optional
+from typing import Optional, Union
 
 from result import Result, Ok, Err
 from serial import Serial
@@ -12,13 +15,32 @@ from src.service.managed_serial_config import ManagedSerialConfig
 from src.util import log
 
 LOGGER = log.timed_named_logger("serial")
+# Amount of reads buffered for the event loop, each at most receive_size bytes,
+# when full the reader thread waits and the OS serial buffer applies backpressure
+RECEIVED_QUEUE_SIZE = 64
+# How long closing waits for pending writes to reach the device
+WRITE_FLUSH_TIMEOUT_SECONDS = 1
 
 
 @dataclass
 class ManagedSerial:
-    """Shim for middle-managing a serial connection"""
+    """Shim for middle-managing a serial connection
+
+    Blocking pyserial calls are executed in a dedicated reader and writer
+    thread, so that the event loop is never stalled by serial I/O. Reads are
+    fed into a bounded asyncio queue, writes are coalesced into a single buffer.
+    """
     config: ManagedSerialConfig
     connection: Optional[Serial] = None
+    # Reader thread state
+    received: Optional[asyncio.Queue] = field(default=None, repr=False, compare=False)
+    loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False, compare=False)
+    # Writer thread state
+    pending_writes: bytearray = field(default_factory=bytearray, repr=False, compare=False)
+    pending_condition: threading.Condition = field(default_factory=threading.Condition, repr=False, compare=False)
+    write_error: Optional[Exception] = field(default=None, repr=False, compare=False)
+    writer: Optional[threading.Thread] = field(default=None, repr=False, compare=False)
+    closing: bool = field(default=False, repr=False, compare=False)
 
     @staticmethod
     def build(
@@ -43,29 +65,127 @@ class ManagedSerial:
             # Return device
             return Ok(ManagedSerial(config, serial))
         except Exception as e:
-            return GenericClientError(f"Failed to start monitor: {str(e)}")
+            return Err(GenericClientError(f"Failed to start monitor: {str(e)}"))
+
+    def start(self):
+        """Start reader and writer threads bound to the running loop"""
+        if self.loop is not None or self.connection is None:
+            return
+        self.loop = asyncio.get_running_loop()
+        self.received = asyncio.Queue(RECEIVED_QUEUE_SIZE)
+        self.writer = threading.Thread(target=self.keep_writing, name="serial-writer", daemon=True)
+        threading.Thread(target=self.keep_reading, name="serial-reader", daemon=True).start()
+        self.writer.start()
+
+    def keep_reading(self):
+        """Blocking read loop, forwards received bytes into event loop"""
+        connection = self.connection
+        while not self.closing:
+            try:
+                # Take everything buffered or block for the first byte (up to timeout)
+                waiting = min(connection.in_waiting, self.config.receive_size)
+                received_bytes = connection.read(waiting if waiting > 0 else 1)
+                if len(received_bytes) > 0:
+                    self.forward(received_bytes)
+            except Exception as e:
+                if not self.closing:
+                    self.forward(e)
+                return
+
+    def forward(self, value: Union[bytes, Exception]):
+        """Hand value over to event loop, waiting while received queue is full"""
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.received.put(value), self.loop)
+        except RuntimeError:
+            # Event loop already closed
+            self.closing = True
+            return
+        while not self.closing and not self.loop.is_closed():
+            try:
+                future.result(self.config.timeout)
+                return
+            except concurrent.futures.TimeoutError:
+                continue
+        future.cancel()
+
+    def keep_writing(self):
+        """Blocking write loop, writes all pending bytes at once, until closed and flushed"""
+        connection = self.connection
+        while True:
+            with self.pending_condition:
+                while len(self.pending_writes) == 0 and not self.closing:
+                    self.pending_condition.wait()
+                if len(self.pending_writes) == 0:
+                    return
+                content = bytes(self.pending_writes)
+                self.pending_writes.clear()
+            try:
+                connection.write(content)
+            except Exception as e:
+                # Fail reads too, so that monitor dies instead of waiting for next write
+                self.write_error = e
+                if not self.closing:
+                    self.forward(e)
+                return
 
     async def read(self) -> Result[bytes, DIPClientError]:
         if self.connection is None:
             return Err(GenericClientError("Serial connection closed"))
-        try:
-            received_bytes = self.connection.read(self.config.receive_size)
-            return Ok(received_bytes)
-        except Exception as e:
-            self.connection = None
-            return Err(GenericClientError(f"Serial connection closed: {str(e)}"))
+        self.start()
+
+        # Wait for first chunk at most for configured timeout
+        received = self.received
+        if received.empty():
+            try:
+                value = await asyncio.wait_for(received.get(), self.config.timeout)
+            except asyncio.TimeoutError:
+                return Ok(b"")
+        else:
+            value = received.get_nowait()
+
+        # Coalesce all already received chunks
+        chunks = bytearray()
+        while True:
+            if isinstance(value, Exception) and len(chunks) > 0:
+                # Reader thread has finished, report failure on next read
+                received.put_nowait(value)
+                return Ok(bytes(chunks))
+            if isinstance(value, Exception):
+                self.connection = None
+                return Err(GenericClientError(f"Serial connection closed: {str(value)}"))
+            chunks += value
+            if received.empty() or len(chunks) >= self.config.receive_size:
+                return Ok(bytes(chunks))
+            value = received.get_nowait()
 
     async def write(self, content: bytes) -> Result[type(None), DIPClientError]:
+        """Queue bytes for writer thread
+
+        Bytes are written in background, so a failed write is reported by
+        the following read (which ends the serial monitor) and write.
+        """
         if self.connection is None:
             return Err(GenericClientError("Serial connection closed"))
-        try:
-            self.connection.write(content)
-            return Ok()
-        except Exception as e:
+        if self.write_error is not None:
             self.connection = None
-            return Err(GenericClientError(f"Serial connection closed: {str(e)}"))
+            return Err(GenericClientError(f"Serial connection closed: {str(self.write_error)}"))
+        self.start()
+
+        # Queue bytes for writer thread, it will merge writes that arrive meanwhile
+        with self.pending_condition:
+            self.pending_writes += content
+            self.pending_condition.notify()
+        return Ok()
 
     async def close(self):
+        """Flush pending writes for at most WRITE_FLUSH_TIMEOUT_SECONDS and disconnect"""
+        with self.pending_condition:
+            self.closing = True
+            self.pending_condition.notify()
+        if self.writer is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.writer.join, WRITE_FLUSH_TIMEOUT_SECONDS)
+            if self.writer.is_alive():
+                LOGGER.warning("Serial writes not flushed in %s seconds, dropping them", WRITE_FLUSH_TIMEOUT_SECONDS)
         if self.connection is not None:
             self.connection.close()
-            self.connection = None
\ No newline at end of file
+            self.connection = None
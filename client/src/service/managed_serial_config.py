@@ -18,3 +18,10 @@ class ManagedSerialConfig:
             baudrate=115200,
             timeout=0.01
         )
+
+
+@dataclass(frozen=True)
+class ManagedSerialStreamConfig:
+    """Configurations for how to batch streamed serial bytes"""
+    max_bytes: int
+    max_delay: float
@@ -1,7 +1,15 @@
 #!/usr/bin/env python
 """Module to test serial utilities"""
 
+import asyncio
+import os
+import time
 import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+from result import Ok, Err
+from src.domain.existing_file_path import ExistingFilePath
+from src.service.managed_serial import ManagedSerial
 from src.service.managed_serial_config import ManagedSerialConfig
 
 
@@ -18,5 +26,101 @@ class TestSerialUtil(unittest.TestCase):
         self.assertFalse(config1 == config2)
 
 
+class TestManagedSerial(IsolatedAsyncioTestCase):
+    """Test suite for managed serial connection"""
+
+    async def test_pty_loopback(self):
+        """Check that bytes are read and written through a pty pair"""
+        master, slave = os.openpty()
+        serial = ManagedSerial.build(
+            ExistingFilePath(os.ttyname(slave)), ManagedSerialConfig(4096, 115200, 0.01)).value
+        os.close(slave)
+        try:
+            # Nothing to read
+            self.assertEqual(await serial.read(), Ok(b""))
+
+            # Read from board
+            os.write(master, b"hello")
+            received = b""
+            while len(received) < 5:
+                received += (await serial.read()).value
+            self.assertEqual(received, b"hello")
+
+            # Write to board
+            self.assertEqual(await serial.write(b"wor"), Ok())
+            self.assertEqual(await serial.write(b"ld"), Ok())
+            sent = b""
+            while len(sent) < 5:
+                sent += os.read(master, 5)
+            self.assertEqual(sent, b"world")
+        finally:
+            await serial.close()
+            os.close(master)
+
+
+    async def test_backpressure(self):
+        """Check that reader thread stops reading while received queue is full, without losing bytes"""
+        master, slave = os.openpty()
+        serial = ManagedSerial.build(
+            ExistingFilePath(os.ttyname(slave)), ManagedSerialConfig(4, 115200, 0.01)).value
+        os.close(slave)
+        try:
+            with patch("src.service.managed_serial.RECEIVED_QUEUE_SIZE", 2):
+                serial.start()
+            sent = bytes(range(64))
+            os.write(master, sent)
+            await asyncio.sleep(0.2)
+            self.assertEqual(serial.received.qsize(), 2)
+
+            received = b""
+            while len(received) < len(sent):
+                received += (await serial.read()).value
+            self.assertEqual(received, sent)
+        finally:
+            await serial.close()
+            os.close(master)
+
+    async def test_flush_on_close(self):
+        """Check that bytes written right before closing still reach the board"""
+        master, slave = os.openpty()
+        serial = ManagedSerial.build(
+            ExistingFilePath(os.ttyname(slave)), ManagedSerialConfig(4096, 115200, 0.01)).value
+        os.close(slave)
+        try:
+            self.assertEqual(await serial.write(b"bye"), Ok())
+            await serial.close()
+            self.assertEqual(os.read(master, 3), b"bye")
+        finally:
+            os.close(master)
+
+    async def test_write_failure(self):
+        """Check that failed background write is reported by the following read"""
+        serial = ManagedSerial(ManagedSerialConfig(4096, 115200, 0.01), FailingConnection())
+        try:
+            self.assertEqual(await serial.write(b"lost"), Ok())
+            result = Ok(b"")
+            while isinstance(result, Ok):
+                result = await serial.read()
+            self.assertIsInstance(result, Err)
+            self.assertIsInstance(await serial.write(b"lost"), Err)
+        finally:
+            await serial.close()
+
+
+class FailingConnection:
+    """Serial connection, which never receives anything and fails to write"""
+    in_waiting = 0
+
+    def read(self, size: int) -> bytes:
+        time.sleep(0.01)
+        return b""
+
+    def write(self, content: bytes):
+        raise OSError("Device disconnected")
+
+    def close(self):
+        pass
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 import asyncio
-from dataclasses import dataclass
+from asyncio import Task
+from asyncio.subprocess import Process
+from dataclasses import dataclass, field
+from enum import Enum
 from subprocess import Popen
 from typing import List, Optional, Union
 import aiohttp
@@ -14,6 +17,8 @@ from src.util.sh import src_relative_path, runnable_sh
 
 LOGGER = log.timed_named_logger("video_stream")
 VLC_SHELL_PATH = 'static/vlc/stream.sh'
+# Time given to encoder to exit on its own before being killed
+ENCODER_EXIT_TIMEOUT_SECONDS = 5
 
 
 @dataclass
@@ -88,15 +93,149 @@ class VLCStreamConfig(VideoStreamConfig):
         return ManagedURL.build(f"http://localhost:{self.port}/webcam.ogg")
 
 
+class VideoPipeCodec(Enum):
+    """Codec and container produced by piped encoder"""
+    theora = "theora"
+    vp8 = "vp8"
+    mjpeg = "mjpeg"
+
+    def ffmpeg_args(self) -> List[str]:
+        if self == VideoPipeCodec.theora:
+            return ["-c:v", "libtheora", "-f", "ogg"]
+        elif self == VideoPipeCodec.vp8:
+            return ["-c:v", "libvpx", "-deadline", "realtime", "-f", "webm"]
+        return ["-c:v", "mjpeg", "-f", "mpjpeg"]
+
+
+@dataclass
+class PipeStreamConfig(VideoStreamConfig):
+    """Encoder writing the stream to its standard output, read by agent directly"""
+    encoder: str
+    video_device: ExistingFilePath
+    video_width: int
+    video_height: int
+    codec: VideoPipeCodec
+    bitrate: int
+    fps: int
+
+    @staticmethod
+    def build(
+        encoder: Optional[str],
+        video_device: ExistingFilePath,
+        video_width: int,
+        video_height: int,
+        codec: Optional[VideoPipeCodec],
+        bitrate: Optional[int],
+        fps: Optional[int]
+    ):
+        return PipeStreamConfig(
+            encoder if encoder is not None else "ffmpeg",
+            video_device,
+            video_width,
+            video_height,
+            codec if codec is not None else VideoPipeCodec.theora,
+            bitrate if bitrate is not None else 1000,
+            fps if fps is not None else 15,
+        )
+
+    def encoder_args(self) -> List[str]:
+        return [
+            self.encoder,
+            "-loglevel", "error",
+            "-nostats",
+            "-progress", "pipe:2",
+            "-f", "v4l2",
+            "-framerate", str(self.fps),
+            "-video_size", f"{self.video_width}x{self.video_height}",
+            "-i", self.video_device.value,
+            "-b:v", f"{self.bitrate}k",
+            *self.codec.ffmpeg_args(),
+            "pipe:1"
+        ]
+
+    def to_url(self) -> Result[ManagedURL, ManagedURLBuildError]:
+        return Err(ManagedURLBuildError("pipe:1", Exception("Piped stream is read from encoder output")))
+
+
+@dataclass
+class EncoderStats:
+    """Progress reported by piped encoder"""
+    frames: int = 0
+    fps: float = 0.0
+    dropped_frames: int = 0
+    duplicated_frames: int = 0
+
+    def update(self, key: str, value: str):
+        """Record a key=value progress report, unknown keys and malformed values are ignored"""
+        try:
+            if key == "frame":
+                self.frames = int(value)
+            elif key == "fps":
+                self.fps = float(value)
+            elif key == "drop_frames":
+                self.dropped_frames = int(value)
+            elif key == "dup_frames":
+                self.duplicated_frames = int(value)
+        except ValueError:
+            pass
+
+
+@dataclass(frozen=True)
+class VideoRelayConfig:
+    """Configurations for relaying stream bytes directly to the outgoing queue"""
+    max_chunk_bytes: int
+    max_in_flight_bytes: int
+
+
 @dataclass
 class ManagedVideoStream:
     config: VideoStreamConfig
     process: Optional[Popen]
-    session: ClientSession
-    connection: ClientResponse
+    session: Optional[ClientSession]
+    connection: Optional[ClientResponse]
+    pipe: Optional[Process] = None
+    encoder_stats: EncoderStats = field(default_factory=EncoderStats)
+    progress_task: Optional[Task] = None
+
+    @staticmethod
+    async def spawn_pipe_stream(config: PipeStreamConfig) -> Result['ManagedVideoStream', DIPClientError]:
+        try:
+            arguments = config.encoder_args()
+            LOGGER.debug("Running command: %s", arguments)
+            pipe = await asyncio.create_subprocess_exec(
+                *arguments,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE)
+        except Exception as e:
+            return Err(GenericClientError(f"Failed to start video encoder, reason: {e}"))
+        stream = ManagedVideoStream(config, None, None, None, pipe)
+        stream.progress_task = asyncio.create_task(stream.track_encoder_progress())
+        return Ok(stream)
+
+    async def track_encoder_progress(self):
+        """Parse encoder key=value progress reports until it finishes"""
+        stats = self.encoder_stats
+        while True:
+            line = await self.pipe.stderr.readline()
+            if len(line) == 0:
+                return
+            key, _, value = line.decode("utf-8", errors="replace").strip().partition("=")
+            previous_dropped_frames = stats.dropped_frames
+            stats.update(key, value)
+            if stats.dropped_frames > previous_dropped_frames:
+                LOGGER.warning(f"Video encoder dropped {stats.dropped_frames - previous_dropped_frames} frames")
+            if key == "progress":
+                LOGGER.debug(f"Video encoder progress: {stats}")
+            elif key != "" and value == "":
+                LOGGER.error(f"Video encoder: {key}")
 
     @staticmethod
     async def spawn_stream(config: VideoStreamConfig) -> Result['ManagedVideoStream', DIPClientError]:
+        # Spawn piped encoder, which needs no HTTP connection
+        if isinstance(config, PipeStreamConfig):
+            return await ManagedVideoStream.spawn_pipe_stream(config)
+
         # Spawn process
         process = None
         if isinstance(config, VLCStreamConfig):
@@ -133,6 +272,8 @@ class ManagedVideoStream:
         return Ok(ManagedVideoStream(config, process, session, response))
 
     async def read_chunk(self) -> Result[bytes, DIPClientError]:
+        if self.pipe is not None:
+            return await self.read_available(65536)
         try:
             (bytes, is_last_chunk) = await self.connection.content.readchunk()
             if is_last_chunk:
@@ -141,6 +282,19 @@ class ManagedVideoStream:
         except Exception as e:
             return Err(GenericClientError(f"Video stream chunk read failed, reason: {e}"))
 
+    async def read_available(self, max_size: int) -> Result[bytes, DIPClientError]:
+        """Wait for stream bytes, return all buffered bytes up to max_size"""
+        try:
+            if self.pipe is not None:
+                received_bytes = await self.pipe.stdout.read(max_size)
+            else:
+                received_bytes = await self.connection.content.read(max_size)
+            if len(received_bytes) == 0:
+                return Err(GenericClientError("End of video stream"))
+            return Ok(received_bytes)
+        except Exception as e:
+            return Err(GenericClientError(f"Video stream chunk read failed, reason: {e}"))
+
     async def end(self):
         try:
             if self.connection is not None:
@@ -149,5 +303,21 @@ class ManagedVideoStream:
                 await self.session.close()
             if self.process is not None:
                 self.process.terminate()
+            if self.progress_task is not None:
+                self.progress_task.cancel()
+            if self.pipe is not None:
+                await self.end_pipe(self.pipe)
         except Exception as e:
-            LOGGER.error(f"Failed to stop managed video stream, reason: {e}")
\ No newline at end of file
+            LOGGER.error(f"Failed to stop managed video stream, reason: {e}")
+
+    async def end_pipe(self, pipe: Process):
+        """Terminate encoder and reap it, kill it if it doesn't exit in time"""
+        if pipe.returncode is None:
+            pipe.terminate()
+        try:
+            await asyncio.wait_for(pipe.wait(), ENCODER_EXIT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            LOGGER.warning("Video encoder didn't exit in time, killing it")
+            pipe.kill()
+            await pipe.wait()
+        LOGGER.info(f"Video encoder finished, {self.encoder_stats}")
\ No newline at end of file
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Module to test piped video stream utilities"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+from src.domain.existing_file_path import ExistingFilePath
+from src.service.managed_video_stream import PipeStreamConfig, VideoPipeCodec, ManagedVideoStream, EncoderStats
+
+
+class TestPipeStreamConfig(unittest.TestCase):
+    """Test suite for piped encoder configuration"""
+
+    def test_ffmpeg_args(self):
+        """Check that each codec selects matching encoder and container"""
+        self.assertEqual(VideoPipeCodec.theora.ffmpeg_args(), ["-c:v", "libtheora", "-f", "ogg"])
+        self.assertEqual(
+            VideoPipeCodec.vp8.ffmpeg_args(), ["-c:v", "libvpx", "-deadline", "realtime", "-f", "webm"])
+        self.assertEqual(VideoPipeCodec.mjpeg.ffmpeg_args(), ["-c:v", "mjpeg", "-f", "mpjpeg"])
+
+    def test_encoder_args(self):
+        """Check that defaults produce an Ogg stream, which is what the server serves"""
+        config = PipeStreamConfig.build(None, ExistingFilePath("/dev/video0"), 640, 480, None, None, None)
+        self.assertEqual(config.codec, VideoPipeCodec.theora)
+        self.assertEqual(config.encoder_args(), [
+            "ffmpeg", "-loglevel", "error", "-nostats", "-progress", "pipe:2",
+            "-f", "v4l2", "-framerate", "15", "-video_size", "640x480", "-i", "/dev/video0",
+            "-b:v", "1000k", "-c:v", "libtheora", "-f", "ogg", "pipe:1"])
+
+
+class TestManagedVideoStream(IsolatedAsyncioTestCase):
+    """Test suite for piped encoder process management"""
+
+    async def test_track_encoder_progress(self):
+        """Check that encoder fps and dropped frames are parsed from progress reports"""
+        stderr = asyncio.StreamReader()
+        stderr.feed_data(b"frame=30\nfps=14.5\ndrop_frames=2\ndup_frames=1\nprogress=continue\n")
+        stderr.feed_data(b"frame=oops\ndrop_frames=5\nunknown=1\nprogress=end\n")
+        stderr.feed_eof()
+        stream = ManagedVideoStream(None, None, None, None, SimpleNamespace(stderr=stderr))
+
+        await stream.track_encoder_progress()
+        self.assertEqual(stream.encoder_stats, EncoderStats(frames=30, fps=14.5, dropped_frames=5, duplicated_frames=1))
+
+    async def test_end(self):
+        """Check that ended encoder is reaped, and killed if it ignores termination"""
+        for command in ["exec sleep 10", "trap '' TERM; exec sleep 10"]:
+            pipe = await asyncio.create_subprocess_exec("sh", "-c", command)
+            stream = ManagedVideoStream(None, None, None, None, pipe)
+            stream.progress_task = asyncio.create_task(asyncio.sleep(10))
+            with patch("src.service.managed_video_stream.ENCODER_EXIT_TIMEOUT_SECONDS", 0.2):
+                await stream.end()
+            self.assertIsNotNone(pipe.returncode)
+            await asyncio.sleep(0)
+            self.assertTrue(stream.progress_task.cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
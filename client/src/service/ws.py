@@ -1,5 +1,6 @@
 """Typed, auto-coded websocket client definition"""
 
+import logging
 from pprint import pformat
 from typing import TypeVar, Generic, Any, Optional, Union
 import websockets.client
@@ -88,7 +89,8 @@ class WebSocket(SocketInterface[PI, PO]):
             return Err(Exception("Not connected"))
         try:
             data: Union[str, bytes] = await self.socket.recv()
-            LOGGER.debug("Received raw message: %s", pformat(data, indent=4))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Received raw message: %s", pformat(data, indent=4))
             # This returns CodecParseException, which mypy doesn't recognize
             # as a type of Exception, which is weird, but lets suppress this
             return self.decoder.decode(data)  # type: ignore
@@ -103,12 +105,14 @@ class WebSocket(SocketInterface[PI, PO]):
         if not self.connected():
             return Exception("Not connected")
         try:
-            LOGGER.debug("Sending domain message: %s", pformat(data, indent=4))
             message: Union[str, bytes] = self.encoder.encode(data)
-            if isinstance(data, SensitiveMessage):
-                LOGGER.debug("Sending raw sensitive message: <redacted>")
-            else:
-                LOGGER.debug("Sending raw message: %s", pformat(message, indent=4))
+            # Formatting large (e.g. video) messages is costly, only do it when logged
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Sending domain message: %s", pformat(data, indent=4))
+                if isinstance(data, SensitiveMessage):
+                    LOGGER.debug("Sending raw sensitive message: <redacted>")
+                else:
+                    LOGGER.debug("Sending raw message: %s", pformat(message, indent=4))
             await self.socket.send(message)
             return None
         except Exception as e: